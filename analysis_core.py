@@ -0,0 +1,2457 @@
+"""Headless EuroMillions statistics, number generators and bias tests.
+
+AnalysisCore works on a DrawStore and returns the same text reports the
+GUI shows, without tkinter, so analyses can run on servers, in scheduled
+jobs and in parallel. Run any of them, or all, over a cached dataset:
+
+    python -m analysis_core --list
+    python -m analysis_core chi_square temporal_bias
+    python -m analysis_core all --output-dir reports --jobs 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from analytics_context import AnalyticsContext, memoized
+from autocorrelation import DEFAULT_MAX_LAG, autocorrelation
+from combinadic import decode_tickets, encode_tickets
+from draw_cache import DrawCache
+from draw_repository import SQLiteDrawRepository
+from draw_store import DrawStore, counter_from_counts
+from match_kernel import PRIZE_TIERS, PRIZE_NAMES, PRIZE_POINTS, prize_tiers
+from null_distributions import SIMULATIONS, NullDistributions, history_statistics, p_value
+from report import Report
+from strategies import (StrategyStats, balanced_sampler, balanced_ticket, hot_ticket, pattern_ticket,
+                        overdue_ticket, hybrid_ticket, frequency_ticket, recency_ticket, due_ticket)
+from task_runner import checkpoint
+
+# Report name -> (title, AnalysisCore method), in the order the GUI shows them
+REPORTS = {
+    'frequency': ("Most/Least Drawn", 'frequency_report'),
+    'overdue': ("Overdue Numbers", 'overdue_report'),
+    'patterns': ("Patterns", 'pattern_report'),
+    'smart_numbers': ("Smart Number Generation", 'smart_numbers_report'),
+    'saved_sets': ("Saved Number Sets", 'saved_sets_report'),
+    'your_numbers': ("Your Numbers", 'user_numbers_report'),
+    'historical_winners': ("Historical Winners", 'historical_winners_report'),
+    'jackpot_winners': ("Jackpot Winners", 'jackpot_winners_report'),
+    'top_prize_winners': ("Top 3 Prize Levels", 'top_prize_winners_report'),
+    'duplicate_jackpots': ("Duplicate Jackpots", 'duplicate_jackpots_report'),
+    'chi_square': ("Chi-Square Test", 'chi_square_report'),
+    'coefficient_variation': ("Coefficient of Variation", 'coefficient_variation_report'),
+    'temporal_bias': ("Temporal Bias", 'temporal_bias_report'),
+    'autocorrelation': ("Autocorrelation", 'autocorrelation_report'),
+    'ball_wear': ("Ball Wear Analysis", 'ball_wear_report'),
+    'machine_bias': ("Machine Bias", 'machine_bias_report'),
+    'seasonal_effects': ("Seasonal Effects", 'seasonal_effects_report'),
+    'anomalies': ("Anomaly Detection", 'anomalies_report'),
+}
+
+# Reports judged against the simulated null distributions
+NULL_TESTED_REPORTS = ('chi_square', 'coefficient_variation', 'temporal_bias', 'machine_bias', 'anomalies')
+# Family-wise level at which the anomaly report flags a category
+ANOMALY_SIGNIFICANCE = 0.05
+
+
+def load_store(path):
+    """Draw history from a binary cache file, or a SQLite database for .sqlite3/.db paths"""
+    if path.endswith(('.sqlite3', '.db')):
+        return SQLiteDrawRepository(path).load()
+    return DrawCache(path).load()
+
+
+def load_saved_numbers(path):
+    """Saved number sets as written by the GUI, {} if there are none"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class AnalysisCore:
+    """Statistics, number generators and bias tests over one draw history.
+
+    Every *_report method returns the Report shown by the matching GUI
+    tab or button. ``store`` can be replaced at any time; derived statistics are
+    memoized per store version in ``analytics``. Bias tests are judged
+    against fair histories of the same length simulated by ``nulls``.
+    """
+
+    def __init__(self, store=None, nulls=None):
+        self.store = store if store is not None else DrawStore()
+        self.analytics = AnalyticsContext(lambda: self.store)
+        self.nulls = nulls if nulls is not None else NullDistributions()
+
+    def report(self, name, saved_numbers=None, ticket=None):
+        """Report ``name``; saved_sets needs ``saved_numbers``, your_numbers a (mains, stars) ``ticket``"""
+        method = getattr(self, REPORTS[name][1])
+        if name == 'saved_sets':
+            return method(saved_numbers or {})
+        if name == 'your_numbers':
+            return method(*ticket)
+        return method()
+    
+    def frequency_report(self):
+        main_counter = self.analytics.main_counter()
+        stars_counter = self.analytics.star_counter()
+        
+        text = Report("MAIN NUMBERS FREQUENCY\n")
+        text += "=" * 50 + "\n\n"
+        
+        text += "MOST DRAWN MAIN NUMBERS:\n"
+        most_drawn_main = main_counter.most_common(10)
+        for number, count in most_drawn_main:
+            text += "Number {:2d}: {:3d} times\n".format(number, count)
+        
+        text += "\nLEAST DRAWN MAIN NUMBERS:\n"
+        least_drawn_main = main_counter.most_common()[:-11:-1]
+        for number, count in least_drawn_main:
+            text += "Number {:2d}: {:3d} times\n".format(number, count)
+        
+        text += "\n" + "=" * 50 + "\n"
+        text += "LUCKY STARS FREQUENCY\n"
+        text += "=" * 50 + "\n\n"
+        
+        text += "MOST DRAWN LUCKY STARS:\n"
+        most_drawn_stars = stars_counter.most_common(6)
+        for number, count in most_drawn_stars:
+            text += "Star {:2d}: {:3d} times\n".format(number, count)
+        
+        text += "\nLEAST DRAWN LUCKY STARS:\n"
+        least_drawn_stars = stars_counter.most_common()[:-7:-1]
+        for number, count in least_drawn_stars:
+            text += "Star {:2d}: {:3d} times\n".format(number, count)
+        
+        return text
+    
+    def overdue_report(self):
+        # Calculate days since last appearance for each number
+        latest_date = int(self.store.dates[-1])
+        main_last_seen = self.analytics.last_seen('main')
+        stars_last_seen = self.analytics.last_seen('star')
+        
+        main_overdue = {}
+        stars_overdue = {}
+        for i in range(1, 51):
+            seen = int(main_last_seen[i])
+            main_overdue[i] = latest_date - seen if seen >= 0 else float('inf')
+        for i in range(1, 13):
+            seen = int(stars_last_seen[i])
+            stars_overdue[i] = latest_date - seen if seen >= 0 else float('inf')
+        
+        text = Report("LONGEST OVERDUE NUMBERS\n")
+        text += "=" * 50 + "\n\n"
+        
+        text += "MOST OVERDUE MAIN NUMBERS:\n"
+        sorted_main_overdue = sorted(main_overdue.items(), key=lambda x: x[1], reverse=True)[:15]
+        for number, days in sorted_main_overdue:
+            if days == float('inf'):
+                text += "Number {:2d}: Never drawn\n".format(number)
+            else:
+                text += "Number {:2d}: {:3d} days ago\n".format(number, days)
+        
+        text += "\nMOST OVERDUE LUCKY STARS:\n"
+        sorted_stars_overdue = sorted(stars_overdue.items(), key=lambda x: x[1], reverse=True)[:8]
+        for number, days in sorted_stars_overdue:
+            if days == float('inf'):
+                text += "Star {:2d}: Never drawn\n".format(number)
+            else:
+                text += "Star {:2d}: {:3d} days ago\n".format(number, days)
+        
+        return text
+    
+    def pattern_report(self):
+        text = Report("ADVANCED PATTERN ANALYSIS\n")
+        text += "=" * 50 + "\n\n"
+        
+        # Hot/Cold Streaks
+        text += "HOT/COLD STREAKS (Last 20 draws):\n"
+        text += "-" * 30 + "\n"
+        hot_cold = self.analyze_hot_cold_streaks()
+        text += "Hot Numbers (appearing frequently): {}\n".format(', '.join(map(str, hot_cold['hot'])))
+        text += "Cold Numbers (avoiding draws): {}\n\n".format(', '.join(map(str, hot_cold['cold'])))
+        
+        # Sum Analysis
+        text += "SUM RANGE ANALYSIS:\n"
+        text += "-" * 20 + "\n"
+        sum_stats = self.analyze_sum_ranges()
+        text += "Most common sum range: {} - {} ({}% of draws)\n".format(
+            sum_stats['most_common_range'][0], sum_stats['most_common_range'][1], 
+            sum_stats['most_common_percentage'])
+        text += "Average sum: {:.1f}\n".format(sum_stats['average'])
+        text += "Recommended sum range: {} - {}\n\n".format(
+            sum_stats['recommended_min'], sum_stats['recommended_max'])
+        
+        # Odd/Even Patterns
+        text += "ODD/EVEN PATTERNS:\n"
+        text += "-" * 18 + "\n"
+        odd_even = self.analyze_odd_even_patterns()
+        text += "Most common odd/even ratio: {} odd, {} even ({}% of draws)\n".format(
+            odd_even['most_common'][0], odd_even['most_common'][1], odd_even['percentage'])
+        
+        # Number Pairs
+        text += "\nTOP NUMBER PAIRS:\n"
+        text += "-" * 17 + "\n"
+        pairs = self.analyze_number_pairs()
+        for i, (pair, count) in enumerate(pairs[:10]):
+            text += "{}. {} & {}: {} times\n".format(i+1, pair[0], pair[1], count)
+        
+        # Consecutive Numbers
+        text += "\nCONSECUTIVE NUMBERS:\n"
+        text += "-" * 19 + "\n"
+        consecutive_stats = self.analyze_consecutive_numbers()
+        text += "Draws with consecutive numbers: {}% ({} draws)\n".format(
+            consecutive_stats['percentage'], consecutive_stats['count'])
+        text += "Most common consecutive pairs: {}\n".format(
+            ', '.join(['{}-{}'.format(p[0], p[1]) for p in consecutive_stats['top_pairs'][:5]]))
+        
+        return text
+    
+    @memoized('hot_cold_streaks')
+    def analyze_hot_cold_streaks(self):
+        recent = self.store.rolling_windows().window(20)
+        number_count = recent['main_counts']
+        avg_frequency = recent['draws'] * 5 / 50  # Average appearances per number
+        
+        hot_numbers = [num for num in range(1, 51) if number_count[num] > avg_frequency * 1.5]
+        cold_numbers = [num for num in range(1, 51) if number_count[num] < avg_frequency * 0.5]
+        
+        return {
+            'hot': sorted(hot_numbers)[:8],
+            'cold': sorted(cold_numbers)[:8]
+        }
+    
+    @memoized('sum_ranges')
+    def analyze_sum_ranges(self):
+        sums = self.analytics.sums()
+        average = int(sums.sum()) / len(sums)
+        
+        # Group into ranges of ten
+        ranges = np.bincount(sums // 10)
+        most_common_range_start = int(np.argmax(ranges)) * 10
+        most_common_percentage = round(int(ranges.max()) / len(sums) * 100, 1)
+        
+        return {
+            'average': average,
+            'most_common_range': (most_common_range_start, most_common_range_start + 9),
+            'most_common_percentage': most_common_percentage,
+            'recommended_min': int(average - 25),
+            'recommended_max': int(average + 25)
+        }
+    
+    @memoized('odd_even_patterns')
+    def analyze_odd_even_patterns(self):
+        pattern_counts = np.bincount(self.analytics.odd_counts(), minlength=6)
+        odd_count = int(np.argmax(pattern_counts))
+        percentage = round(int(pattern_counts[odd_count]) / len(self.store) * 100, 1)
+        
+        return {
+            'most_common': (odd_count, 5 - odd_count),
+            'percentage': percentage
+        }
+    
+    @memoized('number_pairs')
+    def analyze_number_pairs(self):
+        # Read from the co-occurrence matrix kept with the store, so tickets don't recount the history
+        return self.store.pair_matrix().top_pairs('main', 15)
+    
+    @memoized('consecutive_numbers')
+    def analyze_consecutive_numbers(self):
+        sorted_mains = self.store.sorted_mains().astype(np.int64)
+        is_consecutive = np.diff(sorted_mains, axis=1) == 1
+        
+        consecutive_count = int(is_consecutive.any(axis=1).sum())
+        pair_starts = np.bincount(sorted_mains[:, :-1][is_consecutive], minlength=51)
+        consecutive_pairs = Counter({(num, num + 1): int(count) for num, count in enumerate(pair_starts.tolist()) if count})
+        
+        percentage = round(consecutive_count / len(self.store) * 100, 1)
+        
+        return {
+            'count': consecutive_count,
+            'percentage': percentage,
+            'top_pairs': consecutive_pairs.most_common(10)
+        }
+    
+    @memoized('observed_statistics')
+    def observed_statistics(self):
+        """{test: value} of every null-tested statistic on the real history"""
+        stats = history_statistics(self.store.mains[None], self.store.stars[None])
+        return {test: float(values[0]) for test, values in stats.items()}
+    
+    def null_distribution(self, test):
+        """Sorted values of ``test`` over simulated fair histories as long as this one"""
+        return self.nulls.distribution(test, len(self.store), progress=lambda done, total: checkpoint(
+            0.2 * done / total, "Simulating fair histories"))
+    
+    def null_test(self, test, tail='upper'):
+        """(observed value, empirical p-value) of ``test`` against simulated fair histories"""
+        observed = self.observed_statistics()[test]
+        return observed, p_value(self.null_distribution(test), observed, tail)
+    
+    def smart_numbers_report(self):
+        text = Report("SMART NUMBER GENERATION\n")
+        text += "=" * 50 + "\n\n"
+        
+        # Generate a ticket with each strategy
+        strategies = [
+            ("Balanced Strategy", self.generate_balanced_ticket),
+            ("Hot Numbers Strategy", self.generate_hot_ticket),
+            ("Pattern-Based Strategy", self.generate_pattern_ticket),
+            ("Overdue Strategy", self.generate_overdue_ticket),
+            ("Hybrid Strategy", self.generate_hybrid_ticket),
+            ("Frequency-Weighted Strategy", self.generate_frequency_ticket),
+            ("Recency-Weighted Strategy", self.generate_recency_ticket),
+            ("Due-Weighted Strategy", self.generate_due_ticket)
+        ]
+        
+        for strategy_name, generator_func in strategies:
+            main_nums, stars = generator_func()
+            text += "{}: \n".format(strategy_name)
+            text += "Main: {} | Stars: {}\n".format(
+                ', '.join(['{:2d}'.format(n) for n in sorted(main_nums)]),
+                ', '.join(['{:2d}'.format(s) for s in sorted(stars)])
+            )
+            text += "Sum: {} | Odd/Even: {}/{}\n\n".format(
+                sum(main_nums),
+                sum(1 for n in main_nums if n % 2 == 1),
+                sum(1 for n in main_nums if n % 2 == 0)
+            )
+        
+        sampler = balanced_sampler(*self.strategy_stats().sum_range())
+        text += "Balanced tickets are drawn uniformly from {:,} combinations\n".format(sampler.count)
+        text += "(sum {}-{}, 2-3 odd, one number per decade)\n".format(*sampler.sums)
+        
+        return text
+    
+    @memoized('strategy_stats')
+    def strategy_stats(self):
+        """Inputs of the smart-number strategies over the whole history"""
+        return StrategyStats(self.store.dates, self.store.mains, self.store.stars)
+    
+    def generate_balanced_ticket(self):
+        return balanced_ticket(self.strategy_stats(), random)
+    
+    def generate_hot_ticket(self):
+        return hot_ticket(self.strategy_stats(), random)
+    
+    def generate_pattern_ticket(self):
+        return pattern_ticket(self.strategy_stats(), random)
+    
+    def generate_overdue_ticket(self):
+        return overdue_ticket(self.strategy_stats(), random)
+    
+    def generate_hybrid_ticket(self):
+        return hybrid_ticket(self.strategy_stats(), random)
+    
+    def generate_frequency_ticket(self):
+        return frequency_ticket(self.strategy_stats(), random)
+    
+    def generate_recency_ticket(self):
+        return recency_ticket(self.strategy_stats(), random)
+    
+    def generate_due_ticket(self):
+        return due_ticket(self.strategy_stats(), random)
+    
+    def saved_sets_report(self, saved_numbers):
+        text = Report("ANALYSIS OF ALL SAVED NUMBER SETS\n")
+        text += "=" * 60 + "\n\n"
+        
+        # Define win values for sorting
+        win_values = {
+            (5, 2): ("Jackpot", 52),
+            (5, 1): ("2nd Prize", 51), 
+            (5, 0): ("3rd Prize", 50),
+            (4, 2): ("4th Prize", 42),
+            (4, 1): ("5th Prize", 41),
+            (4, 0): ("6th Prize", 40),
+            (3, 2): ("7th Prize", 32),
+            (2, 2): ("8th Prize", 22),
+            (3, 1): ("9th Prize", 31),
+            (3, 0): ("10th Prize", 30),
+            (1, 2): ("11th Prize", 12),
+            (2, 1): ("12th Prize", 21),
+            (2, 0): ("13th Prize", 20)
+        }
+        
+        # Analyze each set
+        set_analysis = []
+        main_counter = self.analytics.main_counter()
+        stars_counter = self.analytics.star_counter()
+        kernel = self.store.match_kernel()
+        
+        for name, data in saved_numbers.items():
+            main_nums = data['main_numbers']
+            stars = data['lucky_stars']
+            
+            # Calculate wins for this set, visiting only the winning draws
+            wins = []
+            all_main_matches, all_star_matches = kernel.match_counts(main_nums, stars)
+            for index in np.flatnonzero(prize_tiers(all_main_matches, all_star_matches) >= 0).tolist():
+                main_matches = int(all_main_matches[index])
+                star_matches = int(all_star_matches[index])
+                prize_info = win_values[(main_matches, star_matches)]
+                wins.append({
+                    'date': self.store.date_at(index),
+                    'main_matches': main_matches,
+                    'star_matches': star_matches,
+                    'prize_level': prize_info[0],
+                    'sort_value': prize_info[1]
+                })
+            
+            # Calculate statistics
+            total_wins = len(wins)
+            highest_win_value = max([w['sort_value'] for w in wins]) if wins else 0
+            highest_win_name = next((w['prize_level'] for w in wins if w['sort_value'] == highest_win_value), "None")
+            
+            set_analysis.append({
+                'name': name,
+                'data': data,
+                'total_wins': total_wins,
+                'highest_win_value': highest_win_value,
+                'highest_win_name': highest_win_name,
+                'wins': wins
+            })
+        
+        # Sort sets by most wins, then by highest win value
+        set_analysis.sort(key=lambda x: (x['total_wins'], x['highest_win_value']), reverse=True)
+        
+        # Display top performing sets
+        text += "TOP PERFORMING SETS (Most Wins):\n"
+        text += "=" * 40 + "\n"
+        for i, analysis in enumerate(set_analysis[:5]):
+            text += "{}. {} - {} wins (Best: {})\n".format(
+                i+1, analysis['name'], analysis['total_wins'], analysis['highest_win_name']
+            )
+        text += "\n"
+        
+        # Sort by highest win value, then by total wins
+        set_analysis_by_value = sorted(set_analysis, key=lambda x: (x['highest_win_value'], x['total_wins']), reverse=True)
+        
+        text += "HIGHEST VALUE WINS:\n"
+        text += "=" * 20 + "\n"
+        for i, analysis in enumerate(set_analysis_by_value[:5]):
+            if analysis['highest_win_value'] > 0:
+                text += "{}. {} - {} (Total wins: {})\n".format(
+                    i+1, analysis['name'], analysis['highest_win_name'], analysis['total_wins']
+                )
+        text += "\n"
+        
+        # Detailed analysis for each set
+        text += "DETAILED ANALYSIS:\n"
+        text += "=" * 20 + "\n"
+        
+        for analysis in set_analysis:
+            name = analysis['name']
+            data = analysis['data']
+            main_nums = data['main_numbers']
+            stars = data['lucky_stars']
+            wins = analysis['wins']
+            
+            text += "{}:\n".format(name.upper())
+            text += "Numbers: {} | Stars: {}\n".format(
+                ', '.join(['{:2d}'.format(n) for n in main_nums]),
+                ', '.join(['{:2d}'.format(s) for s in stars])
+            )
+            
+            # Quick frequency analysis
+            avg_main_freq = sum(main_counter[n] for n in main_nums) / 5
+            avg_stars_freq = sum(stars_counter[s] for s in stars) / 2
+            
+            text += "Avg frequency: Main {:.1f}, Stars {:.1f}\n".format(avg_main_freq, avg_stars_freq)
+            
+            # Sum and odd/even
+            total_sum = sum(main_nums)
+            odd_count = sum(1 for n in main_nums if n % 2 == 1)
+            
+            text += "Sum: {} | Odd/Even: {}/{}\n".format(total_sum, odd_count, 5 - odd_count)
+            
+            # Win details
+            text += "Prize wins: {} | Highest: {}\n".format(
+                analysis['total_wins'], analysis['highest_win_name']
+            )
+            
+            # Show recent wins (last 3)
+            if wins:
+                recent_wins = sorted(wins, key=lambda x: x['date'], reverse=True)[:3]
+                text += "Recent wins: "
+                win_strings = []
+                for win in recent_wins:
+                    win_strings.append("{} ({})".format(
+                        win['prize_level'], win['date'].strftime('%Y-%m-%d')
+                    ))
+                text += ", ".join(win_strings) + "\n"
+            
+            text += "-" * 50 + "\n\n"
+        
+        # Summary statistics
+        text += "SUMMARY:\n"
+        text += "Total saved sets: {}\n".format(len(saved_numbers))
+        
+        # Most common numbers across all sets
+        all_saved_mains = []
+        all_saved_stars = []
+        for data in saved_numbers.values():
+            all_saved_mains.extend(data['main_numbers'])
+            all_saved_stars.extend(data['lucky_stars'])
+        
+        if all_saved_mains:
+            saved_main_counter = Counter(all_saved_mains)
+            saved_stars_counter = Counter(all_saved_stars)
+            
+            text += "Most used main numbers: {}\n".format(
+                ', '.join([str(n) for n, c in saved_main_counter.most_common(10)])
+            )
+            text += "Most used lucky stars: {}\n".format(
+                ', '.join([str(s) for s, c in saved_stars_counter.most_common(6)])
+            )
+        
+        # Overall win statistics
+        total_wins_all_sets = sum(analysis['total_wins'] for analysis in set_analysis)
+        if total_wins_all_sets > 0:
+            text += "Total wins across all sets: {}\n".format(total_wins_all_sets)
+            avg_wins_per_set = total_wins_all_sets / len(set_analysis)
+            text += "Average wins per set: {:.1f}\n".format(avg_wins_per_set)
+        
+        return text
+    
+    def user_numbers_report(self, user_main, user_stars):
+        main_counter = self.analytics.main_counter()
+        stars_counter = self.analytics.star_counter()
+        
+        text = Report("ANALYSIS FOR YOUR NUMBERS\n")
+        text += "Main: {}\n".format(', '.join(map(str, user_main)))
+        text += "Stars: {}\n".format(', '.join(map(str, user_stars)))
+        text += "=" * 50 + "\n\n"
+        
+        # Frequency analysis
+        text += "FREQUENCY ANALYSIS:\n"
+        text += "-" * 20 + "\n"
+        text += "Main Numbers:\n"
+        for num in user_main:
+            count = main_counter[num]
+            text += "  Number {:2d}: drawn {:3d} times\n".format(num, count)
+        
+        text += "\nLucky Stars:\n"
+        for star in user_stars:
+            count = stars_counter[star]
+            text += "  Star {:2d}: drawn {:3d} times\n".format(star, count)
+        
+        # Last appearance analysis
+        text += "\nLAST APPEARANCE:\n"
+        text += "-" * 20 + "\n"
+        latest_date = self.store.last_date()
+        main_last_seen = self.analytics.last_seen('main')
+        stars_last_seen = self.analytics.last_seen('star')
+        
+        text += "Main Numbers:\n"
+        for num in user_main:
+            last_seen = datetime.fromordinal(int(main_last_seen[num])) if main_last_seen[num] >= 0 else None
+            
+            if last_seen:
+                days_ago = (latest_date - last_seen).days
+                text += "  Number {:2d}: {} ({} days ago)\n".format(num, last_seen.strftime('%Y-%m-%d'), days_ago)
+            else:
+                text += "  Number {:2d}: Never drawn\n".format(num)
+        
+        text += "\nLucky Stars:\n"
+        for star in user_stars:
+            last_seen = datetime.fromordinal(int(stars_last_seen[star])) if stars_last_seen[star] >= 0 else None
+            
+            if last_seen:
+                days_ago = (latest_date - last_seen).days
+                text += "  Star {:2d}: {} ({} days ago)\n".format(star, last_seen.strftime('%Y-%m-%d'), days_ago)
+            else:
+                text += "  Star {:2d}: Never drawn\n".format(star)
+        
+        # Historical wins
+        text += "\nHISTORICAL WINS:\n"
+        text += "-" * 20 + "\n"
+        
+        all_main_matches, all_star_matches = self.store.match_counts(user_main, user_stars)
+        # Only count actual prize wins (2+ main or 1+ main with 1+ star)
+        all_tiers = prize_tiers(all_main_matches, all_star_matches)
+        wins = np.flatnonzero(all_tiers >= 0)
+        
+        if len(wins):
+            # Sort by matches (highest first), then by date (most recent first)
+            sort_value = all_main_matches[wins].astype(np.int64) * 10 + all_star_matches[wins]
+            wins = wins[np.lexsort((-wins, self.store.dates[wins], sort_value))[::-1]]
+            text += "Found {} historical prize wins:\n\n".format(len(wins))
+            
+            # One row per win; draws are looked up and formatted only when shown
+            store = self.store
+            
+            def win_row(i):
+                index = int(wins[i])
+                draw_date, draw_mains, draw_stars = store.draw_at(index)
+                return "{}: {} ({} main + {} stars) ({} | {})".format(
+                    draw_date.strftime('%Y-%m-%d'),
+                    PRIZE_NAMES[all_tiers[index]],
+                    all_main_matches[index],
+                    all_star_matches[index],
+                    ', '.join(map(str, draw_mains)),
+                    ', '.join(map(str, draw_stars))
+                )
+            text.add_rows(len(wins), win_row)
+        else:
+            text += "No historical prize wins found with these numbers.\n"
+        
+        return text
+    
+    def historical_winners_report(self):
+        text = Report("HISTORICAL WINNING COMBINATIONS ANALYSIS\n")
+        text += "=" * 60 + "\n\n"
+        
+        # Define prize structure
+        prize_levels = {tier: (name, points) for tier, name, points in zip(PRIZE_TIERS, PRIZE_NAMES, PRIZE_POINTS)}
+        
+        # Analyze all combinations that would have won prizes if played consistently
+        combination_analysis = {}
+        
+        text += "Analyzing {} historical draws for winning patterns...\n\n".format(len(self.store))
+        
+        # For computational efficiency, we'll analyze a sample of popular number combinations
+        # and check how they would have performed historically
+        
+        # Generate test combinations based on most frequent numbers
+        main_counter = self.analytics.main_counter()
+        stars_counter = self.analytics.star_counter()
+        
+        most_frequent_mains = [num for num, count in main_counter.most_common(20)]
+        most_frequent_stars = [star for star, count in stars_counter.most_common(8)]
+        
+        # Test various combinations
+        test_combinations = []
+        
+        # Top frequency combinations
+        from itertools import combinations
+        for main_combo in combinations(most_frequent_mains[:15], 5):
+            for star_combo in combinations(most_frequent_stars[:6], 2):
+                test_combinations.append((sorted(main_combo), sorted(star_combo)))
+        
+        # Add some balanced combinations (mix of frequent and less frequent)
+        less_frequent_mains = [num for num, count in main_counter.most_common()[-20:]]
+        for main_combo in combinations(most_frequent_mains[:10] + less_frequent_mains[:10], 5):
+            for star_combo in combinations(most_frequent_stars[:4] + [star for star, count in stars_counter.most_common()[-4:]], 2):
+                test_combinations.append((sorted(main_combo), sorted(star_combo)))
+                if len(test_combinations) >= 1000:  # Limit for performance
+                    break
+            if len(test_combinations) >= 1000:
+                break
+        
+        # Analyze each combination, matching all of them against the history at once
+        kernel = self.store.match_kernel()
+        tested_combinations = test_combinations[:500]  # Analyze top 500 combinations
+        tier_values = np.array([prize_levels[tier][1] for tier in PRIZE_TIERS])
+
+        for index, (main_nums, stars) in enumerate(tested_combinations):
+            if index % 50 == 0:
+                checkpoint(0.2 * index / len(tested_combinations), "Matching combinations")
+                chunk_tiers = prize_tiers(*kernel.match_many(tested_combinations[index:index + 50]))
+            tiers = chunk_tiers[index % 50]
+            won = tiers >= 0
+            total_wins = int(won.sum())
+            
+            if total_wins > 0:
+                tier_counts = np.bincount(tiers[won], minlength=len(PRIZE_TIERS))
+                total_value = int(tier_counts @ tier_values)
+                # Tiers run from the best prize down
+                highest_prize, highest_value = prize_levels[PRIZE_TIERS[int(np.flatnonzero(tier_counts)[0])]]
+                
+                combination_key = (tuple(main_nums), tuple(stars))
+                combination_analysis[combination_key] = {
+                    'total_wins': total_wins,
+                    'total_value': total_value,
+                    'highest_prize': highest_prize,
+                    'highest_value': highest_value,
+                    'win_indices': np.flatnonzero(won),
+                    'avg_value': total_value / total_wins if total_wins > 0 else 0
+                }
+        
+        # Sort by different criteria
+        by_total_value = sorted(combination_analysis.items(), key=lambda x: x[1]['total_value'], reverse=True)
+        by_total_wins = sorted(combination_analysis.items(), key=lambda x: x[1]['total_wins'], reverse=True)
+        by_highest_prize = sorted(combination_analysis.items(), key=lambda x: x[1]['highest_value'], reverse=True)
+        
+        # Display results
+        checkpoint(0.2, "Top combinations by total win value")
+        text += "TOP COMBINATIONS BY TOTAL WIN VALUE:\n"
+        text += "=" * 40 + "\n"
+        for i, (combo, stats) in enumerate(by_total_value[:10]):
+            main_nums, stars = combo
+            text += "{}. {} | {} - {} wins, value: {}, best: {}\n".format(
+                i+1, 
+                ', '.join(map(str, main_nums)),
+                ', '.join(map(str, stars)),
+                stats['total_wins'],
+                stats['total_value'],
+                stats['highest_prize']
+            )
+        
+        checkpoint(0.4, "Top combinations by total wins")
+        text += "\nTOP COMBINATIONS BY TOTAL WINS:\n"
+        text += "=" * 35 + "\n"
+        for i, (combo, stats) in enumerate(by_total_wins[:10]):
+            main_nums, stars = combo
+            text += "{}. {} | {} - {} wins, avg value: {:.1f}\n".format(
+                i+1,
+                ', '.join(map(str, main_nums)),
+                ', '.join(map(str, stars)),
+                stats['total_wins'],
+                stats['avg_value']
+            )
+        
+        checkpoint(0.6, "Highest individual prizes")
+        text += "\nHIGHEST INDIVIDUAL PRIZES:\n"
+        text += "=" * 30 + "\n"
+        for i, (combo, stats) in enumerate(by_highest_prize[:10]):
+            main_nums, stars = combo
+            text += "{}. {} | {} - Best: {} ({} total wins)\n".format(
+                i+1,
+                ', '.join(map(str, main_nums)),
+                ', '.join(map(str, stars)),
+                stats['highest_prize'],
+                stats['total_wins']
+            )
+        
+        # Show details for top performer
+        if by_total_value:
+            text += "\nDETAILS FOR TOP PERFORMING COMBINATION:\n"
+            text += "=" * 45 + "\n"
+            top_combo, top_stats = by_total_value[0]
+            main_nums, stars = top_combo
+            text += "Numbers: {} | Stars: {}\n".format(
+                ', '.join(map(str, main_nums)), ', '.join(map(str, stars))
+            )
+            text += "Total wins: {} | Total value: {} | Best prize: {}\n".format(
+                top_stats['total_wins'], top_stats['total_value'], top_stats['highest_prize']
+            )
+            
+            # Show recent wins
+            top_main_matches, top_star_matches = kernel.match_counts(main_nums, stars)
+            wins_detail = []
+            for index in top_stats['win_indices'].tolist():
+                main_m, star_m = int(top_main_matches[index]), int(top_star_matches[index])
+                wins_detail.append((self.store.date_at(index), prize_levels[(main_m, star_m)][0], main_m, star_m))
+            recent_wins = sorted(wins_detail, key=lambda x: x[0], reverse=True)[:10]
+            text += "\nRecent wins:\n"
+            for date, prize, main_m, star_m in recent_wins:
+                text += "  {}: {} ({} main + {} stars)\n".format(
+                    date.strftime('%Y-%m-%d'), prize, main_m, star_m
+                )
+        
+        checkpoint(0.8, "Statistics")
+        text += "\nSTATISTICS:\n"
+        text += "=" * 15 + "\n"
+        text += "Combinations analyzed: {}\n".format(len(test_combinations))
+        text += "Winning combinations found: {}\n".format(len(combination_analysis))
+        if combination_analysis:
+            avg_wins = sum(stats['total_wins'] for stats in combination_analysis.values()) / len(combination_analysis)
+            text += "Average wins per winning combination: {:.1f}\n".format(avg_wins)
+        
+        return text
+    
+    def jackpot_winners_report(self):
+        text = Report("JACKPOT WINNING COMBINATIONS\n")
+        text += "=" * 40 + "\n\n"
+        
+        # Jackpot = all 5 main numbers + 2 lucky stars, so every draw is a jackpot combination
+        jackpot_draws = self.store
+        
+        text += "Total jackpot winning combinations: {}\n\n".format(len(jackpot_draws))
+        
+        # Analyze patterns in jackpot wins
+        main_counter = jackpot_draws.main_counter()
+        stars_counter = jackpot_draws.star_counter()
+        
+        checkpoint(0.25, "Most frequent numbers in jackpot wins")
+        text += "MOST FREQUENT NUMBERS IN JACKPOT WINS:\n"
+        text += "-" * 40 + "\n"
+        text += "Main numbers:\n"
+        for num, count in main_counter.most_common(15):
+            percentage = (count / len(jackpot_draws)) * 100
+            text += "  {:2d}: {} times ({:.1f}%)\n".format(num, count, percentage)
+        
+        text += "\nLucky stars:\n"
+        for star, count in stars_counter.most_common(8):
+            percentage = (count / len(jackpot_draws)) * 100
+            text += "  {:2d}: {} times ({:.1f}%)\n".format(star, count, percentage)
+        
+        # Show recent jackpot wins
+        checkpoint(0.5, "Recent jackpot combinations")
+        text += "\nRECENT JACKPOT COMBINATIONS:\n"
+        text += "-" * 30 + "\n"
+        recent_jackpots = reversed(list(jackpot_draws.slice(-20).iter_draws()))
+        
+        for draw_date, draw_mains, draw_stars in recent_jackpots:
+            text += "{}: {} | {}\n".format(
+                draw_date.strftime('%Y-%m-%d'),
+                ', '.join(['{:2d}'.format(n) for n in draw_mains]),
+                ', '.join(['{:2d}'.format(s) for s in draw_stars])
+            )
+        
+        # Analyze patterns
+        checkpoint(0.75, "Jackpot pattern analysis")
+        text += "\nJACKPOT PATTERN ANALYSIS:\n"
+        text += "-" * 25 + "\n"
+        
+        # Odd/Even analysis
+        odd_even_counter = counter_from_counts(np.bincount(jackpot_draws.odd_counts(), minlength=6))
+        text += "Odd/Even distribution in jackpots:\n"
+        for odd_count in sorted(odd_even_counter.keys()):
+            even_count = 5 - odd_count
+            percentage = (odd_even_counter[odd_count] / len(jackpot_draws)) * 100
+            text += "  {} odd, {} even: {} times ({:.1f}%)\n".format(
+                odd_count, even_count, odd_even_counter[odd_count], percentage
+            )
+        
+        # Sum analysis
+        sums = jackpot_draws.sums()
+        text += "\nSum statistics:\n"
+        text += "  Average sum: {:.1f}\n".format(int(sums.sum()) / len(sums))
+        text += "  Min sum: {}, Max sum: {}\n".format(sums.min(), sums.max())
+        
+        return text
+    
+    def top_prize_winners_report(self):
+        text = Report("TOP 3 PRIZE LEVELS ANALYSIS\n")
+        text += "=" * 35 + "\n\n"
+        
+        # Jackpot, 2nd Prize, 3rd Prize combinations - every draw is an
+        # actual winning combination for the top prizes
+        top_prizes = self.store
+        
+        checkpoint(0.2, "Analysis of top prize winning numbers")
+        text += "ANALYSIS OF TOP PRIZE WINNING NUMBERS:\n"
+        text += "=" * 40 + "\n"
+        text += "Total top prize combinations: {}\n\n".format(len(top_prizes))
+        
+        # Frequency analysis
+        all_mains = top_prizes.mains
+        main_counter = top_prizes.main_counter()
+        stars_counter = top_prizes.star_counter()
+        
+        checkpoint(0.4, "Hottest numbers in top prizes")
+        text += "HOTTEST NUMBERS IN TOP PRIZES:\n"
+        text += "-" * 30 + "\n"
+        text += "Main numbers (most frequent):\n"
+        for num, count in main_counter.most_common(10):
+            percentage = (count / len(top_prizes)) * 100
+            text += "  {:2d}: appeared {} times ({:.1f}% of top wins)\n".format(num, count, percentage)
+        
+        text += "\nLucky stars (most frequent):\n"
+        for star, count in stars_counter.most_common(6):
+            percentage = (count / len(top_prizes)) * 100
+            text += "  {:2d}: appeared {} times ({:.1f}% of top wins)\n".format(star, count, percentage)
+        
+        checkpoint(0.6, "Coolest numbers in top prizes")
+        text += "\nCOOLEST NUMBERS IN TOP PRIZES:\n"
+        text += "-" * 30 + "\n"
+        text += "Main numbers (least frequent):\n"
+        for num, count in main_counter.most_common()[-10:]:
+            percentage = (count / len(top_prizes)) * 100
+            text += "  {:2d}: appeared {} times ({:.1f}% of top wins)\n".format(num, count, percentage)
+        
+        text += "\nLucky stars (least frequent):\n"
+        for star, count in stars_counter.most_common()[-6:]:
+            percentage = (count / len(top_prizes)) * 100
+            text += "  {:2d}: appeared {} times ({:.1f}% of top wins)\n".format(star, count, percentage)
+        
+        # Decade analysis
+        checkpoint(0.8, "Number range analysis")
+        text += "\nNUMBER RANGE ANALYSIS:\n"
+        text += "-" * 20 + "\n"
+        decades = {
+            '1-10': (1, 10),
+            '11-20': (11, 20), 
+            '21-30': (21, 30),
+            '31-40': (31, 40),
+            '41-50': (41, 50)
+        }
+        
+        for decade_name, (start, end) in decades.items():
+            count = int(((all_mains >= start) & (all_mains <= end)).sum())
+            percentage = (count / all_mains.size) * 100
+            text += "  {}: {} numbers ({:.1f}%)\n".format(decade_name, count, percentage)
+        
+        # Recent patterns
+        text += "\nRECENT TOP PRIZE PATTERNS (Last 20):\n"
+        text += "-" * 35 + "\n"
+        recent_prizes = reversed(list(top_prizes.slice(-20).iter_draws()))
+        
+        for prize_date, prize_mains, prize_stars in recent_prizes:
+            text += "{}: {} | {}\n".format(
+                prize_date.strftime('%Y-%m-%d'),
+                ', '.join(['{:2d}'.format(n) for n in sorted(prize_mains)]),
+                ', '.join(['{:2d}'.format(s) for s in sorted(prize_stars)])
+            )
+        
+        # Generate recommended combinations based on top prize patterns
+        text += "\nRECOMMENDED COMBINATIONS (Based on Top Prize Patterns):\n"
+        text += "-" * 55 + "\n"
+        
+        # Get most successful numbers
+        top_mains = [num for num, count in main_counter.most_common(15)]
+        top_stars = [star for star, count in stars_counter.most_common(6)]
+        
+        import random
+        random.seed(42)  # For reproducible results
+        
+        text += "Hot number combinations:\n"
+        for i in range(3):
+            selected_mains = sorted(random.sample(top_mains[:12], 5))
+            selected_stars = sorted(random.sample(top_stars[:4], 2))
+            text += "  {}: {} | {}\n".format(
+                i+1,
+                ', '.join(['{:2d}'.format(n) for n in selected_mains]),
+                ', '.join(['{:2d}'.format(s) for s in selected_stars])
+            )
+        
+        return text
+    
+    def duplicate_jackpots_report(self):
+        text = Report("DUPLICATE JACKPOT COMBINATIONS ANALYSIS\n")
+        text += "=" * 50 + "\n\n"
+        
+        # Group all draws by their ticket codes
+        codes = encode_tickets(self.store.mains, self.store.stars)
+        _, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+        
+        # Find combinations that appeared more than once, keyed in order of first appearance
+        duplicate_combinations = {}
+        repeated = np.flatnonzero(counts[inverse] > 1)
+        repeated_mains, repeated_stars = decode_tickets(codes[repeated])
+        for index, mains, stars in zip(repeated.tolist(), repeated_mains.tolist(), repeated_stars.tolist()):
+            combo_key = (tuple(mains), tuple(stars))
+            duplicate_combinations.setdefault(combo_key, []).append({'date': self.store.date_at(index)})
+        
+        if duplicate_combinations:
+            text += f"FOUND {len(duplicate_combinations)} DUPLICATE JACKPOT COMBINATIONS!\n"
+            text += "=" * 55 + "\n\n"
+            
+            # Sort by number of occurrences (most frequent first)
+            sorted_duplicates = sorted(duplicate_combinations.items(), 
+                                     key=lambda x: len(x[1]), reverse=True)
+            
+            for i, (combo_key, draws) in enumerate(sorted_duplicates):
+                main_nums, stars = combo_key
+                text += f"{i+1}. COMBINATION: {', '.join(map(str, main_nums))} | {', '.join(map(str, stars))}\n"
+                text += f"   Appeared {len(draws)} times:\n"
+                
+                # Show all dates this combination won
+                for j, draw in enumerate(sorted(draws, key=lambda x: x['date'])):
+                    text += f"   • {draw['date'].strftime('%Y-%m-%d (%A)')}\n"
+                
+                # Calculate time between occurrences
+                if len(draws) >= 2:
+                    sorted_draws = sorted(draws, key=lambda x: x['date'])
+                    text += f"   Time between wins:\n"
+                    for k in range(len(sorted_draws) - 1):
+                        days_diff = (sorted_draws[k+1]['date'] - sorted_draws[k]['date']).days
+                        years = days_diff // 365
+                        remaining_days = days_diff % 365
+                        if years > 0:
+                            text += f"   • {days_diff} days ({years} years, {remaining_days} days)\n"
+                        else:
+                            text += f"   • {days_diff} days\n"
+                
+                text += "\n" + "-" * 60 + "\n\n"
+            
+            # Statistics about duplicates
+            text += "DUPLICATE STATISTICS:\n"
+            text += "=" * 25 + "\n"
+            
+            total_duplicate_occurrences = sum(len(draws) for draws in duplicate_combinations.values())
+            text += f"Total duplicate occurrences: {total_duplicate_occurrences}\n"
+            text += f"Percentage of all draws that are duplicates: {(total_duplicate_occurrences / len(self.store)) * 100:.2f}%\n"
+            
+            # Most frequent duplicate
+            most_frequent = max(duplicate_combinations.items(), key=lambda x: len(x[1]))
+            main_nums, stars = most_frequent[0]
+            text += f"Most frequent combination: {', '.join(map(str, main_nums))} | {', '.join(map(str, stars))} ({len(most_frequent[1])} times)\n"
+            
+            # Average time between duplicates
+            all_gaps = []
+            for draws in duplicate_combinations.values():
+                if len(draws) >= 2:
+                    sorted_draws = sorted(draws, key=lambda x: x['date'])
+                    for i in range(len(sorted_draws) - 1):
+                        gap = (sorted_draws[i+1]['date'] - sorted_draws[i]['date']).days
+                        all_gaps.append(gap)
+            
+            if all_gaps:
+                avg_gap = sum(all_gaps) / len(all_gaps)
+                text += f"Average time between duplicate wins: {avg_gap:.0f} days ({avg_gap/365:.1f} years)\n"
+                text += f"Shortest gap: {min(all_gaps)} days\n"
+                text += f"Longest gap: {max(all_gaps)} days ({max(all_gaps)/365:.1f} years)\n"
+            
+            # Pattern analysis of duplicates
+            text += "\nPATTERN ANALYSIS OF DUPLICATES:\n"
+            text += "-" * 35 + "\n"
+            
+            # Analyze number frequency in duplicates
+            duplicate_mains = []
+            duplicate_stars = []
+            for (main_nums, stars), draws in duplicate_combinations.items():
+                # Weight by number of occurrences
+                for _ in range(len(draws)):
+                    duplicate_mains.extend(main_nums)
+                    duplicate_stars.extend(stars)
+            
+            main_counter = Counter(duplicate_mains)
+            stars_counter = Counter(duplicate_stars)
+            
+            text += "Most common numbers in duplicate jackpots:\n"
+            text += "Main numbers: {}\n".format(
+                ', '.join([str(num) for num, count in main_counter.most_common(10)])
+            )
+            text += "Lucky stars: {}\n".format(
+                ', '.join([str(star) for star, count in stars_counter.most_common(6)])
+            )
+            
+            # Odd/even analysis
+            odd_even_patterns = []
+            for (main_nums, stars), draws in duplicate_combinations.items():
+                odd_count = sum(1 for num in main_nums if num % 2 == 1)
+                odd_even_patterns.extend([odd_count] * len(draws))
+            
+            odd_even_counter = Counter(odd_even_patterns)
+            text += f"\nOdd/Even distribution in duplicates:\n"
+            for odd_count in sorted(odd_even_counter.keys()):
+                even_count = 5 - odd_count
+                percentage = (odd_even_counter[odd_count] / len(odd_even_patterns)) * 100
+                text += f"  {odd_count} odd, {even_count} even: {odd_even_counter[odd_count]} times ({percentage:.1f}%)\n"
+            
+        else:
+            text += "NO DUPLICATE JACKPOT COMBINATIONS FOUND!\n"
+            text += "=" * 40 + "\n\n"
+            text += "Every single jackpot draw in the EuroMillions history has been unique.\n"
+            text += f"Total draws analyzed: {len(self.store)}\n"
+            text += f"All {len(self.store)} combinations are completely different!\n\n"
+            text += "This demonstrates the astronomical odds of the EuroMillions lottery:\n"
+            text += f"• Odds of winning jackpot: 1 in 139,838,160\n"
+            text += f"• With {len(self.store)} draws, we've only seen {len(self.store)/139838160*100:.6f}% of all possible combinations\n"
+            text += f"• Statistical probability of seeing a duplicate by now: {(1 - ((139838159/139838160)**len(self.store)))*100:.4f}%\n"
+        
+        # Show some interesting statistics regardless
+        checkpoint(0.5, "Interesting facts")
+        text += "\nINTERESTING FACTS:\n"
+        text += "=" * 20 + "\n"
+        text += f"Total possible EuroMillions combinations: 139,838,160\n"
+        text += f"Combinations drawn so far: {len(self.store)}\n"
+        text += f"Percentage of all possibilities used: {(len(self.store)/139838160)*100:.6f}%\n"
+        text += f"Remaining possible combinations: {139838160 - len(self.store):,}\n"
+        
+        return text
+    
+    def chi_square_report(self):
+        text = Report("CHI-SQUARE GOODNESS OF FIT TEST\n")
+        text += "=" * 40 + "\n\n"
+        text += "Tests if number frequencies deviate significantly from expected uniform distribution.\n"
+        text += "This can detect physical biases in ball selection.\n\n"
+        
+        # Calculate chi-square for main numbers
+        main_counter = self.analytics.main_counter()
+        expected_frequency = len(self.store) * 5 / 50  # Expected draws per number
+        
+        chi_square_main = 0
+        checkpoint(0.25, "Main numbers (1-50)")
+        text += "MAIN NUMBERS (1-50):\n"
+        text += "-" * 25 + "\n"
+        text += f"Expected frequency per number: {expected_frequency:.2f}\n"
+        text += f"Total observations: {self.store.mains.size}\n\n"
+        
+        significant_deviations = []
+        for num in range(1, 51):
+            observed = main_counter.get(num, 0)
+            deviation = (observed - expected_frequency) ** 2 / expected_frequency
+            chi_square_main += deviation
+            
+            # Flag significant deviations (>2 standard deviations)
+            z_score = (observed - expected_frequency) / (expected_frequency ** 0.5)
+            if abs(z_score) > 2:
+                significant_deviations.append((num, observed, z_score))
+        
+        # p-value and critical values from fair histories of the same length
+        degrees_freedom = 49  # 50 numbers - 1
+        text += f"Chi-square statistic: {chi_square_main:.3f}\n"
+        text += f"Degrees of freedom: {degrees_freedom}\n"
+        
+        null_main = self.null_distribution('chi_square_main')
+        p_main = self.null_test('chi_square_main')[1]
+        text += f"Empirical p-value: {p_main:.4f} ({len(null_main)} simulated fair histories)\n"
+        
+        significant = False
+        for alpha in (0.001, 0.01, 0.05):
+            if p_main <= alpha:
+                critical = np.quantile(null_main, 1 - alpha)
+                text += f"SIGNIFICANT at α = {alpha} (simulated critical value: {critical:.3f})\n"
+                significant = True
+                break
+        
+        if not significant:
+            text += "NOT SIGNIFICANT - distribution appears random\n"
+        
+        # Show significant deviations
+        if significant_deviations:
+            text += f"\nSIGNIFICANT DEVIATIONS (|z| > 2):\n"
+            text += "-" * 35 + "\n"
+            for num, observed, z_score in significant_deviations:
+                bias_type = "OVER-REPRESENTED" if z_score > 0 else "UNDER-REPRESENTED"
+                text += f"Number {num:2d}: {observed:3d} times (z={z_score:+.2f}) - {bias_type}\n"
+        
+        # Lucky stars analysis
+        stars_counter = self.analytics.star_counter()
+        expected_frequency_stars = len(self.store) * 2 / 12
+        
+        chi_square_stars = 0
+        checkpoint(0.5, "Lucky stars (1-12)")
+        text += f"\n\nLUCKY STARS (1-12):\n"
+        text += "-" * 20 + "\n"
+        text += f"Expected frequency per star: {expected_frequency_stars:.2f}\n"
+        
+        star_deviations = []
+        for star in range(1, 13):
+            observed = stars_counter.get(star, 0)
+            deviation = (observed - expected_frequency_stars) ** 2 / expected_frequency_stars
+            chi_square_stars += deviation
+            
+            z_score = (observed - expected_frequency_stars) / (expected_frequency_stars ** 0.5)
+            if abs(z_score) > 2:
+                star_deviations.append((star, observed, z_score))
+        
+        degrees_freedom_stars = 11
+        text += f"Chi-square statistic: {chi_square_stars:.3f}\n"
+        text += f"Degrees of freedom: {degrees_freedom_stars}\n"
+        
+        # Two distinct stars per draw make the textbook critical values too high
+        null_stars = self.null_distribution('chi_square_stars')
+        p_stars = self.null_test('chi_square_stars')[1]
+        text += f"Empirical p-value: {p_stars:.4f} ({len(null_stars)} simulated fair histories)\n"
+        
+        star_significant = False
+        for alpha in (0.001, 0.01, 0.05):
+            if p_stars <= alpha:
+                critical = np.quantile(null_stars, 1 - alpha)
+                text += f"SIGNIFICANT at α = {alpha} (simulated critical value: {critical:.3f})\n"
+                star_significant = True
+                break
+        
+        if not star_significant:
+            text += "NOT SIGNIFICANT - distribution appears random\n"
+        
+        if star_deviations:
+            text += f"\nSIGNIFICANT STAR DEVIATIONS:\n"
+            text += "-" * 25 + "\n"
+            for star, observed, z_score in star_deviations:
+                bias_type = "OVER-REPRESENTED" if z_score > 0 else "UNDER-REPRESENTED"
+                text += f"Star {star:2d}: {observed:3d} times (z={z_score:+.2f}) - {bias_type}\n"
+        
+        # Interpretation
+        checkpoint(0.75, "Interpretation")
+        text += f"\n\nINTERPRETATION:\n"
+        text += "=" * 15 + "\n"
+        if significant or star_significant:
+            text += "⚠️  POTENTIAL BIAS DETECTED!\n\n"
+            text += "This could indicate:\n"
+            text += "• Physical ball irregularities\n"
+            text += "• Machine mechanical bias\n"
+            text += "• Manufacturing defects\n"
+            text += "• Statistical anomaly (false positive)\n\n"
+            text += "Professional recommendation:\n"
+            text += "• Monitor these numbers in future draws\n"
+            text += "• Consider slight betting adjustments\n"
+            text += "• Verify with additional statistical tests\n"
+        else:
+            text += "✅ NO SIGNIFICANT BIAS DETECTED\n\n"
+            text += "The lottery appears to be operating fairly with\n"
+            text += "proper random distribution. Any patterns observed\n"
+            text += "are likely due to natural statistical variation.\n"
+        
+        return text
+    
+    def coefficient_variation_report(self):
+        text = Report("COEFFICIENT OF VARIATION ANALYSIS\n")
+        text += "=" * 40 + "\n\n"
+        text += "Measures relative variability in number frequencies.\n"
+        text += "CV = (Standard Deviation / Mean) × 100\n"
+        text += "Lower CV = more uniform (less bias)\n"
+        text += "Higher CV = more variation (potential bias)\n\n"
+        
+        # Main numbers analysis
+        main_counter = self.analytics.main_counter()
+        frequencies = [main_counter.get(i, 0) for i in range(1, 51)]
+        
+        mean_freq = sum(frequencies) / len(frequencies)
+        variance = sum((f - mean_freq) ** 2 for f in frequencies) / len(frequencies)
+        std_dev = variance ** 0.5
+        cv_main = (std_dev / mean_freq) * 100
+        
+        checkpoint(0.2, "Main numbers (1-50)")
+        text += f"MAIN NUMBERS (1-50):\n"
+        text += "-" * 25 + "\n"
+        text += f"Mean frequency: {mean_freq:.2f}\n"
+        text += f"Standard deviation: {std_dev:.2f}\n"
+        text += f"Coefficient of Variation: {cv_main:.2f}%\n"
+        
+        # Expected CV and its spread from simulated fair histories
+        null_main = self.null_distribution('cv_main')
+        expected_cv = float(null_main.mean())
+        text += f"Expected CV (random): {expected_cv:.2f}%\n"
+        
+        cv_ratio = cv_main / expected_cv
+        text += f"CV Ratio (observed/expected): {cv_ratio:.3f}\n"
+        
+        p_high = self.null_test('cv_main')[1]
+        p_low = self.null_test('cv_main', tail='lower')[1]
+        text += f"Fair histories with a CV this high: {p_high:.1%}, this low: {p_low:.1%}\n"
+        
+        if p_high < 0.05:
+            text += "⚠️  HIGHER than expected - possible bias\n"
+        elif p_low < 0.05:
+            text += "⚠️  LOWER than expected - unusually uniform\n"
+        else:
+            text += "✅ Within expected range\n"
+        
+        # Lucky stars analysis
+        stars_counter = self.analytics.star_counter()
+        star_frequencies = [stars_counter.get(i, 0) for i in range(1, 13)]
+        
+        star_mean = sum(star_frequencies) / len(star_frequencies)
+        star_variance = sum((f - star_mean) ** 2 for f in star_frequencies) / len(star_frequencies)
+        star_std = star_variance ** 0.5
+        cv_stars = (star_std / star_mean) * 100
+        
+        checkpoint(0.4, "Lucky stars (1-12)")
+        text += f"\nLUCKY STARS (1-12):\n"
+        text += "-" * 20 + "\n"
+        text += f"Mean frequency: {star_mean:.2f}\n"
+        text += f"Standard deviation: {star_std:.2f}\n"
+        text += f"Coefficient of Variation: {cv_stars:.2f}%\n"
+        
+        null_stars = self.null_distribution('cv_stars')
+        expected_star_cv = float(null_stars.mean())
+        text += f"Expected CV (random): {expected_star_cv:.2f}%\n"
+        
+        star_cv_ratio = cv_stars / expected_star_cv
+        text += f"CV Ratio: {star_cv_ratio:.3f}\n"
+        
+        star_p_high = self.null_test('cv_stars')[1]
+        star_p_low = self.null_test('cv_stars', tail='lower')[1]
+        text += f"Fair histories with a CV this high: {star_p_high:.1%}, this low: {star_p_low:.1%}\n"
+        
+        if star_p_high < 0.05:
+            text += "⚠️  HIGHER than expected - possible bias\n"
+        elif star_p_low < 0.05:
+            text += "⚠️  LOWER than expected - unusually uniform\n"
+        else:
+            text += "✅ Within expected range\n"
+        
+        # Detailed frequency distribution
+        checkpoint(0.6, "Detailed frequency distribution")
+        text += f"\nDETAILED FREQUENCY DISTRIBUTION:\n"
+        text += "=" * 35 + "\n"
+        
+        # Sort by frequency for main numbers
+        sorted_mains = sorted([(main_counter.get(i, 0), i) for i in range(1, 51)], reverse=True)
+        
+        text += "Main numbers (most to least frequent):\n"
+        for i, (freq, num) in enumerate(sorted_mains[:10]):
+            deviation = freq - mean_freq
+            text += f"{i+1:2d}. Number {num:2d}: {freq:3d} times ({deviation:+.1f})\n"
+        
+        text += "...\n"
+        
+        for i, (freq, num) in enumerate(sorted_mains[-5:]):
+            deviation = freq - mean_freq
+            text += f"{46+i:2d}. Number {num:2d}: {freq:3d} times ({deviation:+.1f})\n"
+        
+        # Professional interpretation
+        checkpoint(0.8, "Professional analysis")
+        text += f"\nPROFESSIONAL ANALYSIS:\n"
+        text += "=" * 25 + "\n"
+        
+        if min(p_high, star_p_high) < 0.01:
+            text += "🔴 HIGH VARIATION DETECTED\n"
+            text += "• Significant deviation from randomness\n"
+            text += "• Potential equipment issues\n"
+            text += "• Worth monitoring for advantage play\n"
+        elif min(p_high, star_p_high) < 0.05:
+            text += "🟡 MODERATE VARIATION\n"
+            text += "• Slightly higher than expected\n"
+            text += "• Monitor trends over time\n"
+            text += "• Possible minor equipment bias\n"
+        else:
+            text += "🟢 NORMAL VARIATION\n"
+            text += "• Equipment appears to be functioning properly\n"
+            text += "• No detectable bias for advantage play\n"
+            text += "• Results consistent with fair random draws\n"
+        
+        return text
+    
+    def temporal_bias_report(self):
+        text = Report("TEMPORAL BIAS ANALYSIS\n")
+        text += "=" * 30 + "\n\n"
+        text += "Analyzes if certain numbers appear more frequently\n"
+        text += "in recent draws vs. historical averages.\n"
+        text += "This can detect equipment degradation or ball wear.\n\n"
+        
+        # Split data into time periods
+        total_draws = len(self.store)
+        windows = self.store.rolling_windows()
+        recent_draws = 100 if total_draws >= 200 else total_draws - total_draws // 2
+        historical_draws = total_draws - recent_draws
+        
+        text += f"Analysis periods:\n"
+        text += f"• Historical: {historical_draws} draws\n"
+        text += f"• Recent: {recent_draws} draws\n\n"
+        
+        # Historical frequencies
+        historical_counter = counter_from_counts(windows.counts(0, historical_draws))
+        
+        # Recent frequencies  
+        recent_counter = counter_from_counts(windows.counts(historical_draws, total_draws))
+        
+        # Expected frequencies
+        historical_expected = historical_draws * 5 / 50
+        recent_expected = recent_draws * 5 / 50
+        
+        checkpoint(0.33, "Main numbers temporal analysis")
+        text += f"MAIN NUMBERS TEMPORAL ANALYSIS:\n"
+        text += "-" * 35 + "\n"
+        text += f"Historical expected per number: {historical_expected:.2f}\n"
+        text += f"Recent expected per number: {recent_expected:.2f}\n\n"
+        
+        # Find numbers with significant temporal changes
+        temporal_changes = []
+        for num in range(1, 51):
+            hist_freq = historical_counter.get(num, 0)
+            recent_freq = recent_counter.get(num, 0)
+            
+            # Calculate relative change
+            hist_rate = hist_freq / historical_draws if historical_draws > 0 else 0
+            recent_rate = recent_freq / recent_draws if recent_draws > 0 else 0
+            
+            if hist_rate > 0:
+                change_ratio = recent_rate / hist_rate
+                change_percent = (change_ratio - 1) * 100
+                
+                # Flag significant changes (>50% increase/decrease)
+                if abs(change_percent) > 50 and recent_freq >= 3:  # Must have some recent activity
+                    temporal_changes.append((num, hist_freq, recent_freq, change_percent))
+        
+        # How often a fair history of this length moves as many numbers
+        p_changes = self.null_test('temporal_changes')[1]
+        text += f"Numbers changing by over 50%: {len(temporal_changes)} "
+        text += f"(fair histories with as many: {p_changes:.1%})\n\n"
+        
+        if temporal_changes:
+            # Sort by magnitude of change
+            temporal_changes.sort(key=lambda x: abs(x[3]), reverse=True)
+            
+            text += f"SIGNIFICANT TEMPORAL CHANGES:\n"
+            text += "-" * 30 + "\n"
+            for num, hist, recent, change in temporal_changes[:15]:
+                trend = "↗️ INCREASING" if change > 0 else "↘️ DECREASING"
+                text += f"Number {num:2d}: {hist:2d}→{recent:2d} ({change:+.1f}%) {trend}\n"
+            
+            # Analyze patterns
+            increasing = [x for x in temporal_changes if x[3] > 50]
+            decreasing = [x for x in temporal_changes if x[3] < -50]
+            
+            text += f"\nPATTERN ANALYSIS:\n"
+            text += f"• Numbers increasing in frequency: {len(increasing)}\n"
+            text += f"• Numbers decreasing in frequency: {len(decreasing)}\n"
+            
+            if len(increasing) > 3 and p_changes < 0.05:
+                text += f"\n🔴 EQUIPMENT ALERT: Multiple numbers showing increased frequency\n"
+                text += f"Possible causes: Ball wear, machine calibration drift\n"
+                
+                hot_numbers = [x[0] for x in increasing[:5]]
+                text += f"Consider monitoring: {hot_numbers}\n"
+            
+        else:
+            text += "✅ NO SIGNIFICANT TEMPORAL CHANGES DETECTED\n"
+            text += "Number frequencies remain stable over time.\n"
+        
+        # Day of week analysis
+        checkpoint(0.67, "Day-of-week bias analysis")
+        text += f"\n\nDAY-OF-WEEK BIAS ANALYSIS:\n"
+        text += "-" * 30 + "\n"
+        
+        weekdays = self.store.weekdays()
+        all_sums = self.analytics.sums()
+        tuesday_sums = all_sums[weekdays == 1]  # Tuesday
+        friday_sums = all_sums[weekdays == 4]   # Friday
+        
+        text += f"Tuesday draws: {len(tuesday_sums)}\n"
+        text += f"Friday draws: {len(friday_sums)}\n"
+        
+        if len(tuesday_sums) > 0 and len(friday_sums) > 0:
+            # Compare average sums
+            tue_avg = int(tuesday_sums.sum()) / len(tuesday_sums)
+            fri_avg = int(friday_sums.sum()) / len(friday_sums)
+            
+            text += f"Average sum Tuesday: {tue_avg:.2f}\n"
+            text += f"Average sum Friday: {fri_avg:.2f}\n"
+            text += f"Difference: {abs(tue_avg - fri_avg):.2f}\n"
+            
+            if abs(tue_avg - fri_avg) > 5:
+                text += "⚠️  Significant day-of-week difference detected\n"
+            else:
+                text += "✅ No significant day-of-week bias\n"
+        
+        return text
+    
+    def autocorrelation_report(self, max_lag=DEFAULT_MAX_LAG):
+        text = Report("AUTOCORRELATION ANALYSIS\n")
+        text += "=" * 30 + "\n\n"
+        text += "Tests if numbers in consecutive draws are correlated.\n"
+        text += "Strong correlation suggests mechanical memory effects\n"
+        text += "or non-random behavior in the drawing process.\n\n"
+        
+        text += f"Analyzing {max(len(self.store) - 1, 0)} consecutive draw pairs...\n\n"
+        
+        # Overlaps and per-number autocorrelation for every lag, in one pass
+        max_lag = min(max_lag, max(len(self.store) - 1, 1))
+        scan = autocorrelation(self.store.indicator_matrix(), max_lag)
+        
+        # Calculate autocorrelations at different lags
+        def calculate_number_autocorr(lag=1):
+            # Mean overlap between each draw and the draw lag later
+            actual_overlap = float(scan['overlap'][lag - 1]) if lag <= max_lag else 0
+            return actual_overlap, scan['expected_overlap']
+        
+        # Test different lag periods
+        checkpoint(0.2, "Autocorrelation by lag")
+        text += "AUTOCORRELATION BY LAG:\n"
+        text += "-" * 25 + "\n"
+        
+        significant_lags = []
+        for lag in [1, 2, 3, 5, 10]:
+            actual, expected = calculate_number_autocorr(lag)
+            correlation = (actual - expected) / expected if expected > 0 else 0
+            
+            text += f"Lag {lag:2d}: {actual:.3f} overlap (expected: {expected:.3f}, "
+            text += f"correlation: {correlation:+.3f})\n"
+            
+            if abs(correlation) > 0.1:  # Arbitrary threshold for significance
+                significant_lags.append((lag, correlation))
+        
+        # Every lag against the 95% band for independent draws
+        deviation = np.abs(scan['overlap'] - scan['expected_overlap'])
+        outside = np.flatnonzero(deviation > scan['overlap_band'])
+        text += f"\nAll lags 1-{max_lag}: {len(outside)} outside the 95% band "
+        text += f"(about {max_lag * 0.05:.0f} expected by chance)\n"
+        for index in outside[np.argsort(-(deviation / scan['overlap_band'])[outside], kind='stable')][:5].tolist():
+            band = float(scan['overlap_band'][index])
+            text += f"  Lag {index + 1:3d}: {scan['overlap'][index]:.3f} overlap "
+            text += f"(band {scan['expected_overlap'] - band:.3f}-{scan['expected_overlap'] + band:.3f})\n"
+        
+        number_acf = scan['acf'][:, 1:]
+        strong = np.argwhere(np.abs(number_acf) > scan['acf_band'])
+        text += f"Per-number autocorrelation outside ±{scan['acf_band']:.3f}: {len(strong)} of {number_acf.size} "
+        text += f"(about {number_acf.size * 0.05:.0f} expected by chance)\n"
+        strongest = strong[np.argsort(-np.abs(number_acf[strong[:, 0], strong[:, 1]]), kind='stable')][:5]
+        for lag_index, column in strongest.tolist():
+            text += f"  Number {column + 1:2d} at lag {lag_index + 1:3d}: {number_acf[lag_index, column]:+.3f}\n"
+        
+        # Analyze consecutive number patterns
+        checkpoint(0.4, "Consecutive number persistence")
+        text += f"\nCONSECUTIVE NUMBER PERSISTENCE:\n"
+        text += "-" * 35 + "\n"
+        
+        # Consecutive pairs (low, low + 1) of each draw that are both in the next draw
+        sorted_mains = self.store.sorted_mains().astype(np.int64)
+        indicator = self.store.indicator_matrix()
+        low = sorted_mains[:-1, :-1]
+        persisted = ((np.diff(sorted_mains[:-1], axis=1) == 1) &
+                     np.take_along_axis(indicator[1:], low, axis=1) &
+                     np.take_along_axis(indicator[1:], low + 1, axis=1))
+        repeats = low[persisted]
+        
+        if len(repeats):
+            # Most repeated first, ties in the order the pairs first repeated
+            pairs, first_seen, counts = np.unique(repeats, return_index=True, return_counts=True)
+            order = np.lexsort((first_seen, -counts))[:10]
+            text += "Consecutive pairs that repeated in next draw:\n"
+            for number, count in zip(pairs[order].tolist(), counts[order].tolist()):
+                text += f"  {number}-{number + 1}: {count} times\n"
+        else:
+            text += "No consecutive pairs repeated in immediate next draws.\n"
+        
+        # Sum correlation analysis
+        checkpoint(0.6, "Sum autocorrelation")
+        text += f"\nSUM AUTOCORRELATION:\n"
+        text += "-" * 20 + "\n"
+        
+        sums = self.analytics.sums().astype(np.float64)
+        
+        def sum_autocorrelation(lag=1):
+            if len(sums) <= lag:
+                return 0
+            
+            # Calculate correlation coefficient
+            sum1 = sums[:-lag] if lag > 0 else sums
+            sum2 = sums[lag:]
+            
+            dev1 = sum1 - sum1.mean()
+            dev2 = sum2 - sum2.mean()
+            
+            numerator = float(np.dot(dev1, dev2))
+            denom1 = float(np.dot(dev1, dev1)) ** 0.5
+            denom2 = float(np.dot(dev2, dev2)) ** 0.5
+            
+            if denom1 == 0 or denom2 == 0:
+                return 0
+            
+            return numerator / (denom1 * denom2)
+        
+        for lag in [1, 2, 3, 5]:
+            corr = sum_autocorrelation(lag)
+            text += f"Sum lag {lag}: {corr:+.4f}\n"
+            if abs(corr) > 0.1:
+                text += f"  ⚠️  Significant correlation detected!\n"
+        
+        # Overall assessment
+        checkpoint(0.8, "Overall assessment")
+        text += f"\nOVERALL ASSESSMENT:\n"
+        text += "=" * 20 + "\n"
+        
+        if significant_lags or any(abs(sum_autocorrelation(lag)) > 0.1 for lag in [1, 2, 3]):
+            text += "🔴 SIGNIFICANT AUTOCORRELATION DETECTED\n\n"
+            text += "This suggests:\n"
+            text += "• Non-random mechanical behavior\n"
+            text += "• Possible equipment memory effects\n"
+            text += "• Ball mixing insufficient between draws\n"
+            text += "• Potential advantage play opportunity\n\n"
+            text += "Recommendations:\n"
+            text += "• Monitor patterns in real-time\n"
+            text += "• Consider exploiting detected correlations\n"
+            text += "• Verify findings with additional analysis\n"
+        else:
+            text += "✅ NO SIGNIFICANT AUTOCORRELATION\n\n"
+            text += "The drawing process appears to have proper\n"
+            text += "independence between consecutive draws.\n"
+            text += "No mechanical memory effects detected.\n"
+        
+        return text
+    
+    def ball_wear_report(self):
+        text = Report("BALL WEAR & USAGE PATTERN ANALYSIS\n")
+        text += "=" * 40 + "\n\n"
+        text += "Analyzes usage patterns that might indicate physical\n"
+        text += "wear effects on individual balls over time.\n\n"
+        
+        # Estimate ball replacement cycles (every ~6 months for EuroMillions)
+        total_days = int(self.store.dates[-1]) - int(self.store.dates[0])
+        estimated_cycles = max(1, total_days // 180)  # Assume 6-month cycles
+        
+        text += f"Dataset spans: {total_days} days\n"
+        text += f"Estimated ball replacement cycles: {estimated_cycles}\n"
+        text += f"Average draws per cycle: {len(self.store) // estimated_cycles}\n\n"
+        
+        # Split data into cycles, counted all at once from the rolling totals
+        draws_per_cycle = len(self.store) // estimated_cycles
+        cycle_starts = np.arange(estimated_cycles) * draws_per_cycle
+        cycle_stops = np.append(cycle_starts[1:], len(self.store))
+        cycle_counts = self.store.rolling_windows().counts(cycle_starts, cycle_stops)
+        
+        checkpoint(0.2, "Wear pattern analysis by cycle")
+        text += f"WEAR PATTERN ANALYSIS BY CYCLE:\n"
+        text += "-" * 35 + "\n"
+        
+        # Analyze frequency changes across cycles
+        cycle_frequencies = []
+        for i, counts in enumerate(cycle_counts):
+            cycle_counter = counter_from_counts(counts)
+            cycle_frequencies.append(cycle_counter)
+            
+            # Calculate most/least used in this cycle
+            most_used = cycle_counter.most_common(5)
+            least_used = cycle_counter.most_common()[-5:]
+            
+            text += f"Cycle {i+1} ({int(cycle_stops[i] - cycle_starts[i])} draws):\n"
+            text += f"  Most used: {[f'{num}({count})' for num, count in most_used]}\n"
+            text += f"  Least used: {[f'{num}({count})' for num, count in least_used]}\n"
+        
+        # Detect numbers showing wear patterns (declining frequency over time)
+        checkpoint(0.4, "Wear degradation analysis")
+        text += f"\nWEAR DEGRADATION ANALYSIS:\n"
+        text += "-" * 30 + "\n"
+        
+        wear_candidates = []
+        
+        for num in range(1, 51):
+            frequencies = [counter.get(num, 0) for counter in cycle_frequencies]
+            
+            if len(frequencies) >= 3:  # Need at least 3 cycles
+                # Simple linear trend analysis
+                n = len(frequencies)
+                x_sum = sum(range(n))
+                y_sum = sum(frequencies)
+                xy_sum = sum(i * freq for i, freq in enumerate(frequencies))
+                x2_sum = sum(i * i for i in range(n))
+                
+                if n * x2_sum - x_sum * x_sum != 0:
+                    slope = (n * xy_sum - x_sum * y_sum) / (n * x2_sum - x_sum * x_sum)
+                    
+                    # Significant declining trend
+                    if slope < -0.5 and sum(frequencies) > n:  # Must have some usage
+                        wear_candidates.append((num, slope, frequencies))
+        
+        if wear_candidates:
+            wear_candidates.sort(key=lambda x: x[1])  # Sort by slope (most declining first)
+            
+            text += "Numbers showing potential wear effects:\n"
+            for num, slope, freqs in wear_candidates[:10]:
+                trend_desc = "DECLINING" if slope < -0.5 else "STABLE"
+                text += f"  Number {num:2d}: slope={slope:.2f} {freqs} - {trend_desc}\n"
+            
+            text += f"\n⚠️  {len(wear_candidates)} numbers show declining usage patterns\n"
+            text += "This could indicate:\n"
+            text += "• Physical wear making balls less likely to be selected\n"
+            text += "• Weight changes affecting ball behavior\n"
+            text += "• Surface roughness changes\n"
+            
+            # Numbers that might be 'fresh' (increasing usage)
+            fresh_candidates = []
+            for num in range(1, 51):
+                frequencies = [counter.get(num, 0) for counter in cycle_frequencies]
+                if len(frequencies) >= 3:
+                    n = len(frequencies)
+                    x_sum = sum(range(n))
+                    y_sum = sum(frequencies)
+                    xy_sum = sum(i * freq for i, freq in enumerate(frequencies))
+                    x2_sum = sum(i * i for i in range(n))
+                    
+                    if n * x2_sum - x_sum * x_sum != 0:
+                        slope = (n * xy_sum - x_sum * y_sum) / (n * x2_sum - x_sum * x_sum)
+                        
+                        if slope > 0.5:  # Increasing trend
+                            fresh_candidates.append((num, slope, frequencies))
+            
+            if fresh_candidates:
+                fresh_candidates.sort(key=lambda x: x[1], reverse=True)
+                text += f"\nNumbers showing 'fresh ball' patterns:\n"
+                for num, slope, freqs in fresh_candidates[:5]:
+                    text += f"  Number {num:2d}: slope={slope:.2f} {freqs} - INCREASING\n"
+            
+        else:
+            text += "✅ No clear wear patterns detected.\n"
+            text += "Ball usage appears consistent across time periods.\n"
+        
+        # Manufacturing batch analysis (speculative)
+        checkpoint(0.6, "Manufacturing batch analysis")
+        text += f"\nMANUFACTURING BATCH ANALYSIS:\n"
+        text += "-" * 35 + "\n"
+        text += "Grouping numbers by potential manufacturing characteristics...\n\n"
+        
+        # Group by number ranges (might indicate production batches)
+        ranges = [(1, 10), (11, 20), (21, 30), (31, 40), (41, 50)]
+        range_stats = []
+        
+        main_counts = self.analytics.main_counts()
+        for start, end in ranges:
+            range_numbers = list(range(start, end + 1))
+            total_appearances = int(main_counts[start:end + 1].sum())
+            avg_appearances = total_appearances / len(range_numbers)
+            range_stats.append((f"{start}-{end}", avg_appearances, total_appearances))
+        
+        expected_avg = self.store.mains.size / 50
+        
+        text += "Average appearances by number range:\n"
+        for range_name, avg, total in range_stats:
+            deviation = avg - expected_avg
+            bias_indicator = "HIGH" if deviation > expected_avg * 0.1 else "LOW" if deviation < -expected_avg * 0.1 else "NORMAL"
+            text += f"  {range_name}: {avg:.1f} avg ({total} total) - {bias_indicator}\n"
+        
+        # Professional recommendations
+        checkpoint(0.8, "Professional recommendations")
+        text += f"\nPROFESSIONAL RECOMMENDATIONS:\n"
+        text += "=" * 30 + "\n"
+        
+        if wear_candidates:
+            text += "🟡 POTENTIAL EQUIPMENT BIAS DETECTED\n\n"
+            text += "Strategy recommendations:\n"
+            
+            declining_numbers = [x[0] for x in wear_candidates[:5]]
+            text += f"• AVOID (declining): {declining_numbers}\n"
+            
+            if fresh_candidates:
+                rising_numbers = [x[0] for x in fresh_candidates[:5]]
+                text += f"• FAVOR (rising): {rising_numbers}\n"
+            
+            text += f"• Monitor these patterns in future draws\n"
+            text += f"• Consider slight betting weight adjustments\n"
+        else:
+            text += "✅ NO ACTIONABLE WEAR PATTERNS\n\n"
+            text += "Equipment appears to maintain consistent\n"
+            text += "performance across all time periods.\n"
+        
+        return text
+    
+    def machine_bias_report(self):
+        text = Report("MECHANICAL BIAS ANALYSIS\n")
+        text += "=" * 30 + "\n\n"
+        text += "Analyzes systematic biases that could result from\n"
+        text += "mechanical imperfections in the drawing equipment.\n\n"
+        
+        # Position bias analysis (ball position effects)
+        checkpoint(0.17, "Positional bias analysis")
+        text += "POSITIONAL BIAS ANALYSIS:\n"
+        text += "-" * 25 + "\n"
+        
+        # Analyze if certain numbers appear in certain positions more often
+        # Sort numbers to analyze positional bias - 5 positions in main draw
+        sorted_mains = self.store.sorted_mains()
+        position_counts = {pos: counter_from_counts(np.bincount(sorted_mains[:, pos], minlength=51))
+                           for pos in range(5)}
+        
+        # Check for significant positional biases
+        total_draws = len(self.store)
+        expected_pos_freq = total_draws / 50  # Expected frequency per number per position
+        
+        significant_pos_biases = []
+        
+        for pos in range(5):
+            text += f"Position {pos + 1} (sorted order):\n"
+            most_common = position_counts[pos].most_common(5)
+            least_common = position_counts[pos].most_common()[-5:]
+            
+            text += f"  Most common: {[(num, count) for num, count in most_common]}\n"
+            text += f"  Least common: {[(num, count) for num, count in least_common]}\n"
+            
+            # Find numbers with > 50% deviation from expected
+            for number, count in position_counts[pos].items():
+                deviation = abs(count - expected_pos_freq) / expected_pos_freq
+                if deviation > 0.5 and count > 5:  # Must have some activity
+                    significant_pos_biases.append((pos + 1, number, count, deviation))
+        
+        if significant_pos_biases:
+            text += f"\nSIGNIFICANT POSITIONAL BIASES:\n"
+            significant_pos_biases.sort(key=lambda x: x[3], reverse=True)
+            for pos, num, count, deviation in significant_pos_biases[:10]:
+                bias_type = "OVER" if count > expected_pos_freq else "UNDER"
+                text += f"  Position {pos}, Number {num:2d}: {count} times ({deviation:.1%} {bias_type})\n"
+        
+        # Mechanical sequence analysis
+        checkpoint(0.33, "Mechanical sequence patterns")
+        text += f"\n\nMECHANICAL SEQUENCE PATTERNS:\n"
+        text += "-" * 30 + "\n"
+        
+        # Look for numbers that frequently appear together (mechanical clustering)
+        pair_distances = counter_from_counts(self.store.pair_matrix().distance_counts())
+        
+        text += "Number distance frequency (mechanical clustering analysis):\n"
+        expected_distance_freq = len(self.store) * 10 / 49  # Rough expected frequency
+        
+        for distance in sorted(pair_distances.keys())[:20]:
+            count = pair_distances[distance]
+            deviation = (count - expected_distance_freq) / expected_distance_freq if expected_distance_freq > 0 else 0
+            if abs(deviation) > 0.3:  # Significant deviation
+                bias_indicator = "HIGH" if deviation > 0 else "LOW"
+                text += f"  Distance {distance:2d}: {count:3d} pairs ({deviation:+.1%}) - {bias_indicator}\n"
+        
+        # Draw timing analysis (if dates suggest machine maintenance patterns)
+        checkpoint(0.5, "Maintenance cycle analysis")
+        text += f"\nMAINTENANCE CYCLE ANALYSIS:\n"
+        text += "-" * 25 + "\n"
+        
+        # Group draws by month to look for maintenance-related patterns
+        years = self.store.years()
+        month_index = (years - years[0]) * 12 + self.store.months() - 1
+        monthly_totals = np.bincount(month_index, weights=self.analytics.sums())
+        monthly_numbers = np.bincount(month_index) * 5
+        
+        # Calculate monthly averages
+        monthly_averages = {}
+        for index in np.flatnonzero(monthly_numbers >= 10).tolist():  # Need sufficient data
+            month_key = (int(years[0]) + index // 12, index % 12 + 1)
+            monthly_averages[month_key] = monthly_totals[index] / monthly_numbers[index]
+        
+        if len(monthly_averages) > 12:  # Need at least a year of data
+            overall_avg = sum(monthly_averages.values()) / len(monthly_averages)
+            
+            text += f"Monthly average number analysis:\n"
+            text += f"Overall average: {overall_avg:.2f}\n\n"
+            
+            # Find months with significant deviations
+            monthly_deviations = []
+            for month_key, avg in monthly_averages.items():
+                deviation = abs(avg - overall_avg)
+                if deviation > 2:  # Arbitrary threshold
+                    monthly_deviations.append((month_key, avg, deviation))
+            
+            if monthly_deviations:
+                monthly_deviations.sort(key=lambda x: x[2], reverse=True)
+                text += "Months with unusual average numbers:\n"
+                for (year, month), avg, deviation in monthly_deviations[:6]:
+                    text += f"  {year}-{month:02d}: {avg:.2f} (deviation: {deviation:.2f})\n"
+                
+                text += "\nThis could indicate:\n"
+                text += "• Seasonal maintenance schedules\n"
+                text += "• Equipment calibration cycles\n"
+                text += "• Environmental factors (temperature/humidity)\n"
+            else:
+                text += "✅ No significant monthly variations detected.\n"
+        
+        # Sum distribution analysis (mechanical bias indicator)
+        checkpoint(0.67, "Sum distribution analysis")
+        text += f"\nSUM DISTRIBUTION ANALYSIS:\n"
+        text += "-" * 25 + "\n"
+        
+        sums = self.analytics.sums()
+        
+        mean_sum = int(sums.sum()) / len(sums)
+        sum_std = float(((sums - mean_sum) ** 2).mean()) ** 0.5
+        
+        text += f"Sum statistics:\n"
+        text += f"  Mean: {mean_sum:.2f}\n"
+        text += f"  Std Dev: {sum_std:.2f}\n"
+        text += f"  Range: {sums.min()} - {sums.max()}\n"
+        
+        # Expected normal distribution parameters for truly random draws
+        # (This is complex to calculate exactly, so we use approximations)
+        expected_mean = 127.5  # (1+2+...+50)/50 * 5 = 25.5 * 5
+        expected_std = 29.0    # Approximate for 5 numbers from 1-50
+        
+        text += f"\nComparison to expected random distribution:\n"
+        text += f"  Expected mean: {expected_mean}\n"
+        text += f"  Expected std: {expected_std:.1f}\n"
+        text += f"  Mean deviation: {abs(mean_sum - expected_mean):.2f}\n"
+        text += f"  Std deviation: {abs(sum_std - expected_std):.2f}\n"
+        
+        p_sum = self.null_test('sum_mean_deviation')[1]
+        text += f"  Fair histories deviating as far: {p_sum:.1%}\n"
+        
+        # Professional assessment
+        checkpoint(0.83, "Professional assessment")
+        text += f"\nPROFESSIONAL ASSESSMENT:\n"
+        text += "=" * 25 + "\n"
+        
+        bias_score = 0
+        
+        if significant_pos_biases:
+            bias_score += len(significant_pos_biases) * 2
+            text += f"🟡 Positional biases detected ({len(significant_pos_biases)} instances)\n"
+        
+        if p_sum < 0.05:
+            bias_score += 10
+            text += f"🟡 Sum distribution deviation detected\n"
+        
+        if monthly_deviations:
+            bias_score += len(monthly_deviations)
+            text += f"🟡 Temporal maintenance patterns detected\n"
+        
+        text += f"\nOverall bias score: {bias_score}\n"
+        
+        if bias_score > 15:
+            text += "🔴 SIGNIFICANT MECHANICAL BIAS DETECTED\n"
+            text += "• Strong evidence of equipment irregularities\n"
+            text += "• Potential advantage play opportunity\n"
+            text += "• Recommend detailed monitoring and exploitation\n"
+        elif bias_score > 5:
+            text += "🟡 MINOR MECHANICAL IRREGULARITIES\n"
+            text += "• Some evidence of equipment bias\n"
+            text += "• Worth monitoring for patterns\n"
+            text += "• Consider light betting adjustments\n"
+        else:
+            text += "✅ MECHANICAL SYSTEM APPEARS FAIR\n"
+            text += "• No significant bias detected\n"
+            text += "• Equipment operating within normal parameters\n"
+            text += "• Random distribution maintained\n"
+        
+        return text
+    
+    def seasonal_effects_report(self):
+        text = Report("SEASONAL & ENVIRONMENTAL EFFECTS ANALYSIS\n")
+        text += "=" * 45 + "\n\n"
+        text += "Analyzes how environmental factors might affect\n"
+        text += "ball behavior and drawing equipment performance.\n\n"
+        
+        # Seasonal grouping
+        months = self.store.months()
+        seasonal_data = {
+            'Spring': self.store.take(np.isin(months, [3, 4, 5])),
+            'Summer': self.store.take(np.isin(months, [6, 7, 8])),
+            'Autumn': self.store.take(np.isin(months, [9, 10, 11])),
+            'Winter': self.store.take(np.isin(months, [12, 1, 2]))
+        }
+        
+        checkpoint(0.14, "Seasonal distribution")
+        text += "SEASONAL DISTRIBUTION:\n"
+        text += "-" * 20 + "\n"
+        for season, draws in seasonal_data.items():
+            text += f"{season:8s}: {len(draws):4d} draws\n"
+        
+        checkpoint(0.29, "Seasonal statistical analysis")
+        text += "\nSEASONAL STATISTICAL ANALYSIS:\n"
+        text += "-" * 30 + "\n"
+        
+        seasonal_stats = {}
+        
+        for season, draws in seasonal_data.items():
+            if len(draws) > 10:  # Need sufficient data
+                season_numbers = draws.mains.ravel()
+                season_sums = draws.sums()
+                season_odds = int(draws.odd_counts().sum())
+                
+                avg_sum = int(season_sums.sum()) / len(season_sums)
+                avg_odd_ratio = season_odds / (len(draws) * 5)
+                
+                # Most/least frequent numbers this season
+                season_counter = draws.main_counter()
+                most_frequent = season_counter.most_common(5)
+                least_frequent = season_counter.most_common()[-5:]
+                
+                seasonal_stats[season] = {
+                    'avg_sum': avg_sum,
+                    'avg_odd_ratio': avg_odd_ratio,
+                    'most_frequent': most_frequent,
+                    'least_frequent': least_frequent,
+                    'total_numbers': len(season_numbers)
+                }
+                
+                text += f"{season}:\n"
+                text += f"  Average sum: {avg_sum:.2f}\n"
+                text += f"  Odd number ratio: {avg_odd_ratio:.3f}\n"
+                text += f"  Most frequent: {[f'{num}({count})' for num, count in most_frequent]}\n"
+                text += f"  Least frequent: {[f'{num}({count})' for num, count in least_frequent]}\n\n"
+        
+        # Environmental effect analysis
+        checkpoint(0.43, "Environmental bias detection")
+        text += "ENVIRONMENTAL BIAS DETECTION:\n"
+        text += "-" * 30 + "\n"
+        
+        if len(seasonal_stats) >= 4:
+            # Compare seasonal averages
+            sum_values = [stats['avg_sum'] for stats in seasonal_stats.values()]
+            odd_values = [stats['avg_odd_ratio'] for stats in seasonal_stats.values()]
+            
+            sum_range = max(sum_values) - min(sum_values)
+            odd_range = max(odd_values) - min(odd_values)
+            
+            text += f"Seasonal variation ranges:\n"
+            text += f"  Sum range: {sum_range:.2f}\n"
+            text += f"  Odd ratio range: {odd_range:.3f}\n"
+            
+            # Flag significant seasonal effects
+            seasonal_effects = []
+            
+            if sum_range > 5:
+                seasonal_effects.append("Significant sum variation between seasons")
+                
+            if odd_range > 0.1:
+                seasonal_effects.append("Significant odd/even ratio variation")
+            
+            # Find season with most extreme values
+            max_sum_season = max(seasonal_stats.items(), key=lambda x: x[1]['avg_sum'])
+            min_sum_season = min(seasonal_stats.items(), key=lambda x: x[1]['avg_sum'])
+            
+            text += f"\nExtreme seasons:\n"
+            text += f"  Highest sums: {max_sum_season[0]} ({max_sum_season[1]['avg_sum']:.2f})\n"
+            text += f"  Lowest sums: {min_sum_season[0]} ({min_sum_season[1]['avg_sum']:.2f})\n"
+            
+            if seasonal_effects:
+                text += f"\n⚠️  SEASONAL EFFECTS DETECTED:\n"
+                for effect in seasonal_effects:
+                    text += f"• {effect}\n"
+            else:
+                text += f"\n✅ No significant seasonal effects detected.\n"
+        
+        # Temperature correlation analysis (speculative)
+        checkpoint(0.57, "Temperature correlation analysis")
+        text += f"\nTEMPERATURE CORRELATION ANALYSIS:\n"
+        text += "-" * 35 + "\n"
+        text += "Analyzing potential temperature effects on equipment...\n\n"
+        
+        # Group by month for finer temperature analysis
+        all_sums = self.analytics.sums()
+        monthly_data = {month: all_sums[months == month].tolist() for month in range(1, 13)
+                        if (months == month).any()}
+        
+        # Approximate temperature correlation (Northern hemisphere assumption)
+        temp_months = {
+            1: 0, 2: 2, 3: 8, 4: 15, 5: 20, 6: 25,    # Winter to Spring
+            7: 28, 8: 27, 9: 22, 10: 15, 11: 8, 12: 2  # Summer to Winter
+        }
+        
+        if len(monthly_data) >= 12:
+            correlation_data = []
+            for month, sums in monthly_data.items():
+                if len(sums) >= 5:  # Need sufficient data
+                    avg_sum = sum(sums) / len(sums)
+                    approx_temp = temp_months[month]
+                    correlation_data.append((approx_temp, avg_sum))
+            
+            if len(correlation_data) >= 6:
+                # Simple correlation calculation
+                n = len(correlation_data)
+                temp_vals = [x[0] for x in correlation_data]
+                sum_vals = [x[1] for x in correlation_data]
+                
+                temp_mean = sum(temp_vals) / n
+                sum_mean = sum(sum_vals) / n
+                
+                numerator = sum((t - temp_mean) * (s - sum_mean) for t, s in correlation_data)
+                denom_temp = sum((t - temp_mean) ** 2 for t in temp_vals) ** 0.5
+                denom_sum = sum((s - sum_mean) ** 2 for s in sum_vals) ** 0.5
+                
+                if denom_temp > 0 and denom_sum > 0:
+                    correlation = numerator / (denom_temp * denom_sum)
+                    
+                    text += f"Temperature-Sum correlation: {correlation:+.3f}\n"
+                    
+                    if abs(correlation) > 0.3:
+                        effect_type = "positive" if correlation > 0 else "negative"
+                        text += f"⚠️  Moderate {effect_type} temperature correlation detected!\n"
+                        text += f"This suggests:\n"
+                        text += f"• Air density effects on ball behavior\n"
+                        text += f"• Thermal expansion of equipment\n"
+                        text += f"• Humidity correlation effects\n"
+                    else:
+                        text += f"✅ No significant temperature correlation.\n"
+        
+        # Holiday effects analysis
+        checkpoint(0.71, "Holiday & special date analysis")
+        text += f"\nHOLIDAY & SPECIAL DATE ANALYSIS:\n"
+        text += "-" * 35 + "\n"
+        
+        # Check draws around major holidays (Christmas, New Year, etc.)
+        days = self.store.days()
+        
+        # Christmas/New Year period
+        holiday_periods = ((months == 12) & (days >= 20)) | ((months == 1) & (days <= 10))
+        
+        # Check for special dates (could be maintenance periods) - New Year's Day and Christmas
+        special_draws = ((months == 1) & (days == 1)) | ((months == 12) & (days == 25))
+        
+        text += f"Holiday period draws: {int(holiday_periods.sum())}\n"
+        text += f"Special date draws: {int(special_draws.sum())}\n"
+        
+        if holiday_periods.sum() > 10:
+            holiday_sums = all_sums[holiday_periods]
+            regular_sums = all_sums[~holiday_periods]
+            
+            holiday_avg = int(holiday_sums.sum()) / len(holiday_sums)
+            regular_avg = int(regular_sums.sum()) / len(regular_sums)
+            
+            text += f"Holiday period average sum: {holiday_avg:.2f}\n"
+            text += f"Regular period average sum: {regular_avg:.2f}\n"
+            text += f"Difference: {abs(holiday_avg - regular_avg):.2f}\n"
+            
+            if abs(holiday_avg - regular_avg) > 3:
+                text += f"⚠️  Significant holiday effect detected!\n"
+                text += f"Possible causes:\n"
+                text += f"• Reduced maintenance during holidays\n"
+                text += f"• Different staff operating equipment\n"
+                text += f"• Environmental changes (heating/cooling)\n"
+        
+        # Professional recommendations
+        checkpoint(0.86, "Professional strategy recommendations")
+        text += f"\nPROFESSIONAL STRATEGY RECOMMENDATIONS:\n"
+        text += "=" * 40 + "\n"
+        
+        if seasonal_effects or abs(correlation) > 0.3 if 'correlation' in locals() else False:
+            text += f"🟡 ENVIRONMENTAL EFFECTS DETECTED\n\n"
+            
+            # Seasonal strategy
+            current_month = datetime.now().month
+            current_season = None
+            if current_month in [3, 4, 5]:
+                current_season = 'Spring'
+            elif current_month in [6, 7, 8]:
+                current_season = 'Summer'
+            elif current_month in [9, 10, 11]:
+                current_season = 'Autumn'
+            else:
+                current_season = 'Winter'
+            
+            if current_season in seasonal_stats:
+                current_stats = seasonal_stats[current_season]
+                text += f"Current season ({current_season}) strategy:\n"
+                
+                if current_stats['avg_sum'] > 130:
+                    text += f"• Favor higher numbers (season tends toward high sums)\n"
+                elif current_stats['avg_sum'] < 125:
+                    text += f"• Favor lower numbers (season tends toward low sums)\n"
+                
+                if current_stats['avg_odd_ratio'] > 0.52:
+                    text += f"• Slightly favor odd numbers this season\n"
+                elif current_stats['avg_odd_ratio'] < 0.48:
+                    text += f"• Slightly favor even numbers this season\n"
+                
+                # Seasonal hot numbers
+                seasonal_hot = [num for num, count in current_stats['most_frequent']]
+                text += f"• Consider seasonal hot numbers: {seasonal_hot}\n"
+            
+        else:
+            text += f"✅ NO SIGNIFICANT ENVIRONMENTAL BIAS\n\n"
+            text += f"Environmental factors do not appear to\n"
+            text += f"significantly affect the lottery equipment.\n"
+            text += f"Stick to mathematical strategies.\n"
+        
+        return text
+    
+    def anomalies_report(self):
+        text = Report("COMPREHENSIVE ANOMALY DETECTION\n")
+        text += "=" * 40 + "\n\n"
+        text += "Advanced statistical analysis to detect any\n"
+        text += "unusual patterns or systematic biases.\n\n"
+        
+        # Statistics checked in each category; the windowed ones need enough history
+        window_size = 100
+        recent_window = 50
+        categories = {
+            "Frequency": ['max_z_main'],
+            "Sequential": ['sequential_draws'],
+            "Distribution": ['sum_skewness', 'sum_kurtosis'],
+            "Temporal Clustering": ['recent_cluster'] if len(self.store) >= recent_window else [],
+            "Cross-correlation": ['max_pair'],
+            "Equipment Signature": (['sum_trend'] if len(self.store) >= window_size * 2 else []) + ['position_variance'],
+        }
+        tests_run = sum(len(tests) for tests in categories.values())
+        
+        # Empirical p-value of each statistic against fair histories of this length,
+        # Bonferroni-corrected for the number of statistics checked
+        anomalies_detected = []
+        test_p_values = {}
+        
+        def corrected(p):
+            return min(1.0, p * tests_run)
+        
+        def fair_share(test, label):
+            observed, p = self.null_test(test)
+            test_p_values[test] = p
+            return f"{label}: {observed:.4g} (fair histories as extreme: {p:.1%}, corrected: {corrected(p):.1%})\n"
+        
+        def verdict(category, found, clear):
+            if min(corrected(test_p_values[test]) for test in categories[category]) < ANOMALY_SIGNIFICANCE:
+                anomalies_detected.append(category)
+                return f"🔴 {found}\n"
+            return f"✅ {clear}\n"
+        
+        def beyond_chance(test, value):
+            # Single values measured against the null of the category's maximum
+            return corrected(p_value(self.null_distribution(test), value)) < ANOMALY_SIGNIFICANCE
+        
+        # 1. Frequency anomaly detection
+        checkpoint(0.14, "Frequency anomaly detection")
+        text += "1. FREQUENCY ANOMALY DETECTION:\n"
+        text += "-" * 35 + "\n"
+        
+        main_counter = self.analytics.main_counter()
+        expected_freq = self.store.mains.size / 50
+        
+        frequency_scores = []
+        for num in range(1, 51):
+            observed = main_counter.get(num, 0)
+            # Z-score for frequency
+            z_score = (observed - expected_freq) / (expected_freq ** 0.5)
+            frequency_scores.append((num, observed, z_score))
+        frequency_scores.sort(key=lambda x: -abs(x[2]))
+        
+        text += f"Largest frequency deviations:\n"
+        for num, obs, z in frequency_scores[:5]:
+            direction = "OVER" if z > 0 else "UNDER"
+            text += f"  Number {num:2d}: {obs} times (z={z:+.2f}) - {direction}\n"
+        text += fair_share('max_z_main', "Largest |z|")
+        text += verdict("Frequency", "Frequency deviations beyond chance.", "No extreme frequency anomalies detected.")
+        
+        # 2. Sequential anomaly detection
+        checkpoint(0.29, "Sequential pattern anomalies")
+        text += f"\n2. SEQUENTIAL PATTERN ANOMALIES:\n"
+        text += "-" * 35 + "\n"
+        
+        # Look for impossible or highly improbable sequences
+        sequential_patterns = []
+        
+        sorted_mains = self.store.sorted_mains().astype(np.int64)
+        gaps = np.diff(sorted_mains, axis=1)
+        last_digits = sorted_mains % 10
+        
+        # Perfect sequences (e.g., 1,2,3,4,5), wider arithmetic progressions
+        # (consecutive runs are already caught) and repeated last digits
+        is_consecutive = (gaps == 1).all(axis=1)
+        is_progression = (gaps == gaps[:, :1]).all(axis=1) & (gaps[:, 0] > 1)
+        same_last_digit = (last_digits == last_digits[:, :1]).all(axis=1)
+        
+        flagged = is_consecutive | is_progression | same_last_digit
+        for i in np.flatnonzero(flagged).tolist():
+            sorted_nums = sorted_mains[i].tolist()
+            draw_date = self.store.date_at(i)
+            if is_consecutive[i]:
+                sequential_patterns.append(("Perfect consecutive", i, draw_date, sorted_nums))
+            if is_progression[i]:
+                sequential_patterns.append(("Arithmetic progression", i, draw_date, sorted_nums))
+            if same_last_digit[i]:
+                sequential_patterns.append(("Same last digit", i, draw_date, sorted_nums))
+        
+        if sequential_patterns:
+            text += f"Patterned draws found:\n"
+            for pattern_type, draw_idx, date, numbers in sequential_patterns:
+                text += f"  {date.strftime('%Y-%m-%d')}: {numbers} - {pattern_type}\n"
+        text += fair_share('sequential_draws', "Patterned draws")
+        text += verdict("Sequential", "More patterned draws than chance allows.", "No sequential anomalies detected.")
+        
+        # 3. Statistical distribution anomalies
+        checkpoint(0.43, "Distribution anomalies")
+        text += f"\n3. DISTRIBUTION ANOMALIES:\n"
+        text += "-" * 25 + "\n"
+        
+        sums = self.analytics.sums()
+        
+        # Kolmogorov-Smirnov-like test for normality
+        mean_sum = int(sums.sum()) / len(sums)
+        deviations = sums - mean_sum
+        sum_variance = float((deviations ** 2).mean())
+        sum_std = sum_variance ** 0.5
+        
+        # Check for distribution shape anomalies
+        skewness_sum = float((deviations ** 3).sum()) / (len(sums) * sum_std ** 3)
+        kurtosis_sum = float((deviations ** 4).sum()) / (len(sums) * sum_std ** 4) - 3
+        
+        text += f"Sum distribution analysis:\n"
+        text += f"  Mean: {mean_sum:.2f}\n"
+        text += f"  Std Dev: {sum_std:.2f}\n"
+        text += f"  Skewness: {skewness_sum:.3f}\n"
+        text += f"  Kurtosis: {kurtosis_sum:.3f}\n"
+        text += fair_share('sum_skewness', "|Skewness|")
+        text += fair_share('sum_kurtosis', "|Kurtosis|")
+        text += verdict("Distribution", "Sum distribution shape beyond chance.", "Distribution appears normal.")
+        
+        # 4. Temporal clustering anomalies
+        checkpoint(0.57, "Temporal clustering analysis")
+        text += f"\n4. TEMPORAL CLUSTERING ANALYSIS:\n"
+        text += "-" * 35 + "\n"
+        
+        # Look for numbers that cluster in time
+        recent_counts = []
+        if categories["Temporal Clustering"]:
+            recent_counter = counter_from_counts(self.store.rolling_windows().window(recent_window)['main_counts'])
+            expected_recent = recent_window * 5 / 50  # Expected appearances in recent window
+            recent_counts = recent_counter.most_common()
+            
+            text += f"Most frequent in the last {recent_window} draws:\n"
+            for num, count in recent_counts[:5]:
+                text += f"  Number {num:2d}: {count} times (expected: {expected_recent:.1f})\n"
+            text += fair_share('recent_cluster', "Most recent appearances")
+            text += verdict("Temporal Clustering", "Recent clustering beyond chance.", "No significant temporal clustering.")
+        else:
+            text += f"Needs at least {recent_window} draws.\n"
+        
+        # 5. Cross-correlation anomalies
+        checkpoint(0.71, "Cross-correlation anomalies")
+        text += f"\n5. CROSS-CORRELATION ANOMALIES:\n"
+        text += "-" * 35 + "\n"
+        
+        # Look for numbers that appear together more often than chance
+        expected_pair_freq = self.store.pair_matrix().expected('main')  # Expected pair frequency
+        top_pairs = self.analyze_number_pairs()
+        
+        text += f"Most frequent number pairs:\n"
+        for pair, count in top_pairs[:5]:
+            text += f"  {pair[0]}-{pair[1]}: {count} times (expected: {expected_pair_freq:.1f})\n"
+        text += fair_share('max_pair', "Most frequent pair")
+        text += verdict("Cross-correlation", "Pair co-occurrence beyond chance.", "No unusual number correlations.")
+        
+        # 6. Equipment signature detection
+        checkpoint(0.86, "Equipment signature detection")
+        text += f"\n6. EQUIPMENT SIGNATURE DETECTION:\n"
+        text += "-" * 35 + "\n"
+        
+        # Signature 1: Consistent sum drift over time
+        if 'sum_trend' in categories["Equipment Signature"]:
+            text += fair_share('sum_trend', "|Sum trend|")
+        
+        # Signature 2: Mechanical position preference (one sorted position less variable than the rest)
+        position_variance = sorted_mains.var(axis=0)
+        text += f"Sorted position variances: {', '.join(f'{var:.1f}' for var in position_variance.tolist())}\n"
+        text += fair_share('position_variance', "Position variance shortfall")
+        text += verdict("Equipment Signature", "Equipment signatures beyond chance.", "No equipment signatures detected.")
+        
+        # FINAL ASSESSMENT
+        text += f"\n" + "=" * 50 + "\n"
+        text += f"COMPREHENSIVE ANOMALY ASSESSMENT\n"
+        text += f"=" * 50 + "\n\n"
+        
+        if anomalies_detected:
+            text += f"🔴 ANOMALIES DETECTED: {len(anomalies_detected)} categories\n\n"
+            text += f"Anomaly categories found (corrected p-value):\n"
+            for i, anomaly_type in enumerate(anomalies_detected, 1):
+                smallest = min(corrected(test_p_values[test]) for test in categories[anomaly_type])
+                text += f"{i}. {anomaly_type} ({smallest:.4f})\n"
+            
+            text += f"\n🎯 ADVANTAGE PLAY RECOMMENDATIONS:\n"
+            text += f"=" * 35 + "\n"
+            
+            if "Frequency" in anomalies_detected:
+                extreme = [(num, z) for num, obs, z in frequency_scores if beyond_chance('max_z_main', abs(z))]
+                extreme_over = sorted(num for num, z in extreme if z > 0)
+                extreme_under = sorted(num for num, z in extreme if z < 0)
+                if extreme_over:
+                    text += f"• FAVOR (over-performing): {extreme_over}\n"
+                if extreme_under:
+                    text += f"• AVOID (under-performing): {extreme_under}\n"
+            
+            if "Temporal Clustering" in anomalies_detected:
+                hot_clusters = [num for num, count in recent_counts if beyond_chance('recent_cluster', count)]
+                text += f"• CURRENT HOT CLUSTER: {hot_clusters}\n"
+            
+            if "Cross-correlation" in anomalies_detected:
+                pairs = [f"{pair[0]}-{pair[1]}" for pair, count in top_pairs if beyond_chance('max_pair', count)]
+                text += f"• PAIR TOGETHER: {pairs[:3]}\n"
+            
+            # Chance a fair history is this extreme on its most extreme statistic
+            smallest = min(test_p_values.values())
+            combined = corrected(smallest)
+            confidence = (1 - combined) * 100
+            text += f"\nSmallest p-value: {smallest:.4f} of {tests_run} tests "
+            text += f"(corrected: {combined:.4f})\n"
+            text += f"\n⚠️  CONFIDENCE LEVEL: "
+            if combined < 0.01:
+                text += f"HIGH ({confidence:.1f}%) - Strong evidence of exploitable bias\n"
+            else:
+                text += f"MEDIUM ({confidence:.1f}%) - Moderate evidence, proceed with caution\n"
+            
+        else:
+            text += f"✅ NO SIGNIFICANT ANOMALIES DETECTED\n\n"
+            text += f"No statistic is more extreme than fair histories of\n"
+            text += f"this length allow at the {ANOMALY_SIGNIFICANCE:.0%} level, corrected for\n"
+            text += f"the {tests_run} tests run. The EuroMillions lottery appears\n"
+            text += f"to be operating with proper randomness and fairness.\n\n"
+            text += f"RECOMMENDATION: Stick to mathematical strategies\n"
+            text += f"rather than attempting to exploit non-existent biases.\n"
+        
+        return text
+
+
+def parse_numbers(text, count, highest, label):
+    """List of ``count`` distinct numbers from 1 to ``highest`` in comma-separated ``text``"""
+    numbers = [int(part) for part in text.split(',')]
+    if len(numbers) != count or len(set(numbers)) != count or not all(1 <= num <= highest for num in numbers):
+        raise ValueError("expected {} distinct {} between 1 and {}".format(count, label, highest))
+    return numbers
+
+
+_worker = None
+
+
+def _init_worker(cache, saved_numbers, ticket, seed, null_cache, simulations, null_values=None):
+    global _worker
+    nulls = NullDistributions(simulations, path=null_cache)
+    if null_values is not None:
+        nulls.preload(*null_values)
+    _worker = (AnalysisCore(load_store(cache), nulls), saved_numbers, ticket, seed)
+
+
+def _run_report(name):
+    """(name, text, None), or (name, None, error message) if the report failed"""
+    core, saved_numbers, ticket, seed = _worker
+    if seed is not None:
+        random.seed(seed)
+    try:
+        return name, str(core.report(name, saved_numbers, ticket)), None
+    except Exception as e:
+        return name, None, str(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('reports', nargs='*', default=['all'],
+                        help="reports to run, or 'all' (the default); see --list")
+    parser.add_argument('--list', action='store_true', help="list the available reports and exit")
+    parser.add_argument('--cache', default="euromillions_data_cache.bin",
+                        help="binary draw cache, or a .sqlite3 database, written by the analyser")
+    parser.add_argument('--saved', default="saved_numbers.json", help="saved number sets for saved_sets")
+    parser.add_argument('--numbers', help="five main numbers for your_numbers, e.g. 3,7,19,23,44")
+    parser.add_argument('--stars', help="two lucky stars for your_numbers, e.g. 2,9")
+    parser.add_argument('--seed', type=int, help="random seed for the number generators")
+    parser.add_argument('--output-dir', help="write each report to <name>.txt here instead of stdout")
+    parser.add_argument('--jobs', type=int, default=1, help="reports to run in parallel processes")
+    parser.add_argument('--null-cache', default="euromillions_null_cache.npz",
+                        help="file keeping the simulated null distributions of the bias tests")
+    parser.add_argument('--simulations', type=int, default=SIMULATIONS,
+                        help="fair histories simulated for each bias test's null distribution")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (title, method) in REPORTS.items():
+            print("{:24} {}".format(name, title))
+        return
+
+    names = list(REPORTS) if 'all' in args.reports else args.reports
+    unknown = [name for name in names if name not in REPORTS]
+    if unknown:
+        parser.error("unknown report(s): {}; see --list".format(', '.join(unknown)))
+
+    ticket = None
+    if args.numbers or args.stars:
+        try:
+            ticket = (parse_numbers(args.numbers or '', 5, 50, "main numbers"),
+                      parse_numbers(args.stars or '', 2, 12, "lucky stars"))
+        except ValueError as e:
+            parser.error(str(e))
+    saved_numbers = load_saved_numbers(args.saved)
+
+    # Reports that need input nobody gave are left out of 'all' and refused by name
+    if ticket is None:
+        if 'all' not in args.reports and 'your_numbers' in names:
+            parser.error("your_numbers needs --numbers and --stars")
+        names = [name for name in names if name != 'your_numbers']
+    if not saved_numbers and 'saved_sets' in names:
+        if 'all' not in args.reports:
+            parser.error("no saved number sets in {}".format(args.saved))
+        names.remove('saved_sets')
+
+    store = load_store(args.cache)
+    if not len(store):
+        parser.error("no draws in {}; download data in the analyser first".format(args.cache))
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    null_values = None
+    if args.jobs > 1 and any(name in NULL_TESTED_REPORTS for name in names):
+        # Simulated once here and handed to the workers, rather than by each of them
+        nulls = NullDistributions(args.simulations, path=args.null_cache)
+        null_values = (len(store), nulls.distributions(len(store)))
+
+    initargs = (args.cache, saved_numbers, ticket, args.seed, args.null_cache, args.simulations, null_values)
+    if args.jobs > 1:
+        pool = multiprocessing.Pool(args.jobs, initializer=_init_worker, initargs=initargs)
+        results = pool.imap(_run_report, names)
+    else:
+        pool = None
+        _init_worker(*initargs)
+        results = map(_run_report, names)
+
+    failed = 0
+    try:
+        for name, text, error in results:
+            if error is not None:
+                print("{} failed: {}".format(name, error), file=sys.stderr)
+                failed = 1
+            elif args.output_dir:
+                path = os.path.join(args.output_dir, name + ".txt")
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                print("Wrote {}".format(path))
+            else:
+                print(text)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    sys.exit(failed)
+
+
+if __name__ == "__main__":
+    main()
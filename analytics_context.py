@@ -0,0 +1,116 @@
+import copy
+import functools
+import threading
+
+import numpy as np
+
+
+def memoized(name):
+    """Cache a no-argument analyser method in its ``analytics`` context under ``name``"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            return self.analytics.get(name, lambda: method(self))
+        return wrapper
+    return decorator
+
+
+class AnalyticsContext:
+    """Memoized statistics derived from the current draw store.
+
+    ``get_store`` returns the store the statistics describe. Cached tables
+    are kept until that store is replaced or appended to (its version
+    changes) or invalidate() is called. ``hits`` and ``misses`` count
+    lookups, so stale or thrashing caches show up.
+
+    Safe to share between threads: values are computed outside the lock,
+    and one whose store changed or whose cache was invalidated while it
+    was being computed is returned but not kept. Cached arrays are
+    read-only and other values are handed out as copies, so callers can't
+    change what the next caller sees.
+    """
+
+    def __init__(self, get_store):
+        self.get_store = get_store
+        self.hits = 0
+        self.misses = 0
+        self._tables = {}
+        self._key = None
+        # Bumped whenever the tables are dropped, so values computed before then aren't kept
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Drop every cached table"""
+        with self._lock:
+            self._tables = {}
+            self._key = None
+            self._generation += 1
+
+    def _store_key(self):
+        store = self.get_store()
+        # Hold the store itself rather than its id, so a new store can't reuse a stale key
+        return (store, store.version, len(store))
+
+    def _same_key(self, key):
+        return self._key is not None and self._key[0] is key[0] and self._key[1:] == key[1:]
+
+    def get(self, name, compute):
+        """Cached value of ``name``, computing it with ``compute()`` on a miss"""
+        key = self._store_key()
+        with self._lock:
+            if not self._same_key(key):
+                self._tables = {}
+                self._key = key
+                self._generation += 1
+            if name in self._tables:
+                self.hits += 1
+                return _shared(self._tables[name])
+            self.misses += 1
+            generation = self._generation
+
+        value = compute()
+        if hasattr(value, 'setflags'):
+            # Shared between callers, so guard cached arrays against in-place edits
+            value.setflags(write=False)
+
+        with self._lock:
+            if self._generation == generation and self._same_key(self._store_key()):
+                # Another thread may have stored the same table meanwhile; keep the first
+                value = self._tables.setdefault(name, value)
+        return _shared(value)
+
+    def stats(self):
+        with self._lock:
+            tables = len(self._tables)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'tables': tables,
+            'hit_rate': self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+        }
+
+    # Tables read straight off the store
+
+    def main_counter(self):
+        return self.get('main_counter', lambda: self.get_store().main_counter())
+
+    def star_counter(self):
+        return self.get('star_counter', lambda: self.get_store().star_counter())
+
+    def main_counts(self):
+        return self.get('main_counts', lambda: self.get_store().main_counts())
+
+    def sums(self):
+        return self.get('sums', lambda: self.get_store().sums())
+
+    def odd_counts(self):
+        return self.get('odd_counts', lambda: self.get_store().odd_counts())
+
+    def last_seen(self, kind='main'):
+        return self.get(('last_seen', kind), lambda: self.get_store().last_seen(kind))
+
+
+def _shared(value):
+    """``value`` as handed to a caller: cached arrays are read-only already, anything else is copied"""
+    return value if isinstance(value, np.ndarray) else copy.deepcopy(value)
@@ -0,0 +1,110 @@
+import numpy as np
+
+# Lags scanned by the autocorrelation report
+DEFAULT_MAX_LAG = 200
+
+# Columns transformed at once; bounds the memory of one pass
+_FFT_COLUMNS = 8
+
+
+def _fft_size(length):
+    size = 1
+    while size < length:
+        size *= 2
+    return size
+
+
+def lagged_products(values, max_lag):
+    """(max_lag + 1, columns) sums of values[t] * values[t + k] over t, for each lag k.
+
+    ``values`` is an (n, columns) array. The history is cut into blocks and
+    each block is correlated, by FFT, with itself and the ``max_lag`` values
+    after it, so every lag comes out of one pass whose transforms are sized
+    by ``max_lag`` rather than by the length of the history.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n, columns = values.shape
+    size = _fft_size(8 * (max_lag + 1))
+    block = size - max_lag
+    blocks = max(-(-n // block), 1)
+
+    products = np.zeros((max_lag + 1, columns))
+    for start in range(0, columns, _FFT_COLUMNS):
+        chunk = values[:, start:start + _FFT_COLUMNS].T
+        padded = np.zeros((len(chunk), (blocks + 1) * block + max_lag))
+        padded[:, :n] = chunk
+        heads = padded[:, :blocks * block].reshape(len(chunk), blocks, block)
+        # Each block followed by the max_lag values after it
+        windows = np.lib.stride_tricks.sliding_window_view(padded, block + max_lag, axis=1)[:, :blocks * block:block]
+        spectrum = np.fft.rfft(windows, n=size, axis=2) * np.fft.rfft(heads, n=size, axis=2).conj()
+        products[:, start:start + _FFT_COLUMNS] = np.fft.irfft(spectrum, n=size, axis=2)[:, :, :max_lag + 1].sum(axis=1).T
+    return products
+
+
+def series_acf(values, max_lag):
+    """Sample autocorrelation of each column of (n, columns) ``values`` at lags 0 to ``max_lag``.
+
+    Uses the full-sample mean and variance (the standard biased estimator);
+    columns that never vary get 0 at every lag.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    centred = values - values.mean(axis=0)
+    products = lagged_products(centred, max_lag)
+    variance = products[0]
+    return np.divide(products, variance, out=np.zeros_like(products), where=variance > 0)
+
+
+def overlap_distribution(drawn, pool):
+    """Mean and variance of the balls two independent draws of ``drawn`` from ``pool`` share"""
+    mean = drawn * drawn / pool
+    variance = drawn * (drawn / pool) * (1 - drawn / pool) * (pool - drawn) / (pool - 1)
+    return mean, variance
+
+
+def autocorrelation(indicator, max_lag, drawn=5, z=1.96):
+    """Overlap and per-number autocorrelation of a 0/1 draw indicator matrix at lags 1 to ``max_lag``.
+
+    ``indicator`` is (n, balls + 1) with column 0 unused, as returned by
+    DrawStore.indicator_matrix(); ``drawn`` balls are drawn each time.
+    Returns a dict of arrays indexed by lag - 1:
+
+    - ``overlap``: mean balls shared by draws ``lag`` apart, with ``pairs``
+      compared, ``expected_overlap`` under independence and a ``z``-sigma
+      ``overlap_band`` half-width around it
+    - ``acf``: (max_lag, balls + 1) autocorrelation of each ball's 0/1
+      series, 0 for column 0, outside ±``acf_band`` when significant
+    """
+    indicator = np.asarray(indicator)
+    n, width = indicator.shape
+    lags = np.arange(1, max_lag + 1)
+    pairs = np.maximum(n - lags, 0)
+
+    products = lagged_products(indicator, max_lag)
+    shared = np.rint(products[1:]).astype(np.int64).sum(axis=1)
+    expected, variance = overlap_distribution(drawn, width - 1)
+
+    # Centre the raw products with each column's mean: the pairs at lag k cover
+    # all but the last k values on one side and all but the first k on the other
+    totals = indicator.sum(axis=0, dtype=np.float64)
+    means = totals / max(n, 1)
+    edge = min(max_lag, n)
+    first = np.tile(totals, (max_lag + 1, 1))
+    last = first.copy()
+    first[:edge + 1] = 0
+    last[:edge + 1] = 0
+    np.cumsum(indicator[:edge], axis=0, out=first[1:edge + 1])
+    np.cumsum(indicator[n - edge:][::-1], axis=0, out=last[1:edge + 1])
+    first, last = first[1:], last[1:]
+    centred = products[1:] - means * (2 * totals - first - last) + pairs[:, None] * means ** 2
+    spread = products[0] - n * means ** 2
+    acf = np.divide(centred, spread, out=np.zeros_like(centred), where=spread > 1e-9)
+    return {
+        'lags': lags,
+        'pairs': pairs,
+        'shared': shared,
+        'overlap': np.divide(shared, pairs, out=np.zeros(max_lag), where=pairs > 0),
+        'expected_overlap': expected,
+        'overlap_band': np.divide(z * variance ** 0.5, np.sqrt(pairs), out=np.full(max_lag, np.inf), where=pairs > 0),
+        'acf': acf,
+        'acf_band': z / n ** 0.5 if n else np.inf
+    }
@@ -0,0 +1,220 @@
+"""Walk-forward backtest of the smart-number strategies.
+
+At every draw from --start on, each strategy sees only the draws before it,
+generates --tickets tickets, and they are scored against that draw. The
+strategies' statistics are carried forward one draw at a time rather than
+recomputed, and the history is split into time slices across a
+multiprocessing pool. A uniformly random baseline is played alongside.
+
+    python backtest.py --tickets 10 --start 100 --output backtest.csv
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import random
+import time
+from math import comb
+
+import numpy as np
+
+from analysis_core import load_store
+from match_kernel import PRIZE_TIERS, PRIZE_NAMES, PRIZE_POINTS, balls_to_masks, popcount, prize_tiers
+from strategies import BASELINE, STRATEGIES, StrategyStats, random_ticket
+
+# Draws walked by one task
+SLICE_STEPS = 250
+
+_POINTS = np.array(PRIZE_POINTS, dtype=np.int64)
+
+_worker_draws = None
+
+
+def _init_worker(dates, mains, stars):
+    global _worker_draws
+    _worker_draws = (dates, mains, stars)
+
+
+def strategy_function(name):
+    return random_ticket if name == BASELINE else STRATEGIES[name][1]
+
+
+def tier_probabilities():
+    """Chance of a uniformly random ticket hitting each tier of PRIZE_TIERS"""
+    return np.array([comb(5, mains) * comb(45, 5 - mains) / comb(50, 5) * comb(2, stars) * comb(10, 2 - stars) / comb(12, 2)
+                     for mains, stars in PRIZE_TIERS])
+
+
+def backtest_slice(task):
+    """(start, {strategy: (draws, tiers) hits}) for the draws [start, stop)"""
+    start, stop, names, tickets, seed = task
+    dates, mains, stars = _worker_draws
+    stats = StrategyStats(dates[:start], mains[:start], stars[:start])
+    functions = [strategy_function(name) for name in names]
+
+    played_mains = [[] for name in names]
+    played_stars = [[] for name in names]
+    rng = random.Random()
+    for t in range(start, stop):
+        # Tickets depend on the seed and the draw only, however the history is sliced
+        rng.seed((seed << 32) + t)
+        for strategy, main_list, star_list in zip(functions, played_mains, played_stars):
+            for _ in range(tickets):
+                ticket_mains, ticket_stars = strategy(stats, rng)
+                main_list.append(ticket_mains)
+                star_list.append(ticket_stars)
+        stats.add(dates[t], mains[t], stars[t])
+
+    steps = stop - start
+    shape = (len(names), steps, tickets)
+    draw_mains = balls_to_masks(mains[start:stop], np.uint64)[None, :, None]
+    draw_stars = balls_to_masks(stars[start:stop], np.uint16)[None, :, None]
+    main_matches = popcount(balls_to_masks(np.array(played_mains), np.uint64).reshape(shape) & draw_mains)
+    star_matches = popcount(balls_to_masks(np.array(played_stars), np.uint16).reshape(shape) & draw_stars)
+    tiers = prize_tiers(main_matches, star_matches).astype(np.int64)
+
+    # Tickets per (strategy, draw, tier), with code 0 for no prize
+    codes = (np.arange(len(names) * steps).reshape(len(names), steps, 1) * (len(PRIZE_TIERS) + 1) + tiers + 1).ravel()
+    hits = np.bincount(codes, minlength=len(names) * steps * (len(PRIZE_TIERS) + 1))
+    hits = hits.reshape(len(names), steps, len(PRIZE_TIERS) + 1)[:, :, 1:]
+    return start, dict(zip(names, hits))
+
+
+class BacktestResult:
+    """Tickets of each strategy hitting each prize tier at every backtested draw"""
+
+    def __init__(self, store, start, stop, tickets, hits):
+        self.store = store
+        self.start = start
+        self.stop = stop
+        self.tickets = tickets
+        self.hits = hits  # {strategy: (draws, tiers) array}
+
+    def summary(self):
+        """{strategy: totals}, with each strategy's win rate compared to the random baseline's"""
+        steps = self.stop - self.start
+        played = steps * self.tickets
+        summary = {}
+        for name, hits in self.hits.items():
+            tiers = hits.sum(axis=0)
+            summary[name] = {
+                'tickets': played,
+                'tiers': tiers.tolist(),
+                'wins': int(tiers.sum()),
+                'win_rate': int(tiers.sum()) / played if played else 0,
+                'points_per_ticket': int(tiers @ _POINTS) / played if played else 0,
+            }
+
+        baseline = summary.get(BASELINE)
+        for name, totals in summary.items():
+            # Two-proportion z-score of the win rate against the baseline's
+            z_score = None
+            if baseline is not None and name != BASELINE and played:
+                pooled = (totals['wins'] + baseline['wins']) / (2 * played)
+                spread = (pooled * (1 - pooled) * 2 / played) ** 0.5
+                z_score = (totals['win_rate'] - baseline['win_rate']) / spread if spread else 0.0
+            totals['z_vs_baseline'] = z_score
+        return summary
+
+    def write_csv(self, path):
+        """Write one row per (draw, strategy) with its tier hits to ``path``, replacing it atomically"""
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['draw', 'date', 'strategy', 'wins', 'points'] + list(PRIZE_NAMES))
+            for step, t in enumerate(range(self.start, self.stop)):
+                date = self.store.date_at(t).strftime('%Y-%m-%d')
+                for name, hits in self.hits.items():
+                    row = hits[step].tolist()
+                    writer.writerow([t, date, name, sum(row), int(hits[step] @ _POINTS)] + row)
+        os.replace(temp_path, path)
+
+
+def backtest(store, strategies=None, tickets=10, start=100, stop=None, seed=0, processes=None, progress=None):
+    """Walk-forward backtest of ``strategies`` (default: all, plus the random baseline) over draws [start, stop).
+
+    Returns a BacktestResult. ``progress(done, total)`` is called with the
+    draws backtested so far.
+    """
+    names = list(strategies or list(STRATEGIES) + [BASELINE])
+    stop = len(store) if stop is None else min(stop, len(store))
+    start = max(start, 1)
+    tasks = [(first, min(first + SLICE_STEPS, stop), names, tickets, seed)
+             for first in range(start, stop, SLICE_STEPS)]
+    initargs = (store.dates.astype(np.int64), store.mains.astype(np.int64), store.stars.astype(np.int64))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) <= 1:
+        _init_worker(*initargs)
+        results = map(backtest_slice, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(min(processes, len(tasks)), initializer=_init_worker, initargs=initargs)
+        results = pool.imap_unordered(backtest_slice, tasks)
+
+    hits = {name: np.zeros((max(stop - start, 0), len(PRIZE_TIERS)), dtype=np.int64) for name in names}
+    try:
+        done = 0
+        for first, slice_hits in results:
+            for name, counts in slice_hits.items():
+                hits[name][first - start:first - start + len(counts)] = counts
+            done += len(next(iter(slice_hits.values())))
+            if progress:
+                progress(done, stop - start)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return BacktestResult(store, start, stop, tickets, hits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cache', default="euromillions_data_cache.bin",
+                        help="binary draw cache, or a .sqlite3 database, written by the analyser")
+    parser.add_argument('--strategies', nargs='+', choices=list(STRATEGIES) + [BASELINE],
+                        help="strategies to backtest (default: all, plus the random baseline)")
+    parser.add_argument('--tickets', type=int, default=10, help="tickets per strategy per draw")
+    parser.add_argument('--start', type=int, default=100, help="first draw backtested; earlier draws only build statistics")
+    parser.add_argument('--stop', type=int, help="draw to stop before (default: the latest)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the tickets")
+    parser.add_argument('--processes', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--output', help="CSV file for the per-draw tier hits of every strategy")
+    args = parser.parse_args()
+
+    store = load_store(args.cache)
+    if store is None or not len(store):
+        parser.error("no draws in {}; download data in the analyser first".format(args.cache))
+    if not 1 <= args.start < len(store):
+        parser.error("--start must be between 1 and {}".format(len(store) - 1))
+
+    started = time.perf_counter()
+
+    def progress(done, total):
+        print("\r{:,} of {:,} draws ({:.0f}%)".format(done, total, done / total * 100), end='', flush=True)
+
+    result = backtest(store, args.strategies, args.tickets, args.start, args.stop, args.seed, args.processes, progress)
+    print("\nBacktested draws {} to {} with {} tickets per strategy per draw in {:.1f} s".format(
+        result.start, result.stop - 1, result.tickets, time.perf_counter() - started))
+
+    expected = tier_probabilities()
+    print("Expected for any ticket: win rate {:.4f}, points per ticket {:.4f}\n".format(
+        expected.sum(), expected @ _POINTS))
+    print("{:10} {:>9} {:>7} {:>9} {:>9} {:>12}".format(
+        "Strategy", "Tickets", "Wins", "Win rate", "Points", "z vs random"))
+    for name, totals in result.summary().items():
+        z_score = totals['z_vs_baseline']
+        print("{:10} {:>9,} {:>7,} {:>9.4f} {:>9.4f} {:>12}".format(
+            name, totals['tickets'], totals['wins'], totals['win_rate'], totals['points_per_ticket'],
+            "-" if z_score is None else "{:+.2f}".format(z_score)))
+        print("{:10} {}".format("", ", ".join("{}: {}".format(PRIZE_NAMES[tier], count)
+                                              for tier, count in enumerate(totals['tiers']) if count)))
+
+    if args.output:
+        result.write_csv(args.output)
+        print("\nWrote {}".format(args.output))
+
+
+if __name__ == "__main__":
+    main()
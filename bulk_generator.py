@@ -0,0 +1,227 @@
+"""Generate large batches of tickets with the smart-number strategies.
+
+Every strategy in strategies.py has a vectorised counterpart here that
+draws many tickets at once from the same distribution: statistics are read
+once from a StrategyStats, and the choices of all tickets in a chunk are
+made with whole-array operations instead of per-ticket random calls and
+set-filling loops. Tickets are streamed to CSV or NDJSON files that
+ticket_checker.py reads; with --unique, repeats are dropped by their
+ticket codes (combinadic.py) and replaced.
+
+    python bulk_generator.py hot --count 500000 --seed 1 --output hot_pool.csv
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from analysis_core import load_store
+from combinadic import TicketBitmap, encode_tickets
+from null_distributions import sample_draws
+from strategies import BASELINE, STRATEGIES, StrategyStats, balanced_sampler
+from ticket_checker import file_format
+from weighted_sampler import WeightedSampler
+
+# Tickets generated at once; bounds the memory of one chunk
+CHUNK_ROWS = 1 << 16
+
+
+def pick_subsets(rng, rows, choices, picked):
+    """(rows, picked) distinct entries of ``choices`` per row, every subset equally likely"""
+    choices = np.asarray(choices, dtype=np.int64)
+    return choices[sample_draws(rng, rows, picked, len(choices)) - 1]
+
+
+def complete_rows(rng, chosen, picked, pool):
+    """Rows of ``chosen`` numbers topped up to ``picked`` distinct numbers from 1 to ``pool``.
+
+    ``chosen`` is (rows, k), with 0 where a row has chosen nothing; the
+    other numbers of a row must be distinct. The rest of each row is drawn
+    uniformly from the numbers it doesn't hold, as adding random numbers
+    to a set until it is full would.
+    """
+    rows = len(chosen)
+    result = np.zeros((rows, picked), dtype=np.int64)
+    counts = (chosen > 0).sum(axis=1)
+    # Zeros sort first, so each row's numbers end up in its last ``count`` columns
+    chosen = np.sort(chosen, axis=1)
+    for count in np.unique(counts).tolist():
+        group = np.flatnonzero(counts == count)
+        held = chosen[group, chosen.shape[1] - count:]
+        # Ranks among the free numbers, shifted past each held number in turn
+        extra = sample_draws(rng, len(group), picked - count, pool - count)
+        for column in held.T:
+            extra += extra >= column[:, None]
+        result[group] = np.concatenate((held, extra), axis=1)
+    return result
+
+
+def pick_one(rng, rows, choices, excluded=()):
+    """One entry of ``choices`` per row, uniform over those not in that row's ``excluded`` columns; 0 if none"""
+    choices = np.asarray(choices, dtype=np.int64)
+    if not len(choices):
+        return np.zeros(rows, dtype=np.int64)
+    keys = rng.random((rows, len(choices)))
+    for column in excluded:
+        keys[choices == column[:, None]] = 2
+    best = np.argmin(keys, axis=1)
+    return np.where(keys[np.arange(rows), best] < 2, choices[best], 0)
+
+
+def balanced_tickets(stats, rng, rows):
+    mains = balanced_sampler(*stats.sum_range()).sample(rng, rows)
+    return mains, sample_draws(rng, rows, 2, 12)
+
+
+def hot_tickets(stats, rng, rows):
+    hot_numbers = stats.hot_numbers()
+    chosen = pick_subsets(rng, rows, hot_numbers, min(4, len(hot_numbers)))
+    return complete_rows(rng, chosen, 5, 50), sample_draws(rng, rows, 2, 12)
+
+
+def pattern_tickets(stats, rng, rows):
+    pair = stats.top_pair()
+    chosen = np.tile(np.array(pair or (), dtype=np.int64), (rows, 1))
+    popular_stars = stats.star_ranking()[:6]
+    if len(popular_stars) < 2:
+        raise ValueError("the pattern strategy needs at least two lucky stars drawn")
+    return complete_rows(rng, chosen, 5, 50), pick_subsets(rng, rows, popular_stars, 2)
+
+
+def overdue_tickets(stats, rng, rows):
+    overdue_numbers = stats.overdue_numbers(30)
+    chosen = pick_subsets(rng, rows, overdue_numbers, min(3, len(overdue_numbers)))
+    return complete_rows(rng, chosen, 5, 50), sample_draws(rng, rows, 2, 12)
+
+
+def hybrid_tickets(stats, rng, rows):
+    # A hot number, one of the top pair and an overdue number not already picked
+    hot = pick_one(rng, rows, stats.hot_numbers())
+    paired = pick_one(rng, rows, stats.top_pair() or ())
+    paired[paired == hot] = 0
+    overdue = pick_one(rng, rows, stats.overdue_numbers(20), (hot, paired))
+    mains = complete_rows(rng, np.stack((hot, paired, overdue), axis=1), 5, 50)
+
+    # A frequent star, then a different one of the least frequent
+    star_ranking = stats.star_ranking()
+    frequent = pick_one(rng, rows, star_ranking[:6])
+    rare = pick_one(rng, rows, star_ranking[-6:], (frequent,))
+    stars = complete_rows(rng, np.stack((frequent, rare), axis=1), 2, 12)
+    return mains, stars
+
+
+def frequency_tickets(stats, rng, rows):
+    main_weights, star_weights = stats.frequency_weights()
+    return WeightedSampler(main_weights, 5).sample(rng, rows), WeightedSampler(star_weights, 2).sample(rng, rows)
+
+
+def recency_tickets(stats, rng, rows):
+    main_weights, star_weights = stats.recency_weights()
+    return WeightedSampler(main_weights, 5).sample(rng, rows), WeightedSampler(star_weights, 2).sample(rng, rows)
+
+
+def due_tickets(stats, rng, rows):
+    return WeightedSampler(stats.overdue_weights(), 5).sample(rng, rows), sample_draws(rng, rows, 2, 12)
+
+
+def random_tickets(stats, rng, rows):
+    return sample_draws(rng, rows, 5, 50), sample_draws(rng, rows, 2, 12)
+
+
+BULK_STRATEGIES = {
+    'balanced': balanced_tickets,
+    'hot': hot_tickets,
+    'pattern': pattern_tickets,
+    'overdue': overdue_tickets,
+    'hybrid': hybrid_tickets,
+    'frequency': frequency_tickets,
+    'recency': recency_tickets,
+    'due': due_tickets,
+    BASELINE: random_tickets,
+}
+
+
+def iter_tickets(stats, strategy, count, seed=None, chunk=CHUNK_ROWS, unique=False):
+    """Yield (mains, stars) uint8 arrays of up to ``chunk`` sorted tickets at a time, ``count`` in all.
+
+    With ``unique``, tickets already generated are dropped by their ticket
+    codes and more are drawn in their place; ValueError if a whole chunk
+    brings nothing new, as when the strategy can't make ``count`` distinct
+    tickets.
+    """
+    make = BULK_STRATEGIES[strategy]
+    rng = np.random.default_rng(seed)
+    seen = TicketBitmap() if unique else None
+    made = 0
+    while made < count:
+        rows = chunk if unique else min(chunk, count - made)
+        mains, stars = make(stats, rng, rows)
+        mains, stars = np.sort(mains, axis=1).astype(np.uint8), np.sort(stars, axis=1).astype(np.uint8)
+        if unique:
+            new = np.flatnonzero(seen.add(encode_tickets(mains, stars)))[:count - made]
+            if not len(new):
+                raise ValueError("no new {} tickets in {:,} tries after {:,}".format(strategy, rows, made))
+            mains, stars = mains[new], stars[new]
+        made += len(mains)
+        yield mains, stars
+
+
+def generate(stats, strategy, count, seed=None, unique=False):
+    """(count, 5) mains and (count, 2) stars of ``count`` tickets of ``strategy`` over ``stats``"""
+    chunks = list(iter_tickets(stats, strategy, count, seed, unique=unique))
+    if not chunks:
+        return np.zeros((0, 5), dtype=np.uint8), np.zeros((0, 2), dtype=np.uint8)
+    return np.concatenate([mains for mains, stars in chunks]), np.concatenate([stars for mains, stars in chunks])
+
+
+def write_csv_chunk(f, first_id, mains, stars):
+    ids = np.arange(first_id, first_id + len(mains))[:, None]
+    np.savetxt(f, np.hstack((ids, mains, stars)), fmt='%d', delimiter=',')
+
+
+def write_ndjson_chunk(f, first_id, mains, stars):
+    for ticket_id, main_numbers, lucky_stars in zip(range(first_id, first_id + len(mains)), mains.tolist(), stars.tolist()):
+        f.write(json.dumps({'id': str(ticket_id), 'main_numbers': main_numbers, 'lucky_stars': lucky_stars}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('strategy', choices=list(BULK_STRATEGIES), help="strategy to generate tickets with")
+    parser.add_argument('--count', type=int, default=100000, help="tickets to generate")
+    parser.add_argument('--seed', type=int, help="random seed")
+    parser.add_argument('--cache', default="euromillions_data_cache.bin",
+                        help="binary draw cache, or a .sqlite3 database, written by the analyser")
+    parser.add_argument('--output', default='-', help="CSV or NDJSON (.ndjson/.jsonl) file, or - for CSV on stdout")
+    parser.add_argument('--unique', action='store_true', help="never write the same ticket twice")
+    args = parser.parse_args()
+
+    store = load_store(args.cache)
+    if store is None or not len(store):
+        parser.error("no draws in {}; download data in the analyser first".format(args.cache))
+
+    started = time.perf_counter()
+    stats = StrategyStats(store.dates, store.mains, store.stars)
+    ndjson = args.output != '-' and file_format(args.output) == 'ndjson'
+    f = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        if not ndjson:
+            f.write("id,main_1,main_2,main_3,main_4,main_5,star_1,star_2\n")
+        written = 0
+        for mains, stars in iter_tickets(stats, args.strategy, args.count, args.seed, unique=args.unique):
+            (write_ndjson_chunk if ndjson else write_csv_chunk)(f, written + 1, mains, stars)
+            written += len(mains)
+            print("\r{:,} of {:,} tickets".format(written, args.count), end='', file=sys.stderr, flush=True)
+    except ValueError as e:
+        print(file=sys.stderr)
+        parser.error(str(e))
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    title = STRATEGIES[args.strategy][0] if args.strategy in STRATEGIES else "Random baseline"
+    print("\n{}: {:,} tickets in {:.1f} s".format(title, args.count, time.perf_counter() - started), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
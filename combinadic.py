@@ -0,0 +1,95 @@
+"""Compact integer codes for tickets (combinatorial number system).
+
+A set of ``picked`` numbers c1 < c2 < ... from 1 to ``pool`` has the code
+C(c1 - 1, 1) + C(c2 - 1, 2) + ... , a one-to-one map onto
+[0, C(pool, picked)). Main numbers get codes below 2,118,760 and star
+pairs below 66, and a ticket's code is main code * 66 + star code, below
+139,838,160, so every ticket fits in a uint32 that can be hashed, sorted
+and used as an array index. Codes order combinations by their highest
+number first (colexicographic order), not as sorted lists would.
+
+Encoding and decoding work on whole arrays of tickets at once.
+"""
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+MAIN_CODES = comb(50, 5)
+STAR_CODES = comb(12, 2)
+TICKET_CODES = MAIN_CODES * STAR_CODES
+
+
+@lru_cache(maxsize=None)
+def _binomials(pool, picked):
+    """table[n, k] = C(n, k) for n below ``pool`` and k up to ``picked``"""
+    table = np.array([[comb(n, k) for k in range(picked + 1)] for n in range(pool)], dtype=np.int64)
+    table.setflags(write=False)
+    return table
+
+
+def encode(combos, pool):
+    """Codes of the (rows, picked) combinations of numbers from 1 to ``pool``, in any order within a row"""
+    combos = np.sort(np.asarray(combos, dtype=np.int64), axis=-1)
+    if combos.size and (combos.min() < 1 or combos.max() > pool or (np.diff(combos, axis=-1) == 0).any()):
+        raise ValueError("every row needs distinct numbers from 1 to {}".format(pool))
+    picked = combos.shape[-1]
+    table = _binomials(pool, picked)
+    return table[combos - 1, np.arange(1, picked + 1)].sum(axis=-1)
+
+
+def decode(codes, picked, pool):
+    """(len(codes), picked) sorted combinations of numbers from 1 to ``pool`` with these codes"""
+    codes = np.asarray(codes, dtype=np.int64).reshape(-1)
+    if len(codes) and (codes.min() < 0 or codes.max() >= comb(pool, picked)):
+        raise ValueError("codes must be from 0 to {}".format(comb(pool, picked) - 1))
+    table = _binomials(pool, picked)
+    combos = np.zeros((len(codes), picked), dtype=np.int64)
+    for column in range(picked - 1, -1, -1):
+        # Largest number whose binomial still fits in what is left of the code
+        below = np.searchsorted(table[:, column + 1], codes, side='right') - 1
+        codes = codes - table[below, column + 1]
+        combos[:, column] = below + 1
+    return combos
+
+
+def encode_tickets(mains, stars):
+    """uint32 codes of tickets given as (rows, 5) main numbers and (rows, 2) lucky stars"""
+    codes = encode(mains, 50) * STAR_CODES + encode(stars, 12)
+    return codes.astype(np.uint32)
+
+
+def decode_tickets(codes):
+    """(rows, 5) main numbers and (rows, 2) lucky stars, sorted uint8, of ticket codes"""
+    codes = np.asarray(codes, dtype=np.int64).reshape(-1)
+    if len(codes) and (codes.min() < 0 or codes.max() >= TICKET_CODES):
+        raise ValueError("ticket codes must be from 0 to {}".format(TICKET_CODES - 1))
+    main_codes, star_codes = np.divmod(codes, STAR_CODES)
+    return decode(main_codes, 5, 50).astype(np.uint8), decode(star_codes, 2, 12).astype(np.uint8)
+
+
+class TicketBitmap:
+    """Set of ticket codes, one bit per possible ticket (17.5 MB)"""
+
+    def __init__(self):
+        self.bits = np.zeros((TICKET_CODES + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def contains(self, codes):
+        """Whether each code is in the set"""
+        codes = np.asarray(codes, dtype=np.int64)
+        return (self.bits[codes >> 3] >> (codes & 7) & 1).astype(bool)
+
+    def add(self, codes):
+        """Add ``codes``; True where a code is new, at its first position only"""
+        codes = np.asarray(codes, dtype=np.int64).reshape(-1)
+        new = np.zeros(len(codes), dtype=bool)
+        first = np.unique(codes, return_index=True)[1]
+        new[first] = ~self.contains(codes[first])
+        added = codes[new]
+        np.bitwise_or.at(self.bits, added >> 3, (1 << (added & 7)).astype(np.uint8))
+        self.count += len(added)
+        return new
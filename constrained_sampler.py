@@ -0,0 +1,151 @@
+"""Uniform sampling of tickets under sum, odd/even and per-decade constraints.
+
+A counting table is built once by dynamic programming over the balls in
+order: for every ball, the number of ways to finish a ticket from that ball
+on, given how many numbers, how much of the sum and how many odd numbers
+are still needed and how many have been taken in the ball's decade so far.
+A ticket is then drawn by walking the balls once and taking each with
+probability (completions if taken) / (completions from here), which picks
+every combination meeting the constraints with equal probability. There is
+no rejection loop, so the cost per ticket does not depend on how tight
+the constraints are.
+"""
+import numpy as np
+
+
+def _allowed(values, limit):
+    """Boolean mask over 0..limit of the values in ``values`` (None: all)"""
+    mask = np.zeros(limit + 1, dtype=bool)
+    if values is None:
+        mask[:] = True
+    else:
+        values = [values] if isinstance(values, int) else list(values)
+        mask[[value for value in values if 0 <= value <= limit]] = True
+    return mask
+
+
+# Counting tables by (picked, pool, group_size, allowed group counts); the
+# sum and odd/even constraints only select where a walk starts, so samplers
+# differing in those share one table
+_tables = {}
+
+
+def _counting_table(picked, pool, group_size, group_counts):
+    """(allowed counts of the group each ball closes, completions table) for these quotas"""
+    closes = [None] * (pool + 1)
+    for group, counts in enumerate(group_counts):
+        closes[min((group + 1) * group_size, pool)] = _allowed(counts, picked).astype(np.int64)
+    key = (picked, pool, group_size, tuple(tuple(mask.tolist()) for mask in closes if mask is not None))
+    if key in _tables:
+        return closes, _tables[key]
+
+    # ways[p][k, s, o, c]: ways to take k more numbers from balls p + 1 to pool,
+    # adding up to s with o odd, when c were taken earlier in ball p + 1's group
+    max_sum = sum(range(pool - picked + 1, pool + 1))
+    shape = (picked + 1, max_sum + 1, picked + 1, picked + 1)
+    ways = np.zeros((pool + 1,) + shape, dtype=np.int64)
+    ways[pool, 0, 0, 0, 0] = 1
+    for ball in range(pool, 0, -1):
+        after = ways[ball]
+        if closes[ball] is None:
+            skip = after
+            take = np.zeros(shape, dtype=np.int64)
+            take[..., :picked] = after[..., 1:]
+        else:
+            # The group's count must be allowed; the next group starts from 0
+            skip = after[..., :1] * closes[ball]
+            take = after[..., :1] * np.append(closes[ball][1:], 0)
+        here = skip.copy()
+        odd = ball & 1
+        here[1:, ball:, odd:] += take[:-1, :max_sum + 1 - ball, :picked + 1 - odd]
+        ways[ball - 1] = here
+    ways.setflags(write=False)
+    _tables[key] = ways
+    return closes, ways
+
+
+class ConstrainedSampler:
+    """Draws ``picked`` distinct numbers from 1 to ``pool``, uniformly among the combinations with
+
+    - a sum from ``sums[0]`` to ``sums[1]`` (None: any)
+    - a number of odd numbers in ``odd_counts`` (None: any)
+    - in each block of ``group_size`` consecutive numbers (the decades by
+      default), a count allowed by its entry of ``group_counts``: an int, a
+      collection of ints or None. ``group_counts`` None means no quotas.
+
+    ``count`` is how many combinations meet the constraints.
+    """
+
+    def __init__(self, picked=5, pool=50, sums=None, odd_counts=None, group_size=10, group_counts=None):
+        self.picked = picked
+        self.pool = pool
+        self.group_size = group_size
+        max_sum = sum(range(pool - picked + 1, pool + 1))
+        low, high = sums if sums is not None else (0, max_sum)
+        self.sums = (max(low, 0), min(high, max_sum))
+        groups = -(-pool // group_size)
+        group_counts = list(group_counts) if group_counts is not None else [None] * groups
+        if len(group_counts) != groups:
+            raise ValueError("expected {} group counts, got {}".format(groups, len(group_counts)))
+
+        self._closes, self._ways = _counting_table(picked, pool, group_size, group_counts)
+
+        # Whole tickets per (sum, odd count) cell meeting the constraints
+        starts = self._ways[0, picked, :, :, 0].copy()
+        starts[:self.sums[0]] = 0
+        starts[self.sums[1] + 1:] = 0
+        starts[:, ~_allowed(odd_counts, picked)] = 0
+        self._cells = np.flatnonzero(starts)
+        self._cumulative = np.cumsum(starts.ravel()[self._cells])
+        self.count = int(self._cumulative[-1]) if len(self._cells) else 0
+
+    def _take_ways(self, ball, need, remaining, odd_left, taken):
+        """Completions if ``ball`` is taken from state (need, remaining, odd_left, taken); arrays or ints"""
+        odd = ball & 1
+        possible = (need >= 1) & (remaining >= ball) & (odd_left >= odd)
+        need, remaining, odd_left = need - possible, remaining - ball * possible, odd_left - odd * possible
+        closes = self._closes[ball]
+        if closes is None:
+            return np.where(possible, self._ways[ball, need, remaining, odd_left, np.minimum(taken + 1, self.picked)], 0)
+        allowed = closes[np.minimum(taken + 1, self.picked)] * (taken + 1 <= self.picked)
+        return np.where(possible, self._ways[ball, need, remaining, odd_left, 0] * allowed, 0)
+
+    def _start(self, draws):
+        """(remaining sum, odd count) cells for the given draws below count"""
+        cells = self._cells[np.searchsorted(self._cumulative, draws, side='right')]
+        return np.divmod(cells, self.picked + 1)
+
+    def draw(self, rng):
+        """One combination as a sorted list, using ``rng`` (the random module or a random.Random)"""
+        if not self.count:
+            raise ValueError("no combinations meet the constraints")
+        remaining, odd_left = (int(value) for value in self._start(rng.randrange(self.count)))
+        need, taken, numbers = self.picked, 0, []
+        for ball in range(1, self.pool + 1):
+            here = int(self._ways[ball - 1, need, remaining, odd_left, taken])
+            take = int(self._take_ways(ball, need, remaining, odd_left, taken))
+            if rng.randrange(here) < take:
+                numbers.append(ball)
+                need, remaining, odd_left, taken = need - 1, remaining - ball, odd_left - (ball & 1), taken + 1
+            if self._closes[ball] is not None:
+                taken = 0
+        return numbers
+
+    def sample(self, rng, rows):
+        """(rows, picked) sorted combinations, using numpy Generator ``rng``"""
+        if not self.count:
+            raise ValueError("no combinations meet the constraints")
+        remaining, odd_left = self._start(rng.integers(0, self.count, size=rows))
+        need = np.full(rows, self.picked)
+        taken = np.zeros(rows, dtype=np.int64)
+        numbers = np.zeros((rows, self.picked), dtype=np.int64)
+        for ball in range(1, self.pool + 1):
+            here = self._ways[ball - 1, need, remaining, odd_left, taken]
+            take = self._take_ways(ball, need, remaining, odd_left, taken)
+            chosen = rng.integers(0, np.maximum(here, 1)) < take
+            numbers[chosen, self.picked - need[chosen]] = ball
+            need = need - chosen
+            remaining = remaining - ball * chosen
+            odd_left = odd_left - (ball & 1) * chosen
+            taken = np.where(self._closes[ball] is None, taken + chosen, 0)
+        return numbers
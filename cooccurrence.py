@@ -0,0 +1,99 @@
+from itertools import combinations, product
+
+import numpy as np
+
+MAIN_SIZE = 51
+STAR_SIZE = 13
+
+# Kinds of pair, as (row balls, column balls)
+PAIR_KINDS = ('main', 'main_star', 'star')
+
+
+def _pair_counts(left, right, left_size, right_size, same_kind):
+    """Count every pair of balls drawn together, as a (left_size, right_size) matrix"""
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    if same_kind:
+        column_pairs = combinations(range(left.shape[1]), 2)
+    else:
+        column_pairs = product(range(left.shape[1]), range(right.shape[1]))
+
+    codes = [left[:, i] * right_size + right[:, j] for i, j in column_pairs]
+    counts = np.bincount(np.concatenate(codes), minlength=left_size * right_size)
+    counts = counts.reshape(left_size, right_size)
+    if same_kind:
+        # Balls aren't sorted within a draw, so fold (b, a) onto (a, b) both ways
+        counts = counts + counts.T
+    return counts
+
+
+class PairMatrix:
+    """How often every pair of balls has been drawn together.
+
+    ``main`` is a symmetric 51 x 51 matrix of main-number pairs, ``star`` a
+    13 x 13 matrix of lucky-star pairs and ``main_star`` a 51 x 13 matrix of
+    (main number, lucky star) pairs, each indexed by ball. All three are
+    counted in one vectorised pass and updated in place as draws are appended.
+    """
+
+    def __init__(self, mains, stars):
+        self.main = np.zeros((MAIN_SIZE, MAIN_SIZE), dtype=np.int64)
+        self.main_star = np.zeros((MAIN_SIZE, STAR_SIZE), dtype=np.int64)
+        self.star = np.zeros((STAR_SIZE, STAR_SIZE), dtype=np.int64)
+        self.draws = 0
+        self.extend(mains, stars)
+
+    def __len__(self):
+        return self.draws
+
+    def extend(self, mains, stars):
+        """Add the pairs of newly appended draws"""
+        if not len(mains):
+            return
+        self.main += _pair_counts(mains, mains, MAIN_SIZE, MAIN_SIZE, True)
+        self.main_star += _pair_counts(mains, stars, MAIN_SIZE, STAR_SIZE, False)
+        self.star += _pair_counts(stars, stars, STAR_SIZE, STAR_SIZE, True)
+        self.draws += len(mains)
+
+    def counts(self, kind='main'):
+        return getattr(self, kind)
+
+    def count(self, a, b, kind='main'):
+        """Draws containing both ``a`` and ``b``"""
+        return int(self.counts(kind)[a, b])
+
+    def expected(self, kind='main'):
+        """Draws expected to contain any given pair if every ball is equally likely"""
+        if kind == 'main':
+            return self.draws * (5 * 4) / (50 * 49)
+        if kind == 'star':
+            return self.draws * (2 * 1) / (12 * 11)
+        return self.draws * (5 / 50) * (2 / 12)
+
+    def _pair_entries(self, kind):
+        """Codes of the distinct pairs of ``kind`` and the matrix they index, flattened"""
+        counts = self.counts(kind)
+        if kind == 'main_star':
+            rows, cols = np.meshgrid(np.arange(1, MAIN_SIZE), np.arange(1, STAR_SIZE), indexing='ij')
+        else:
+            rows, cols = np.triu_indices(len(counts), k=1)
+            keep = rows > 0
+            rows, cols = rows[keep], cols[keep]
+        return rows.ravel(), cols.ravel(), counts[rows, cols].ravel()
+
+    def top_pairs(self, kind='main', k=15):
+        """The ``k`` most frequent pairs as [((a, b), count)], ties in ball order"""
+        rows, cols, counts = self._pair_entries(kind)
+        order = np.argsort(-counts, kind='stable')[:k]
+        return [((int(rows[i]), int(cols[i])), int(counts[i])) for i in order if counts[i]]
+
+    def excess_pairs(self, kind='main', k=15):
+        """Pairs drawn together most often beyond chance, as [((a, b), observed, expected)]"""
+        rows, cols, counts = self._pair_entries(kind)
+        expected = self.expected(kind)
+        order = np.argsort(-(counts - expected), kind='stable')[:k]
+        return [((int(rows[i]), int(cols[i])), int(counts[i]), expected) for i in order]
+
+    def distance_counts(self):
+        """Main-number pairs by the distance between their numbers, indexed by distance"""
+        return np.array([np.trace(self.main, offset=distance) for distance in range(MAIN_SIZE)], dtype=np.int64)
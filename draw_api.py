@@ -0,0 +1,291 @@
+import codecs
+import json
+import os
+from datetime import date, datetime
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from draw_store import DrawStore, MAIN_COUNT, STAR_COUNT, normalise_draw
+
+API_URL = os.environ.get('EUROMILLIONS_API_URL', "https://euromillions.api.pedromealha.dev/v1/draws")
+
+# Draws run every Tuesday and Friday (Fridays only before May 2011), so two
+# consecutive draws are never more than a week apart
+MAX_DRAW_GAP_DAYS = 7
+
+# Bytes read from the response per step of the streaming parser
+CHUNK_SIZE = 64 * 1024
+# Draws converted to column arrays at a time while streaming
+BATCH_SIZE = 8192
+# Keep-alive connections kept per host by the shared session
+POOL_SIZE = 4
+
+_session = None
+
+
+def parse_api_draw(record):
+    """Validate one record of the draws API and normalise it"""
+    # Dates arrive as YYYY-MM-DD and the numbers as strings
+    draw_date = datetime.strptime(record['date'], '%Y-%m-%d')
+    return normalise_draw(draw_date, record['numbers'], record['stars'])
+
+
+def iter_json_array(chunks):
+    """Yield the elements of a JSON array arriving as chunks of UTF-8 bytes.
+
+    Only the undecoded tail of the text is buffered, so memory stays bounded
+    by the chunk and element size rather than the size of the whole array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    started = False
+
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element split across chunks - wait for the rest
+                break
+            if end == len(buffer) and buffer[pos] not in '{["':
+                # A bare number may continue in the next chunk
+                break
+            yield element
+            pos = end
+        buffer = buffer[pos:]
+
+    buffer += text_decoder.decode(b'', final=True)
+    if buffer.strip(' \t\r\n,') != ']' or not started:
+        raise ValueError("response ended before the end of the JSON array")
+
+
+def get_session():
+    """Shared session, so repeated fetches reuse pooled keep-alive connections"""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        # gzip bodies are decoded transparently by iter_content while streaming
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        _session = session
+    return _session
+
+
+def request_draws(url=API_URL, since=None, timeout=60, validators=None):
+    """Send the draws request, conditional when ``validators`` came from the same URL.
+
+    Returns (response, validators) with the response still streaming, or
+    (None, validators) when the server answered 304 Not Modified.
+    """
+    params = {'date_from': since.isoformat()} if since else None
+    request_url = requests.Request('GET', url, params=params).prepare().url
+
+    headers = {}
+    if validators and validators.get('url') == request_url:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    response = get_session().get(request_url, headers=headers, timeout=timeout, stream=True)
+    if response.status_code == 304:
+        response.close()
+        return None, validators
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+
+    return response, {
+        'url': request_url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }
+
+
+def stream_draws(response, progress=None):
+    """Yield validated draws from a streaming API response as it arrives.
+
+    ``progress`` is called as progress(bytes_received, draws_received) after
+    every chunk read.
+    """
+    received = 0
+    parsed = 0
+
+    with response:
+        def chunks():
+            nonlocal received
+            for chunk in response.iter_content(CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+                if progress:
+                    progress(received, parsed)
+
+        for record in iter_json_array(chunks()):
+            try:
+                draw = parse_api_draw(record)
+            except (ValueError, KeyError, TypeError) as e:
+                print("Skipping invalid draw: {}".format(e))
+                continue
+            parsed += 1
+            yield draw
+
+    if progress:
+        progress(received, parsed)
+
+
+def collect_columns(draws):
+    """Gather (day ordinal, mains, stars) draws into date, mains and stars arrays"""
+    dates, mains, stars = [], [], []
+    batch = []
+
+    def flush():
+        dates.append(np.array([draw[0] for draw in batch], dtype=np.int32))
+        mains.append(np.array([draw[1] for draw in batch], dtype=np.uint8).reshape(-1, MAIN_COUNT))
+        stars.append(np.array([draw[2] for draw in batch], dtype=np.uint8).reshape(-1, STAR_COUNT))
+        batch.clear()
+
+    for draw in draws:
+        batch.append(draw)
+        if len(batch) == BATCH_SIZE:
+            flush()
+    flush()
+    return np.concatenate(dates), np.concatenate(mains), np.concatenate(stars)
+
+
+def fetch_draws(url=API_URL, since=None, timeout=60, progress=None, validators=None):
+    """Download draws from the API, optionally only those on or after ``since``.
+
+    Returns (columns, validators): columns are (dates, mains, stars) arrays
+    in the order received, or None if the server answered 304 Not Modified
+    to a conditional request; validators hold the ETag/Last-Modified to send
+    next time.
+    """
+    response, validators = request_draws(url, since, timeout, validators)
+    if response is None:
+        return None, validators
+    return collect_columns(stream_draws(response, progress)), validators
+
+
+def dedupe_columns(dates, mains, stars):
+    """Sort draw columns by date and drop repeats of the same date.
+
+    Returns None when one date arrives with two different results.
+    """
+    order = np.argsort(dates, kind='stable')
+    dates, mains, stars = dates[order], mains[order], stars[order]
+
+    repeat = dates[1:] == dates[:-1]
+    if repeat.any():
+        sorted_mains = np.sort(mains, axis=1)
+        sorted_stars = np.sort(stars, axis=1)
+        same = (np.all(sorted_mains[1:] == sorted_mains[:-1], axis=1) &
+                np.all(sorted_stars[1:] == sorted_stars[:-1], axis=1))
+        if np.any(repeat & ~same):
+            return None
+        keep = np.concatenate(([True], ~repeat))
+        dates, mains, stars = dates[keep], mains[keep], stars[keep]
+    return dates, mains, stars
+
+
+def merge_delta(store, delta):
+    """Return the columns of the draws in ``delta`` newer than ``store``, or None if they don't line up.
+
+    Servers that ignore the date filter send the whole history back, so older
+    draws are checked against the store rather than trusted: a date the store
+    lacks or a different result for a known date means the cache has drifted.
+    """
+    delta = dedupe_columns(*delta)
+    if delta is None:
+        return None
+    dates, mains, stars = delta
+
+    last_date = int(store.dates[-1])
+    known = dates <= last_date
+    if known.any():
+        index = np.minimum(np.searchsorted(store.dates, dates[known]), len(store) - 1)
+        if np.any(store.dates[index] != dates[known]):
+            return None
+        if np.any(np.sort(store.mains[index], axis=1) != np.sort(mains[known], axis=1)) or \
+                np.any(np.sort(store.stars[index], axis=1) != np.sort(stars[known], axis=1)):
+            return None
+
+    new = ~known
+    dates, mains, stars = dates[new], mains[new], stars[new]
+    # A hole between the cache and the first new draw can't be patched by appending
+    if len(dates) and dates[0] - last_date > MAX_DRAW_GAP_DAYS:
+        return None
+    return dates, mains, stars
+
+
+def full_refresh(url=API_URL, progress=None):
+    """Download the complete history into a new store"""
+    columns, validators = fetch_draws(url, progress=progress)
+    columns = dedupe_columns(*columns)
+    if columns is None:
+        raise ValueError("API returned conflicting results for the same draw date")
+    store = DrawStore.from_arrays(*columns)
+    return {'store': store, 'added': len(store), 'mode': 'full', 'validators': validators}
+
+
+def sync_draws(store, url=API_URL, progress=None, validators=None):
+    """Bring ``store`` up to date, fetching only draws after its newest date.
+
+    New draws are appended to ``store`` in place. ``validators`` from the
+    previous sync make the request conditional, so an unchanged delta costs
+    a 304 and nothing is parsed. Falls back to downloading the full history
+    when the store is empty or the delta doesn't line up with it. Returns a
+    dict with the resulting store, the number of draws added, the mode used
+    ('incremental', 'current' or 'full') and the validators to keep.
+    """
+    if not store:
+        return full_refresh(url, progress)
+
+    since = date.fromordinal(int(store.dates[-1]) + 1)
+    delta, validators = fetch_draws(url, since=since, progress=progress, validators=validators)
+    if delta is None:
+        return {'store': store, 'added': 0, 'mode': 'current', 'validators': validators}
+
+    new_columns = merge_delta(store, delta)
+    if new_columns is None:
+        print("Incremental download does not line up with the cache - refreshing full history")
+        return full_refresh(url, progress)
+
+    added = store.extend(*new_columns)
+    mode = 'incremental' if added else 'current'
+    return {'store': store, 'added': added, 'mode': mode, 'validators': validators}
+
+
+def load_validators(path):
+    """ETag/Last-Modified saved alongside the cache, None if there are none"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_validators(path, validators):
+    with open(path, 'w') as f:
+        json.dump(validators, f, indent=2)
@@ -0,0 +1,261 @@
+import json
+import os
+import struct
+import tempfile
+import weakref
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from draw_store import DrawStore, MAIN_COUNT, STAR_COUNT, normalise_draw
+
+# Snapshot layout: a 32 byte header followed by the packed columns
+#   magic (8s) | format version (uint32) | reserved (uint32) | draw count (uint64) | padding (8x)
+#   dates  int32 little-endian day ordinals, count values
+#   mains  uint8, count x 5
+#   stars  uint8, count x 2
+# Draws are stored oldest first, so the columns can be mapped straight into a DrawStore.
+CACHE_MAGIC = b'EMDRAWS\0'
+CACHE_VERSION = 1
+HEADER = struct.Struct('<8sIIQ8x')
+DATE_DTYPE = np.dtype('<i4')
+
+# Journal layout: a 32 byte header naming the snapshot it extends, then one
+# fixed-size record per appended draw
+#   magic (8s) | format version (uint32) | snapshot last date (int32) | snapshot draw count (uint64) | padding (8x)
+#   record: date (int32) | mains (5s) | stars (2s) | padding (x) | CRC32 of the preceding 12 bytes (uint32)
+JOURNAL_MAGIC = b'EMJRNL\0\0'
+JOURNAL_HEADER = struct.Struct('<8sIiQ8x')
+JOURNAL_RECORD = struct.Struct('<i5s2sx')
+JOURNAL_CRC = struct.Struct('<I')
+RECORD_SIZE = JOURNAL_RECORD.size + JOURNAL_CRC.size
+# Journals past this size are folded into a new snapshot (about 4000 draws)
+JOURNAL_COMPACT_SIZE = 64 * 1024
+
+
+def snapshot_size(count):
+    """Size in bytes of a snapshot holding ``count`` draws"""
+    return HEADER.size + count * (DATE_DTYPE.itemsize + MAIN_COUNT + STAR_COUNT)
+
+
+def write_snapshot(store, path):
+    """Write ``store`` to a binary snapshot, replacing ``path`` atomically"""
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(path) + ".",
+                                     dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(CACHE_MAGIC, CACHE_VERSION, 0, len(store)))
+            f.write(store.dates.astype(DATE_DTYPE).tobytes())
+            f.write(np.ascontiguousarray(store.mains).tobytes())
+            f.write(np.ascontiguousarray(store.stars).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_header(path):
+    """Validate the snapshot header and return the number of draws it holds"""
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError("cache file is too short to be a snapshot")
+
+    magic, version, _, count = HEADER.unpack(header)
+    if magic != CACHE_MAGIC:
+        raise ValueError("not a draw cache snapshot")
+    if version != CACHE_VERSION:
+        raise ValueError("unsupported cache version {} (expected {})".format(version, CACHE_VERSION))
+    if os.path.getsize(path) < snapshot_size(count):
+        raise ValueError("cache file is truncated")
+    return count
+
+
+def read_snapshot(path):
+    """Map a binary snapshot into a DrawStore without parsing it.
+
+    The columns are memory-mapped read-only, so loading takes the same time
+    whatever the history length; pages are read in as the columns are used.
+    """
+    count = read_header(path)
+    if not count:
+        return DrawStore()
+
+    offset = HEADER.size
+    dates = np.memmap(path, dtype=DATE_DTYPE, mode='r', offset=offset, shape=(count,))
+    offset += count * DATE_DTYPE.itemsize
+    mains = np.memmap(path, dtype=np.uint8, mode='r', offset=offset, shape=(count, MAIN_COUNT))
+    offset += count * MAIN_COUNT
+    stars = np.memmap(path, dtype=np.uint8, mode='r', offset=offset, shape=(count, STAR_COUNT))
+    return DrawStore.from_arrays(dates, mains, stars, presorted=True)
+
+
+def export_json(store, path):
+    """Write ``store`` in the portable JSON cache format"""
+    cache_data = {
+        'timestamp': datetime.now().isoformat(),
+        'data': []
+    }
+
+    for draw_date, main_nums, star_nums in store.iter_draws():
+        cache_data['data'].append({
+            'date': draw_date.isoformat(),
+            'main_numbers': main_nums,
+            'lucky_stars': star_nums
+        })
+
+    with open(path, 'w') as f:
+        json.dump(cache_data, f, indent=2)
+
+
+def import_json(path):
+    """Read a JSON cache (as written by export_json) into a DrawStore"""
+    with open(path, 'r') as f:
+        cache_data = json.load(f)
+
+    draws = []
+    for draw_data in cache_data['data']:
+        try:
+            draws.append(normalise_draw(draw_data['date'], draw_data['main_numbers'],
+                                        draw_data['lucky_stars']))
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Skipping invalid cached draw: {e}")
+            continue
+
+    # Columns come back sorted by date (oldest first)
+    return DrawStore.from_draws(draws)
+
+
+def pack_journal_record(ordinal, mains, stars):
+    """One journal record: the draw followed by a CRC32 of its bytes"""
+    body = JOURNAL_RECORD.pack(int(ordinal), bytes(bytearray(mains)), bytes(bytearray(stars)))
+    return body + JOURNAL_CRC.pack(zlib.crc32(body))
+
+
+def read_journal(path, base):
+    """Read the intact records of a journal extending the snapshot ``base``.
+
+    ``base`` is the (draw count, last date) of the snapshot. Returns the
+    (dates, mains, stars) lists of the records and the offset just past the
+    last intact one, or None when the journal is missing or belongs to a
+    different snapshot. Reading stops at the first torn or corrupt record.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < JOURNAL_HEADER.size:
+        return None
+
+    magic, version, base_date, base_count = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC or version != CACHE_VERSION or (base_count, base_date) != base:
+        return None
+
+    dates, mains, stars = [], [], []
+    end = JOURNAL_HEADER.size
+    while end + RECORD_SIZE <= len(data):
+        body = data[end:end + JOURNAL_RECORD.size]
+        crc, = JOURNAL_CRC.unpack_from(data, end + JOURNAL_RECORD.size)
+        if zlib.crc32(body) != crc:
+            print("Draw cache journal is corrupt after {} records - ignoring the rest".format(len(dates)))
+            break
+        ordinal, main_bytes, star_bytes = JOURNAL_RECORD.unpack(body)
+        dates.append(ordinal)
+        mains.append(list(main_bytes))
+        stars.append(list(star_bytes))
+        end += RECORD_SIZE
+    return (dates, mains, stars), end
+
+
+class DrawCache:
+    """Draw history on disk as a binary snapshot plus an append-only journal.
+
+    New draws are appended to the journal as small checksummed records, so
+    saving costs O(new draws); once the journal passes ``compact_size`` bytes
+    it is folded into a fresh snapshot. The snapshot is only ever replaced
+    atomically, so a crash mid-write can at worst lose the journal's tail.
+    """
+
+    def __init__(self, path, journal_path=None, compact_size=JOURNAL_COMPACT_SIZE):
+        self.path = path
+        self.journal_path = journal_path or os.path.splitext(path)[0] + '.journal'
+        self.compact_size = compact_size
+        # (draw count, last date) of the snapshot on disk, None if there is none
+        self._base = None
+        # Offset just past the last intact journal record, None if no valid journal
+        self._journal_end = None
+        # Stores loaded from the snapshot that may still map it
+        self._mapped = weakref.WeakSet()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Map the snapshot and replay the journal on top of it"""
+        self._base = None
+        self._journal_end = None
+        if not self.exists():
+            return DrawStore()
+
+        store = read_snapshot(self.path)
+        self._mapped.add(store)
+        self._base = self._base_of(store)
+
+        journal = read_journal(self.journal_path, self._base)
+        if journal is not None:
+            (dates, mains, stars), journal_end = journal
+            try:
+                store.extend(dates, mains, stars)
+                self._journal_end = journal_end
+            except ValueError as e:
+                print("Ignoring draw cache journal: {}".format(e))
+        return store
+
+    def save(self, store):
+        """Write the whole history as a new snapshot and start an empty journal"""
+        # A mapped file can't be replaced on Windows, so stores still mapping
+        # the old snapshot get their columns copied into memory first
+        for mapped in [store, *self._mapped]:
+            mapped.detach()
+        self._mapped.clear()
+        write_snapshot(store, self.path)
+        self._base = self._base_of(store)
+        self._journal_end = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def append(self, store, count):
+        """Journal the last ``count`` draws of ``store``, compacting when the journal is large"""
+        if not count:
+            return
+        if self._base is None:
+            self.save(store)
+            return
+
+        records = b''.join(pack_journal_record(ordinal, mains, stars) for ordinal, mains, stars in
+                           zip(store.dates[-count:].tolist(), store.mains[-count:].tolist(),
+                               store.stars[-count:].tolist()))
+
+        if self._journal_end is None:
+            f = open(self.journal_path, 'wb')
+            f.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, CACHE_VERSION, self._base[1], self._base[0]))
+        else:
+            f = open(self.journal_path, 'r+b')
+            # Drop any torn record left by an interrupted write before appending
+            f.seek(self._journal_end)
+            f.truncate()
+        with f:
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+            self._journal_end = f.tell()
+
+        if self._journal_end > self.compact_size:
+            self.save(store)
+
+    def _base_of(self, store):
+        return len(store), int(store.dates[-1]) if store else -1
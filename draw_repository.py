@@ -0,0 +1,145 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime
+
+import numpy as np
+
+from draw_store import DrawStore, MAIN_COUNT, STAR_COUNT
+
+# Rows fetched at a time when loading, so large histories never sit in memory as tuples
+FETCH_SIZE = 65536
+
+MAIN_KIND = 0
+STAR_KIND = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS draws (
+    date INTEGER PRIMARY KEY,
+    m1 INTEGER NOT NULL, m2 INTEGER NOT NULL, m3 INTEGER NOT NULL,
+    m4 INTEGER NOT NULL, m5 INTEGER NOT NULL,
+    s1 INTEGER NOT NULL, s2 INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS draw_numbers (
+    kind INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    date INTEGER NOT NULL REFERENCES draws (date),
+    PRIMARY KEY (kind, number, date)
+) WITHOUT ROWID;
+"""
+
+DRAW_COLUMNS = "date, m1, m2, m3, m4, m5, s1, s2"
+
+
+def to_ordinal(value):
+    """Day ordinal of a date, datetime or ISO date string"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, (date, datetime)):
+        return value.toordinal()
+    return int(value)
+
+
+class SQLiteDrawRepository:
+    """Draw history in a SQLite database, with the same load/save/append API as DrawCache.
+
+    ``draws`` holds one row per draw keyed by day ordinal, and ``draw_numbers``
+    one row per ball keyed by (kind, number, date), so last-seen, date-range
+    and contains-these-numbers queries are index lookups rather than scans.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _connect(self):
+        # A fresh connection per call, as downloads save from a worker thread
+        conn = sqlite3.connect(self.path)
+        conn.executescript(SCHEMA)
+        return conn
+
+    def exists(self):
+        if not os.path.exists(self.path):
+            return False
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM draws LIMIT 1").fetchone() is not None
+
+    def load(self):
+        """Read the whole history into a DrawStore"""
+        with closing(self._connect()) as conn:
+            return self._query_store(conn, "SELECT {} FROM draws ORDER BY date".format(DRAW_COLUMNS))
+
+    def save(self, store):
+        """Replace the stored history with ``store``"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM draw_numbers")
+            conn.execute("DELETE FROM draws")
+            self._insert(conn, store, 0)
+
+    def append(self, store, count):
+        """Store the last ``count`` draws of ``store``"""
+        if not count:
+            return
+        with closing(self._connect()) as conn, conn:
+            self._insert(conn, store, len(store) - count)
+
+    def _insert(self, conn, store, start):
+        dates = store.dates[start:].tolist()
+        mains = store.mains[start:].tolist()
+        stars = store.stars[start:].tolist()
+
+        conn.executemany("INSERT INTO draws ({}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)".format(DRAW_COLUMNS),
+                         ([ordinal] + main_nums + star_nums
+                          for ordinal, main_nums, star_nums in zip(dates, mains, stars)))
+        conn.executemany("INSERT INTO draw_numbers (kind, number, date) VALUES (?, ?, ?)",
+                         ((kind, number, ordinal)
+                          for ordinal, main_nums, star_nums in zip(dates, mains, stars)
+                          for kind, numbers in ((MAIN_KIND, main_nums), (STAR_KIND, star_nums))
+                          for number in numbers))
+
+    def _query_store(self, conn, sql, params=()):
+        cursor = conn.execute(sql, params)
+        blocks = []
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            blocks.append(np.array(rows, dtype=np.int32))
+
+        if not blocks:
+            return DrawStore()
+        table = np.concatenate(blocks)
+        return DrawStore.from_arrays(table[:, 0], table[:, 1:1 + MAIN_COUNT],
+                                     table[:, 1 + MAIN_COUNT:1 + MAIN_COUNT + STAR_COUNT], presorted=True)
+
+    # Indexed queries
+
+    def count(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM draws").fetchone()[0]
+
+    def last_seen(self, number, kind='main'):
+        """Date ``number`` was last drawn as a datetime, None if never"""
+        kind = MAIN_KIND if kind == 'main' else STAR_KIND
+        with closing(self._connect()) as conn:
+            ordinal = conn.execute("SELECT MAX(date) FROM draw_numbers WHERE kind = ? AND number = ?",
+                                   (kind, int(number))).fetchone()[0]
+        return datetime.fromordinal(ordinal) if ordinal is not None else None
+
+    def draws_between(self, start, end):
+        """DrawStore of the draws from ``start`` to ``end`` inclusive"""
+        with closing(self._connect()) as conn:
+            return self._query_store(conn, "SELECT {} FROM draws WHERE date BETWEEN ? AND ? ORDER BY date"
+                                     .format(DRAW_COLUMNS), (to_ordinal(start), to_ordinal(end)))
+
+    def draws_containing(self, main_numbers=(), lucky_stars=()):
+        """DrawStore of the draws containing all of the given main numbers and lucky stars"""
+        terms = [(MAIN_KIND, int(number)) for number in main_numbers] + \
+                [(STAR_KIND, int(star)) for star in lucky_stars]
+        if not terms:
+            return self.load()
+
+        dates_sql = " INTERSECT ".join(["SELECT date FROM draw_numbers WHERE kind = ? AND number = ?"] * len(terms))
+        params = [value for term in terms for value in term]
+        with closing(self._connect()) as conn:
+            return self._query_store(conn, "SELECT {} FROM draws WHERE date IN ({}) ORDER BY date"
+                                     .format(DRAW_COLUMNS, dates_sql), params)
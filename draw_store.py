@@ -0,0 +1,308 @@
+import threading
+
+import numpy as np
+from collections import Counter
+from datetime import datetime
+
+from cooccurrence import PairMatrix
+from match_kernel import MatchKernel
+from number_index import NumberIndex
+from rolling_windows import RollingWindows
+
+MAIN_COUNT = 5
+STAR_COUNT = 2
+MAIN_MAX = 50
+STAR_MAX = 12
+
+# date.toordinal() of 1970-01-01, used to turn day ordinals into numpy datetimes
+_EPOCH_ORDINAL = 719163
+
+
+def normalise_draw(draw_date, main_numbers, lucky_stars):
+    """Validate one draw and return it as (day ordinal, mains tuple, stars tuple)"""
+    if isinstance(draw_date, str):
+        draw_date = datetime.fromisoformat(draw_date)
+    mains = tuple(int(num) for num in main_numbers)
+    stars = tuple(int(star) for star in lucky_stars)
+
+    if len(mains) != MAIN_COUNT or len(set(mains)) != MAIN_COUNT:
+        raise ValueError("expected {} distinct main numbers, got {}".format(MAIN_COUNT, list(mains)))
+    if len(stars) != STAR_COUNT or len(set(stars)) != STAR_COUNT:
+        raise ValueError("expected {} distinct lucky stars, got {}".format(STAR_COUNT, list(stars)))
+    if not all(1 <= num <= MAIN_MAX for num in mains):
+        raise ValueError("main numbers out of range: {}".format(list(mains)))
+    if not all(1 <= star <= STAR_MAX for star in stars):
+        raise ValueError("lucky stars out of range: {}".format(list(stars)))
+
+    return draw_date.toordinal(), mains, stars
+
+
+class DrawStore:
+    """Draw history held as contiguous columns, oldest draw first.
+
+    ``dates`` is an int32 column of day ordinals, ``mains`` an (n, 5) uint8
+    matrix and ``stars`` an (n, 2) uint8 matrix. Balls keep the order the
+    source supplied them in.
+
+    The index, pair, window and match structures kept alongside the draws
+    are built and caught up under a lock, as is extend(), so threads
+    reading the same store never extend one structure twice for the same
+    draws.
+    """
+
+    def __init__(self, capacity=0):
+        self._dates = np.zeros(capacity, dtype=np.int32)
+        self._mains = np.zeros((capacity, MAIN_COUNT), dtype=np.uint8)
+        self._stars = np.zeros((capacity, STAR_COUNT), dtype=np.uint8)
+        self._size = 0
+        self.version = 0
+        self._kernel = None
+        self._number_indexes = {}
+        self._pairs = None
+        self._windows = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_arrays(cls, dates, mains, stars, presorted=False):
+        """Build a store from column arrays, sorting the draws by date.
+
+        ``presorted`` skips the order check for columns known to be oldest
+        first, so mapped columns aren't read in full just to build the store.
+        """
+        dates = np.asarray(dates, dtype=np.int32).reshape(-1)
+        mains = np.asarray(mains, dtype=np.uint8).reshape(-1, MAIN_COUNT)
+        stars = np.asarray(stars, dtype=np.uint8).reshape(-1, STAR_COUNT)
+        if not (len(dates) == len(mains) == len(stars)):
+            raise ValueError("date, main and star columns differ in length")
+
+        if not presorted and len(dates) > 1 and np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            dates, mains, stars = dates[order], mains[order], stars[order]
+
+        store = cls()
+        store._dates = np.ascontiguousarray(dates)
+        store._mains = np.ascontiguousarray(mains)
+        store._stars = np.ascontiguousarray(stars)
+        store._size = len(dates)
+        return store
+
+    @classmethod
+    def from_draws(cls, draws):
+        """Build a store from (day ordinal, mains, stars) tuples"""
+        draws = list(draws)
+        dates = [draw[0] for draw in draws]
+        mains = [draw[1] for draw in draws]
+        stars = [draw[2] for draw in draws]
+        return cls.from_arrays(dates, mains, stars)
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, dates, mains, stars):
+        """Append draws newer than the last stored draw, growing the columns in place"""
+        dates = np.asarray(dates, dtype=np.int32).reshape(-1)
+        mains = np.asarray(mains, dtype=np.uint8).reshape(-1, MAIN_COUNT)
+        stars = np.asarray(stars, dtype=np.uint8).reshape(-1, STAR_COUNT)
+        if not (len(dates) == len(mains) == len(stars)):
+            raise ValueError("date, main and star columns differ in length")
+        if not len(dates):
+            return 0
+        if np.any(dates[1:] <= dates[:-1]):
+            raise ValueError("appended draws must be in strictly increasing date order")
+        with self._lock:
+            if self._size and dates[0] <= self._dates[self._size - 1]:
+                raise ValueError("appended draws must be newer than the last stored draw")
+
+            needed = self._size + len(dates)
+            if needed > len(self._dates):
+                self._grow(max(needed, 2 * len(self._dates), 64))
+
+            self._dates[self._size:needed] = dates
+            self._mains[self._size:needed] = mains
+            self._stars[self._size:needed] = stars
+            self._size = needed
+            self.version += 1
+            return len(dates)
+
+    def _grow(self, capacity):
+        dates = np.zeros(capacity, dtype=np.int32)
+        mains = np.zeros((capacity, MAIN_COUNT), dtype=np.uint8)
+        stars = np.zeros((capacity, STAR_COUNT), dtype=np.uint8)
+        dates[:self._size] = self.dates
+        mains[:self._size] = self.mains
+        stars[:self._size] = self.stars
+        self._dates, self._mains, self._stars = dates, mains, stars
+
+    def detach(self):
+        """Copy memory-mapped columns into memory, so the file they were mapped from can be replaced"""
+        with self._lock:
+            if any(_is_mapped(column) for column in (self._dates, self._mains, self._stars)):
+                self._grow(len(self._dates))
+                # Memoized tables may still view the mapped columns
+                self.version += 1
+
+    @property
+    def dates(self):
+        return self._dates[:self._size]
+
+    @property
+    def mains(self):
+        return self._mains[:self._size]
+
+    @property
+    def stars(self):
+        return self._stars[:self._size]
+
+    def date_at(self, index):
+        """Date of the draw at ``index`` as a datetime"""
+        return datetime.fromordinal(int(self.dates[index]))
+
+    def draw_at(self, index):
+        """Draw at ``index`` as (datetime, mains list, stars list)"""
+        return self.date_at(index), self.mains[index].tolist(), self.stars[index].tolist()
+
+    def first_date(self):
+        return self.date_at(0)
+
+    def last_date(self):
+        return self.date_at(self._size - 1)
+
+    def iter_draws(self):
+        """Yield (datetime, mains list, stars list) for every draw, oldest first"""
+        for ordinal, mains, stars in zip(self.dates.tolist(), self.mains.tolist(), self.stars.tolist()):
+            yield datetime.fromordinal(ordinal), mains, stars
+
+    def slice(self, start=None, stop=None):
+        """Return a store viewing draws [start:stop] without copying"""
+        store = DrawStore()
+        store._dates = self.dates[start:stop]
+        store._mains = self.mains[start:stop]
+        store._stars = self.stars[start:stop]
+        store._size = len(store._dates)
+        store.version = self.version
+        return store
+
+    def take(self, mask_or_indices):
+        """Return a new store holding the selected draws"""
+        return DrawStore.from_arrays(self.dates[mask_or_indices], self.mains[mask_or_indices],
+                                     self.stars[mask_or_indices])
+
+    # Derived columns
+
+    def sorted_mains(self):
+        return np.sort(self.mains, axis=1)
+
+    def sorted_stars(self):
+        return np.sort(self.stars, axis=1)
+
+    def sums(self):
+        return self.mains.sum(axis=1, dtype=np.int64)
+
+    def odd_counts(self):
+        return (self.mains & 1).sum(axis=1, dtype=np.int64)
+
+    def indicator_matrix(self, kind='main'):
+        """(n, max + 1) bool matrix with row i, column k set when ball k was in draw i"""
+        balls = self.mains if kind == 'main' else self.stars
+        size = MAIN_MAX + 1 if kind == 'main' else STAR_MAX + 1
+        indicator = np.zeros((self._size, size), dtype=bool)
+        indicator[np.arange(self._size)[:, None], balls] = True
+        return indicator
+
+    def main_counts(self):
+        """Appearances of each main number, indexed by number (index 0 unused)"""
+        return np.bincount(self.mains.ravel(), minlength=MAIN_MAX + 1)
+
+    def star_counts(self):
+        """Appearances of each lucky star, indexed by star (index 0 unused)"""
+        return np.bincount(self.stars.ravel(), minlength=STAR_MAX + 1)
+
+    def main_counter(self):
+        return counter_from_counts(self.main_counts())
+
+    def star_counter(self):
+        return counter_from_counts(self.star_counts())
+
+    def number_index(self, kind='main'):
+        """NumberIndex of the main numbers or lucky stars, extended as draws are appended"""
+        with self._lock:
+            balls = self.mains if kind == 'main' else self.stars
+            index = self._number_indexes.get(kind)
+            if index is None:
+                index = NumberIndex(balls, MAIN_MAX + 1 if kind == 'main' else STAR_MAX + 1)
+                self._number_indexes[kind] = index
+            elif len(index) < self._size:
+                index.extend(balls[len(index):])
+            return index
+
+    def pair_matrix(self):
+        """PairMatrix of the draws, updated in place as draws are appended"""
+        with self._lock:
+            if self._pairs is None:
+                self._pairs = PairMatrix(self.mains, self.stars)
+            elif len(self._pairs) < self._size:
+                done = len(self._pairs)
+                self._pairs.extend(self.mains[done:], self.stars[done:])
+            return self._pairs
+
+    def rolling_windows(self):
+        """RollingWindows over the draws, for counts, sums and odd ratios of any window"""
+        with self._lock:
+            if self._windows is None:
+                self._windows = RollingWindows(self.mains, self.stars)
+            elif len(self._windows) < self._size:
+                done = len(self._windows)
+                self._windows.extend(self.mains[done:], self.stars[done:])
+            return self._windows
+
+    def last_seen(self, kind='main'):
+        """Day ordinal each ball was last drawn, -1 if never, indexed by ball"""
+        last_index = self.number_index(kind).last_seen_all()
+        if not self._size:
+            return last_index
+        return np.where(last_index >= 0, self.dates[last_index].astype(np.int64), -1)
+
+    def match_kernel(self):
+        """Bitmask MatchKernel over the draws, extended as draws are appended"""
+        with self._lock:
+            if self._kernel is None:
+                self._kernel = MatchKernel(self.mains, self.stars)
+            elif len(self._kernel) < self._size:
+                done = len(self._kernel)
+                self._kernel.extend(self.mains[done:], self.stars[done:])
+            return self._kernel
+
+    def match_counts(self, main_numbers, lucky_stars):
+        """Main and star matches of one ticket against every draw"""
+        return self.match_kernel().match_counts(main_numbers, lucky_stars)
+
+    def _datetime64(self):
+        return (self.dates.astype(np.int64) - _EPOCH_ORDINAL).astype('datetime64[D]')
+
+    def weekdays(self):
+        """Weekday of every draw, 0 = Monday"""
+        return (self.dates.astype(np.int64) - 1) % 7
+
+    def years(self):
+        return self._datetime64().astype('datetime64[Y]').astype(np.int64) + 1970
+
+    def months(self):
+        return self._datetime64().astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+    def days(self):
+        days = self._datetime64()
+        return (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+
+
+def _is_mapped(array):
+    """Whether ``array`` views a memory-mapped file"""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def counter_from_counts(counts):
+    """Counter of the non-zero entries of a bincount array"""
+    return Counter({number: int(count) for number, count in enumerate(counts.tolist()) if count})
@@ -0,0 +1,262 @@
+"""Score every possible EuroMillions ticket against the full draw history.
+
+All 2,118,760 main-number combinations are matched against every draw and
+combined with the 66 lucky-star pairs, giving the prize-tier histogram of
+each of the 139,838,160 tickets. The scan is split by the first two main
+numbers across a multiprocessing pool; only the top-k tickets of each
+ranking are kept, and they are written to one CSV file per ranking as the
+scan progresses.
+
+    python exhaustive_search.py --top 100 --output exhaustive_results
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from analysis_core import load_store
+from match_kernel import PRIZE_TIERS, PRIZE_NAMES, PRIZE_POINTS, balls_to_masks, popcount
+
+STAR_PAIRS = np.array(list(combinations(range(1, 13), 2)), dtype=np.int64)
+PAIR_COUNT = len(STAR_PAIRS)
+
+# Index into STAR_PAIRS of every (low star, high star)
+_PAIR_LOOKUP = np.full((13, 13), -1, dtype=np.int64)
+_PAIR_LOOKUP[STAR_PAIRS[:, 0], STAR_PAIRS[:, 1]] = np.arange(PAIR_COUNT)
+
+# (pair, star) incidence, for summing over the pairs holding a star
+_PAIR_STARS = np.zeros((PAIR_COUNT, 13), dtype=np.int64)
+_PAIR_STARS[np.arange(PAIR_COUNT)[:, None], STAR_PAIRS] = 1
+
+_TIER_MAINS = np.array([mains for mains, stars in PRIZE_TIERS])
+_TIER_STARS = np.array([stars for mains, stars in PRIZE_TIERS])
+_POINTS = np.array(PRIZE_POINTS, dtype=np.int64)
+
+# Draw-by-combination cells matched at once; bounds the memory of one block
+BLOCK_CELLS = 1 << 22
+CHECKPOINT_EVERY = 50
+
+RANKINGS = ('value', 'wins', 'highest')
+
+
+def ranking_keys(hist, ranking):
+    """Sort keys of each ticket for ``ranking``, most significant first, higher is better"""
+    value = hist @ _POINTS
+    wins = hist.sum(axis=1)
+    if ranking == 'value':
+        return [value, wins]
+    if ranking == 'wins':
+        return [wins, value]
+    # Points of the best tier won, then how often anything was won
+    won = hist > 0
+    best = np.where(won.any(axis=1), _POINTS[np.argmax(won, axis=1)], 0)
+    return [best, wins, value]
+
+
+def top_k(keys, ids, k):
+    """Row indices of the ``k`` best rows by ``keys``, ties broken by ascending id"""
+    primary = keys[0]
+    rows = np.arange(len(primary))
+    if len(primary) > k:
+        # Only rows at least as good as the k-th best primary key can make the cut
+        threshold = np.partition(primary, len(primary) - k)[len(primary) - k]
+        rows = np.flatnonzero(primary >= threshold)
+    order = np.lexsort([ids[rows]] + [-key[rows] for key in reversed(keys)])
+    return rows[order[:k]]
+
+
+class TopTickets:
+    """The best ``k`` tickets seen so far under one ranking"""
+
+    def __init__(self, ranking, k):
+        self.ranking = ranking
+        self.k = k
+        self.mains = np.zeros((0, 5), dtype=np.int64)
+        self.stars = np.zeros((0, 2), dtype=np.int64)
+        self.hist = np.zeros((0, len(PRIZE_TIERS)), dtype=np.int64)
+        self.ids = np.zeros(0, dtype=np.int64)
+
+    def add(self, mains, stars, hist, ids):
+        mains = np.concatenate((self.mains, mains))
+        stars = np.concatenate((self.stars, stars))
+        hist = np.concatenate((self.hist, hist))
+        ids = np.concatenate((self.ids, ids))
+        keep = top_k(ranking_keys(hist, self.ranking), ids, self.k)
+        self.mains, self.stars, self.hist, self.ids = mains[keep], stars[keep], hist[keep], ids[keep]
+
+    def rows(self):
+        """(mains, stars, tier histogram) of each kept ticket, best first"""
+        return zip(self.mains.tolist(), self.stars.tolist(), self.hist.tolist())
+
+    def write_csv(self, path):
+        """Write the kept tickets to ``path``, replacing it atomically"""
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['rank', 'main_numbers', 'lucky_stars', 'value', 'wins'] + list(PRIZE_NAMES))
+            for rank, (mains, stars, hist) in enumerate(self.rows(), 1):
+                writer.writerow([rank, ' '.join(map(str, mains)), ' '.join(map(str, stars)),
+                                 int(np.dot(hist, _POINTS)), sum(hist)] + hist)
+        os.replace(temp_path, path)
+
+
+def draw_columns(store):
+    """Main-number masks and star-pair index of every draw, as the workers need them"""
+    stars = store.sorted_stars().astype(np.int64)
+    return balls_to_masks(store.mains, np.uint64), _PAIR_LOOKUP[stars[:, 0], stars[:, 1]]
+
+
+def tier_histograms(combos, draw_masks, draw_pairs):
+    """(len(combos) * 66, 13) prize-tier histograms of every combination with every star pair.
+
+    Row ``i * 66 + q`` is main combination ``i`` played with STAR_PAIRS[q].
+    Main matches are counted per (combination, star pair drawn, matches);
+    star matches then only depend on how two star pairs overlap, so the
+    histograms follow without matching any star pair against the draws.
+    """
+    block = len(combos)
+    masks = balls_to_masks(combos, np.uint64)
+    main_matches = popcount(masks[:, None] & draw_masks[None, :])
+
+    # counts[c, p, m]: draws with star pair p in which combination c matched m main numbers
+    codes = main_matches + (draw_pairs * 6).astype(np.int32)[None, :]
+    codes += (np.arange(block, dtype=np.int32) * (PAIR_COUNT * 6))[:, None]
+    counts = np.bincount(codes.ravel(), minlength=block * PAIR_COUNT * 6).reshape(block, PAIR_COUNT, 6)
+    counts = counts.transpose(0, 2, 1)
+
+    # Draws whose star pair shares both, exactly one or neither star with each pair
+    both = counts
+    per_star = counts @ _PAIR_STARS
+    one = per_star[:, :, STAR_PAIRS[:, 0]] + per_star[:, :, STAR_PAIRS[:, 1]] - 2 * both
+    neither = counts.sum(axis=2, keepdims=True) - one - both
+    by_stars = np.stack((neither, one, both), axis=-1)
+
+    hist = by_stars[:, _TIER_MAINS, :, _TIER_STARS]
+    return hist.transpose(1, 2, 0).reshape(block * PAIR_COUNT, len(PRIZE_TIERS))
+
+
+def ticket_ids(combos):
+    """Ids of each combination's 66 tickets, ascending in (mains, stars) order"""
+    packed = np.zeros(len(combos), dtype=np.int64)
+    for column in range(5):
+        packed = packed * 64 + combos[:, column]
+    return (packed[:, None] * 128 + np.arange(PAIR_COUNT)).ravel()
+
+
+_worker_columns = None
+
+
+def _init_worker(draw_masks, draw_pairs):
+    global _worker_columns
+    _worker_columns = (draw_masks, draw_pairs)
+
+
+def scan_prefix(task):
+    """Best tickets of every ranking among the combinations starting with ``task``'s two numbers"""
+    first, second, k = task
+    draw_masks, draw_pairs = _worker_columns
+    rest = np.array(list(combinations(range(second + 1, 51), 3)), dtype=np.int64)
+    combos = np.column_stack((np.full(len(rest), first), np.full(len(rest), second), rest))
+
+    tops = {ranking: TopTickets(ranking, k) for ranking in RANKINGS}
+    block = max(1, BLOCK_CELLS // max(len(draw_masks), 1))
+    for start in range(0, len(combos), block):
+        chunk = combos[start:start + block]
+        hist = tier_histograms(chunk, draw_masks, draw_pairs)
+        mains = np.repeat(chunk, PAIR_COUNT, axis=0)
+        stars = np.tile(STAR_PAIRS, (len(chunk), 1))
+        ids = ticket_ids(chunk)
+        for top in tops.values():
+            top.add(mains, stars, hist, ids)
+    return len(combos), tops
+
+
+def prefix_tasks(k):
+    """(first, second, k) for every pair of leading main numbers, largest groups first"""
+    tasks = [(first, second, k) for first in range(1, 48) for second in range(first + 1, 48)]
+    return sorted(tasks, key=lambda task: task[1])
+
+
+def search(store, k=100, processes=None, output_dir=None, progress=None):
+    """Top ``k`` tickets over the whole history by each ranking in RANKINGS.
+
+    Returns {ranking: TopTickets}. With ``output_dir`` the results are also
+    written to top_<ranking>.csv there, refreshed every CHECKPOINT_EVERY
+    finished groups. ``progress(done, total)`` is called with combinations scanned.
+    """
+    draw_masks, draw_pairs = draw_columns(store)
+    tasks = prefix_tasks(k)
+    total = sum(comb(50 - second, 3) for first, second, k in tasks)
+    tops = {ranking: TopTickets(ranking, k) for ranking in RANKINGS}
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write():
+        if output_dir:
+            for ranking, top in tops.items():
+                top.write_csv(os.path.join(output_dir, "top_{}.csv".format(ranking)))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        _init_worker(draw_masks, draw_pairs)
+        results = map(scan_prefix, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(draw_masks, draw_pairs))
+        results = pool.imap_unordered(scan_prefix, tasks)
+
+    try:
+        done = 0
+        for finished, (scanned, group_tops) in enumerate(results, 1):
+            for ranking, top in group_tops.items():
+                tops[ranking].add(top.mains, top.stars, top.hist, top.ids)
+            done += scanned
+            if progress:
+                progress(done, total)
+            if finished % CHECKPOINT_EVERY == 0:
+                write()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    write()
+    return tops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cache', default="euromillions_data_cache.bin",
+                        help="binary draw cache, or a .sqlite3 database, written by the analyser")
+    parser.add_argument('--top', type=int, default=100, help="tickets kept per ranking")
+    parser.add_argument('--processes', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--output', default="exhaustive_results", help="directory for the top_*.csv files")
+    args = parser.parse_args()
+
+    store = load_store(args.cache)
+    if store is None or not len(store):
+        parser.error("no draws in {}; download data in the analyser first".format(args.cache))
+
+    started = time.perf_counter()
+
+    def progress(done, total):
+        print("\r{:,} of {:,} combinations ({:.0f}%)".format(done, total, done / total * 100), end='', flush=True)
+
+    tops = search(store, args.top, args.processes, args.output, progress)
+    print("\nScored {:,} tickets against {} draws in {:.1f} s".format(
+        comb(50, 5) * PAIR_COUNT, len(store), time.perf_counter() - started))
+
+    for ranking, top in tops.items():
+        mains, stars, hist = next(iter(top.rows()))
+        print("Best by {}: {} | {} ({} wins) -> {}".format(
+            ranking, ' '.join(map(str, mains)), ' '.join(map(str, stars)), sum(hist),
+            os.path.join(args.output, "top_{}.csv".format(ranking))))
+
+
+if __name__ == "__main__":
+    main()
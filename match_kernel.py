@@ -0,0 +1,107 @@
+import numpy as np
+
+# EuroMillions prize tiers, best first, as (main matches, star matches)
+PRIZE_TIERS = ((5, 2), (5, 1), (5, 0), (4, 2), (4, 1), (4, 0), (3, 2),
+               (2, 2), (3, 1), (3, 0), (1, 2), (2, 1), (2, 0))
+PRIZE_NAMES = ("Jackpot", "2nd Prize", "3rd Prize", "4th Prize", "5th Prize", "6th Prize", "7th Prize",
+               "8th Prize", "9th Prize", "10th Prize", "11th Prize", "12th Prize", "13th Prize")
+# Relative value of each tier, used to rank tickets by what they would have won
+PRIZE_POINTS = (100, 80, 60, 40, 30, 20, 15, 10, 8, 6, 4, 3, 1)
+
+# Tier index for every (main matches, star matches), -1 where nothing is won
+_TIER_LOOKUP = np.full((6, 3), -1, dtype=np.int8)
+for _tier, (_main_matches, _star_matches) in enumerate(PRIZE_TIERS):
+    _TIER_LOOKUP[_main_matches, _star_matches] = _tier
+
+# Tiers by main matches * 3 + star matches. Every code from the lowest winning
+# one up wins something (1 + 2 stars, then 2 or more main numbers)
+_TIER_CODES = np.array([main_matches * 3 + star_matches for main_matches, star_matches in PRIZE_TIERS])
+_MIN_WINNING_CODE = int(_TIER_CODES.min())
+_CODE_COUNT = 6 * 3
+
+_POPCOUNT8 = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+def popcount(values):
+    """Number of set bits in each element of an unsigned integer array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    # numpy < 2.0: count the bits of each byte through a lookup table
+    values = np.ascontiguousarray(values)
+    per_byte = _POPCOUNT8[values.reshape(values.shape + (1,)).view(np.uint8)]
+    return per_byte.sum(axis=-1, dtype=np.uint8)
+
+
+def balls_to_masks(balls, dtype):
+    """One bitmask per row of ``balls``, with bit k set when ball k is in the row"""
+    balls = np.asarray(balls).astype(dtype)
+    return np.bitwise_or.reduce(np.left_shift(dtype(1), balls), axis=-1)
+
+
+def ticket_mask(numbers, dtype):
+    mask = 0
+    for number in numbers:
+        mask |= 1 << int(number)
+    return dtype(mask)
+
+
+def prize_tiers(main_matches, star_matches):
+    """Prize tier index (into PRIZE_TIERS) for each pair of match counts, -1 for no prize"""
+    return _TIER_LOOKUP[main_matches, star_matches]
+
+
+class MatchKernel:
+    """Draw history as bitmasks, for matching tickets against every draw at once.
+
+    Each draw's main numbers become a uint64 mask with bit k set for ball k and
+    its lucky stars a uint16 mask, so the matches of a ticket are an AND and a
+    popcount over the whole history.
+    """
+
+    def __init__(self, mains, stars):
+        self.mains_masks = balls_to_masks(mains, np.uint64)
+        self.stars_masks = balls_to_masks(stars, np.uint16)
+
+    def __len__(self):
+        return len(self.mains_masks)
+
+    def extend(self, mains, stars):
+        """Add masks for newly appended draws"""
+        self.mains_masks = np.concatenate((self.mains_masks, balls_to_masks(mains, np.uint64)))
+        self.stars_masks = np.concatenate((self.stars_masks, balls_to_masks(stars, np.uint16)))
+
+    def match_counts(self, main_numbers, lucky_stars):
+        """(main_matches, star_matches) arrays of one ticket against every draw"""
+        main_matches = popcount(self.mains_masks & ticket_mask(main_numbers, np.uint64))
+        star_matches = popcount(self.stars_masks & ticket_mask(lucky_stars, np.uint16))
+        return main_matches, star_matches
+
+    def match_many(self, tickets):
+        """(main_matches, star_matches) arrays of shape (tickets, draws) for (mains, stars) tickets"""
+        tickets = list(tickets)
+        main_masks = np.array([ticket_mask(mains, np.uint64) for mains, stars in tickets], dtype=np.uint64)
+        star_masks = np.array([ticket_mask(stars, np.uint16) for mains, stars in tickets], dtype=np.uint16)
+        main_matches = popcount(main_masks[:, None] & self.mains_masks[None, :])
+        star_matches = popcount(star_masks[:, None] & self.stars_masks[None, :])
+        return main_matches, star_matches
+
+    def prize_tiers(self, main_numbers, lucky_stars):
+        """Prize tier index won by one ticket in every draw, -1 where nothing was won"""
+        return prize_tiers(*self.match_counts(main_numbers, lucky_stars))
+
+    def tier_histogram(self, main_numbers, lucky_stars):
+        """Number of draws in which one ticket won each prize tier, indexed like PRIZE_TIERS"""
+        tiers = self.prize_tiers(main_numbers, lucky_stars)
+        return np.bincount(tiers[tiers >= 0], minlength=len(PRIZE_TIERS))
+
+    def tier_histograms(self, mains, stars):
+        """(tickets, 13) prize tier counts for (tickets, 5) main and (tickets, 2) star ball arrays"""
+        main_matches = popcount(balls_to_masks(mains, np.uint64)[:, None] & self.mains_masks[None, :])
+        star_matches = popcount(balls_to_masks(stars, np.uint16)[:, None] & self.stars_masks[None, :])
+        codes = main_matches * 3 + star_matches
+
+        # Most cells win nothing, so only the winning ones are counted, per (ticket, code)
+        won = np.flatnonzero(codes >= _MIN_WINNING_CODE)
+        rows = won // max(codes.shape[1], 1)
+        counts = np.bincount(rows * _CODE_COUNT + codes.ravel()[won], minlength=len(codes) * _CODE_COUNT)
+        return counts.reshape(len(codes), _CODE_COUNT)[:, _TIER_CODES]
@@ -0,0 +1,178 @@
+"""Local stand-in for the draws API, for trying downloads without the network.
+
+Serves a reproducible synthetic history at /v1/draws in the same format as
+the real API, honouring the ``date_from`` filter, ETag/Last-Modified
+conditional requests and gzip. Point the analyser at it with
+EUROMILLIONS_API_URL=http://localhost:8000/v1/draws.
+"""
+import argparse
+import json
+import random
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIRST_DRAW = date(2004, 2, 13)
+# Tuesday draws started on 10 May 2011
+TUESDAY_DRAWS_FROM = date(2011, 5, 10)
+
+
+def is_draw_day(day):
+    """Fridays, plus Tuesdays once those began"""
+    return day.weekday() == 4 or (day.weekday() == 1 and day >= TUESDAY_DRAWS_FROM)
+
+
+def draw_dates(until):
+    """Every draw date from the first draw up to ``until``"""
+    day = FIRST_DRAW
+    while day <= until:
+        if is_draw_day(day):
+            yield day
+        day += timedelta(days=1)
+
+
+def daily_dates(count):
+    """``count`` consecutive days from the first draw, for histories larger than the real one"""
+    for offset in range(count):
+        yield FIRST_DRAW + timedelta(days=offset)
+
+
+def iter_history(until, seed=0, count=None):
+    """Synthetic draws in API format, oldest first, generated lazily"""
+    rng = random.Random(seed)
+    dates = daily_dates(count) if count else draw_dates(until)
+    for draw_id, day in enumerate(dates, 1):
+        yield {
+            'id': draw_id,
+            'draw_id': int(day.strftime('%Y%m%d')),
+            'date': day.isoformat(),
+            'numbers': [str(num) for num in sorted(rng.sample(range(1, 51), 5))],
+            'stars': [str(star) for star in sorted(rng.sample(range(1, 13), 2))],
+        }
+
+
+def last_draw_date(until, count=None):
+    """Date of the newest draw served, the same for every date_from"""
+    if count:
+        return FIRST_DRAW + timedelta(days=count - 1)
+    day = until
+    while not is_draw_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+class DrawsHandler(BaseHTTPRequestHandler):
+    # Keep-alive with chunked bodies, so clients can reuse pooled connections
+    protocol_version = 'HTTP/1.1'
+
+    until = date.today()
+    seed = 0
+    count = None
+    ignore_filter = False
+
+    def do_GET(self):
+        request = urlparse(self.path)
+        if request.path.rstrip('/') != '/v1/draws':
+            self.send_error(404)
+            return
+
+        since = None
+        date_from = parse_qs(request.query).get('date_from')
+        if date_from and not self.ignore_filter:
+            try:
+                since = datetime.strptime(date_from[0], '%Y-%m-%d').date().isoformat()
+            except ValueError:
+                self.send_error(400, "date_from must be YYYY-MM-DD")
+                return
+
+        # The response only changes when the history does, so the validators
+        # are derived from what defines the history and the filter
+        etag = '"{}-{}-{}-{}"'.format(self.seed, self.until.isoformat(), self.count or 0, since or 'all')
+        last_modified = datetime.combine(last_draw_date(self.until, self.count), datetime.min.time(),
+                                         timezone.utc)
+        if self.not_modified(etag, last_modified):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', formatdate(last_modified.timestamp(), usegmt=True))
+        if gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        # The body is written as it is generated, so large histories never
+        # have to be held in memory on either side
+        compressor = zlib.compressobj(wbits=31) if gzip else None
+        separator = '['
+        pending = []
+        for draw in iter_history(self.until, self.seed, self.count):
+            if since and draw['date'] < since:
+                continue
+            pending.append(separator + json.dumps(draw))
+            separator = ','
+            if len(pending) == 1000:
+                self.write_chunk(''.join(pending).encode('utf-8'), compressor)
+                pending = []
+        pending.append(']' if separator == ',' else '[]')
+        self.write_chunk(''.join(pending).encode('utf-8'), compressor)
+        if compressor:
+            self.write_chunk(compressor.flush())
+        self.wfile.write(b'0\r\n\r\n')
+
+    def not_modified(self, etag, last_modified):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def write_chunk(self, data, compressor=None):
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            self.wfile.write('{:x}\r\n'.format(len(data)).encode('ascii') + data + b'\r\n')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--until', default=date.today().isoformat(),
+                        help="date of the newest draw served (YYYY-MM-DD)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--count', type=int,
+                        help="serve this many daily draws instead of the real schedule, e.g. 1000000")
+    parser.add_argument('--ignore-filter', action='store_true',
+                        help="always serve the full history, like a server without date filtering")
+    args = parser.parse_args()
+
+    DrawsHandler.until = datetime.strptime(args.until, '%Y-%m-%d').date()
+    DrawsHandler.seed = args.seed
+    DrawsHandler.count = args.count
+    DrawsHandler.ignore_filter = args.ignore_filter
+
+    server = ThreadingHTTPServer(('localhost', args.port), DrawsHandler)
+    print("Serving draws on http://localhost:{}/v1/draws".format(args.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
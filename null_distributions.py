@@ -0,0 +1,299 @@
+"""Null distributions of the bias statistics, simulated from fair draws.
+
+Each bias test reduces the draw history to one number. Rather than compare
+it with a textbook approximation, large numbers of synthetic histories of
+the same length are drawn from a fair lottery (five of 50 main numbers, two
+of 12 stars, every draw independent) and the same statistic is computed on
+each, giving its distribution when there is nothing to find. The p-value of
+the real history is the share of fair histories at least as extreme.
+
+Histories are simulated in vectorised batches spread over a process pool,
+and every statistic is computed from each batch at once, so one simulation
+per history length serves every test. Results are cached by (test, history
+length) in memory and, optionally, in a .npz file.
+"""
+import multiprocessing
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+# Fair histories simulated per history length
+SIMULATIONS = 1000
+SEED = 20040213
+
+# Simulated draws held at once; bounds the memory of one batch
+BATCH_DRAWS = 1 << 17
+
+# History lengths kept in the cache file
+SAVED_LENGTHS = 4
+
+# Statistic -> what it measures, every one larger when further from fair
+TESTS = {
+    'chi_square_main': "Chi-square of the main number frequencies",
+    'chi_square_stars': "Chi-square of the lucky star frequencies",
+    'cv_main': "Coefficient of variation (%) of the main number frequencies",
+    'cv_stars': "Coefficient of variation (%) of the lucky star frequencies",
+    'max_z_main': "Largest |z-score| of a main number frequency",
+    'temporal_changes': "Main numbers whose recent rate moved over 50% from their historical rate",
+    'sum_mean_deviation': "Distance of the mean main-number sum from 127.5",
+    'sum_skewness': "|Skewness| of the main-number sums",
+    'sum_kurtosis': "|Excess kurtosis| of the main-number sums",
+    'sequential_draws': "Draws that are consecutive runs, arithmetic progressions or share a last digit",
+    'recent_cluster': "Most appearances of one main number in the last 50 draws",
+    'max_pair': "Most appearances of one main-number pair",
+    'sum_trend': "|Linear trend| of the mean sum over half-overlapping 100-draw windows",
+    'position_variance': "Shortfall of the least variable sorted position's variance from the average",
+}
+
+_PAIR_FIRST, _PAIR_SECOND = np.triu_indices(5, 1)
+
+
+def recent_split(draws):
+    """(historical, recent) draw counts the temporal bias test compares"""
+    recent = 100 if draws >= 200 else draws - draws // 2
+    return draws - recent, recent
+
+
+def sample_draws(rng, rows, picked, pool):
+    """(rows, picked) distinct numbers from 1 to ``pool`` per row, each set equally likely.
+
+    Floyd's algorithm, one column at a time for all rows: the number for
+    column j is uniform below pool - picked + j + 1, replaced by that bound
+    when already taken.
+    """
+    chosen = np.empty((rows, picked), dtype=np.int64)
+    for column, bound in enumerate(range(pool - picked, pool)):
+        candidate = rng.integers(0, bound + 1, size=rows)
+        taken = (chosen[:, :column] == candidate[:, None]).any(axis=1)
+        chosen[:, column] = np.where(taken, bound, candidate)
+    return chosen + 1
+
+
+def _ball_counts(balls, size):
+    """(histories, size - 1) appearances of each ball in each history of (histories, draws, k) ``balls``"""
+    histories = len(balls)
+    codes = (np.arange(histories)[:, None, None] * size + balls).ravel()
+    return np.bincount(codes, minlength=histories * size).reshape(histories, size)[:, 1:]
+
+
+def _moments(values):
+    """Mean, standard deviation, skewness and excess kurtosis of each row"""
+    mean = values.mean(axis=1)
+    deviations = values - mean[:, None]
+    std = np.sqrt((deviations ** 2).mean(axis=1))
+    safe = np.where(std > 0, std, 1)
+    skewness = np.where(std > 0, (deviations ** 3).mean(axis=1) / safe ** 3, 0)
+    kurtosis = np.where(std > 0, (deviations ** 4).mean(axis=1) / safe ** 4 - 3, 0)
+    return mean, std, skewness, kurtosis
+
+
+def history_statistics(mains, stars):
+    """{test: (histories,) values} of every statistic in TESTS.
+
+    ``mains`` is (histories, draws, 5) and ``stars`` (histories, draws, 2),
+    in any order within a draw. The real history is passed as one history.
+    """
+    mains = np.sort(np.asarray(mains, dtype=np.int64), axis=2)
+    stars = np.asarray(stars, dtype=np.int64)
+    histories, draws = mains.shape[:2]
+    stats = {}
+
+    main_counts = _ball_counts(mains, 51)
+    star_counts = _ball_counts(stars, 13)
+    for kind, counts in (('main', main_counts), ('stars', star_counts)):
+        expected = counts.sum(axis=1) / counts.shape[1]
+        safe = np.where(expected > 0, expected, 1)
+        stats['chi_square_' + kind] = ((counts - expected[:, None]) ** 2).sum(axis=1) / safe
+        stats['cv_' + kind] = counts.std(axis=1) / safe * 100
+    expected = draws * 5 / 50
+    stats['max_z_main'] = np.abs(main_counts - expected).max(axis=1) / max(expected, 1e-12) ** 0.5
+
+    historical, recent = recent_split(draws)
+    old_counts = _ball_counts(mains[:, :historical], 51)
+    new_counts = main_counts - old_counts
+    seen = old_counts > 0
+    change = np.divide(new_counts * max(historical, 1), old_counts * max(recent, 1),
+                       out=np.ones(old_counts.shape), where=seen) - 1
+    stats['temporal_changes'] = (seen & (np.abs(change) > 0.5) & (new_counts >= 3)).sum(axis=1)
+
+    sums = mains.sum(axis=2).astype(np.float64)
+    mean, std, skewness, kurtosis = _moments(sums)
+    stats['sum_mean_deviation'] = np.abs(mean - 127.5)
+    stats['sum_skewness'] = np.abs(skewness)
+    stats['sum_kurtosis'] = np.abs(kurtosis)
+
+    gaps = np.diff(mains, axis=2)
+    last_digits = mains % 10
+    consecutive = (gaps == 1).all(axis=2)
+    progression = (gaps == gaps[:, :, :1]).all(axis=2) & (gaps[:, :, 0] > 1)
+    same_last_digit = (last_digits == last_digits[:, :, :1]).all(axis=2)
+    stats['sequential_draws'] = (consecutive | progression | same_last_digit).sum(axis=1)
+
+    stats['recent_cluster'] = _ball_counts(mains[:, -50:], 51).max(axis=1)
+
+    pair_codes = (np.arange(histories)[:, None, None] * 2601
+                  + mains[:, :, _PAIR_FIRST] * 51 + mains[:, :, _PAIR_SECOND]).ravel()
+    stats['max_pair'] = np.bincount(pair_codes, minlength=histories * 2601).reshape(histories, 2601).max(axis=1)
+
+    # Mean sum of half-overlapping 100-draw windows, as the anomaly report takes them
+    starts = np.arange(0, max(draws - 100, 0), 50) if draws >= 200 else np.zeros(0, dtype=np.int64)
+    if len(starts) > 4:
+        prefix = np.zeros((histories, draws + 1))
+        np.cumsum(sums, axis=1, out=prefix[:, 1:])
+        windows = (prefix[:, starts + 100] - prefix[:, starts]) / 100
+        offsets = np.arange(len(starts)) - len(starts) / 2
+        stats['sum_trend'] = np.abs((offsets * (windows - windows.mean(axis=1)[:, None])).sum(axis=1))
+    else:
+        stats['sum_trend'] = np.zeros(histories)
+
+    variances = mains.var(axis=1)
+    average = variances.mean(axis=1)
+    stats['position_variance'] = np.where(average > 0, 1 - variances.min(axis=1) / np.where(average > 0, average, 1), 0)
+    return stats
+
+
+def simulate_batch(task):
+    """{test: values} for a batch of fair histories; ``task`` is (histories, draws, seed, batch)"""
+    histories, draws, seed, batch = task
+    rng = np.random.default_rng([seed, draws, batch])
+    mains = sample_draws(rng, histories * draws, 5, 50).reshape(histories, draws, 5)
+    stars = sample_draws(rng, histories * draws, 2, 12).reshape(histories, draws, 2)
+    return history_statistics(mains, stars)
+
+
+def p_value(null, observed, tail='upper'):
+    """Share of the sorted ``null`` values at least as extreme as ``observed``, counting the observation itself.
+
+    ``tail`` is 'upper' (as large or larger) or 'lower' (as small or smaller).
+    """
+    slack = 1e-9 * max(1.0, abs(observed))
+    if tail == 'lower':
+        extreme = np.searchsorted(null, observed + slack, side='right')
+    else:
+        extreme = len(null) - np.searchsorted(null, observed - slack, side='left')
+    return (int(extreme) + 1) / (len(null) + 1)
+
+
+class NullDistributions:
+    """Sorted null distribution of every test in TESTS, per history length.
+
+    ``simulations`` fair histories are drawn for each length, over
+    ``processes`` worker processes (default: one per CPU; inline when 1 or
+    when already inside a pool worker). With ``path``, distributions are
+    also kept in that .npz file between runs.
+    """
+
+    def __init__(self, simulations=SIMULATIONS, processes=None, seed=SEED, path=None):
+        self.simulations = simulations
+        self.processes = processes
+        self.seed = seed
+        self.path = path
+        self._cache = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def distribution(self, test, draws, progress=None):
+        """Sorted simulated values of ``test`` over fair histories of ``draws`` draws"""
+        return self.distributions(draws, progress)[test]
+
+    def distributions(self, draws, progress=None):
+        """{test: sorted simulated values} for histories of ``draws`` draws.
+
+        Simulated on first use for each length; ``progress(done, total)`` is
+        then called with the histories simulated so far.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if any((test, draws) not in self._cache for test in TESTS):
+                for test, values in self._simulate(draws, progress).items():
+                    values.setflags(write=False)
+                    self._cache[test, draws] = values
+                self._save(draws)
+            return {test: self._cache[test, draws] for test in TESTS}
+
+    def _simulate(self, draws, progress):
+        per_batch = max(1, BATCH_DRAWS // max(draws, 1))
+        tasks = [(min(per_batch, self.simulations - start), draws, self.seed, batch)
+                 for batch, start in enumerate(range(0, self.simulations, per_batch))]
+
+        processes = self.processes or os.cpu_count() or 1
+        # Pool workers are daemonic and can't start pools of their own
+        if processes == 1 or len(tasks) == 1 or multiprocessing.current_process().daemon:
+            pool = None
+            results = map(simulate_batch, tasks)
+        else:
+            # Spawned rather than forked: callers such as the GUI simulate on a
+            # worker thread, and forking a threaded process can copy held locks
+            pool = multiprocessing.get_context('spawn').Pool(min(processes, len(tasks)))
+            results = pool.imap(simulate_batch, tasks)
+
+        batches = []
+        try:
+            done = 0
+            for (histories, _, _, _), stats in zip(tasks, results):
+                batches.append(stats)
+                done += histories
+                if progress:
+                    progress(done, self.simulations)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        return {test: np.sort(np.concatenate([stats[test] for stats in batches]).astype(np.float64))
+                for test in TESTS}
+
+    def preload(self, draws, distributions):
+        """Use ``distributions`` ({test: sorted values}), simulated elsewhere, for histories of ``draws`` draws"""
+        with self._lock:
+            for test, values in distributions.items():
+                values = np.array(values, dtype=np.float64)
+                values.setflags(write=False)
+                self._cache[test, draws] = values
+
+    def _read(self):
+        """{(test, draws): values} in the cache file for this many simulations"""
+        stored_values = {}
+        if not self.path or not os.path.exists(self.path):
+            return stored_values
+        try:
+            with np.load(self.path) as stored:
+                for key in stored.files:
+                    test, draws = key.rsplit('@', 1)
+                    if test in TESTS and len(stored[key]) == self.simulations:
+                        stored_values[test, int(draws)] = stored[key]
+        except Exception as e:
+            print(f"Error reading null distribution cache: {e}")
+        return stored_values
+
+    def _load(self):
+        self._loaded = True
+        self._cache.update(self._read())
+
+    def _save(self, draws):
+        if not self.path:
+            return
+        # Other processes may have saved lengths of their own since this one
+        # loaded; keep them, and write through a temp file of this process's own.
+        # Only the length just simulated and the longest few others are kept,
+        # so the file doesn't grow with every draw added to the history
+        stored = self._read()
+        others = sorted({length for test, length in [*stored, *self._cache] if length != draws}, reverse=True)
+        kept = {draws, *others[:SAVED_LENGTHS - 1]}
+        for (test, length), values in stored.items():
+            if length in kept:
+                self._cache.setdefault((test, length), values)
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(self.path) + ".",
+                                             dir=os.path.dirname(os.path.abspath(self.path)))
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **{f"{test}@{length}": values
+                               for (test, length), values in self._cache.items() if length in kept})
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving null distribution cache: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
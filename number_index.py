@@ -0,0 +1,71 @@
+import numpy as np
+
+
+class NumberIndex:
+    """Inverted index from each ball to the sorted positions of the draws it appeared in.
+
+    Built once from an (n, k) ball matrix and extended as draws are appended.
+    Positions are draw indices into the store, so lookups are binary searches
+    over short per-ball arrays instead of scans of the whole history.
+    """
+
+    def __init__(self, balls, size):
+        balls = np.asarray(balls)
+        self.size = size
+        self._draws = 0
+        self._positions = [np.zeros(0, dtype=np.int64) for _ in range(size)]
+        self.extend(balls)
+
+    def __len__(self):
+        return self._draws
+
+    def extend(self, balls):
+        """Index draws appended after the ones already indexed"""
+        balls = np.asarray(balls)
+        if not len(balls):
+            return
+
+        # A stable sort of the flattened balls groups each ball's rows together,
+        # still in draw order
+        flat = balls.ravel().astype(np.int64)
+        order = np.argsort(flat, kind='stable')
+        rows = order // balls.shape[1] + self._draws
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(flat, minlength=self.size))))
+
+        for ball in np.flatnonzero(bounds[1:] > bounds[:-1]).tolist():
+            new_positions = rows[bounds[ball]:bounds[ball + 1]]
+            if len(self._positions[ball]):
+                new_positions = np.concatenate((self._positions[ball], new_positions))
+            self._positions[ball] = new_positions
+        self._draws += len(balls)
+
+    def positions(self, ball):
+        """Ascending draw indices in which ``ball`` appeared"""
+        return self._positions[ball]
+
+    def count(self, ball):
+        return len(self._positions[ball])
+
+    def last_seen(self, ball, before=None):
+        """Index of the latest draw before ``before`` containing ``ball``, -1 if none"""
+        return self.nth_previous(ball, 1, before)
+
+    def nth_previous(self, ball, n, before=None):
+        """Index of the ``n``-th most recent appearance of ``ball`` before draw ``before``, -1 if none"""
+        positions = self._positions[ball]
+        end = len(positions) if before is None else int(np.searchsorted(positions, before))
+        return int(positions[end - n]) if end >= n else -1
+
+    def last_seen_all(self):
+        """Index of the latest draw containing each ball, -1 if never drawn"""
+        return np.array([positions[-1] if len(positions) else -1 for positions in self._positions],
+                        dtype=np.int64)
+
+    def gaps(self, ball):
+        """Draws between consecutive appearances of ``ball``"""
+        return np.diff(self._positions[ball])
+
+    def count_between(self, ball, start, stop):
+        """Appearances of ``ball`` in draws [start, stop)"""
+        positions = self._positions[ball]
+        return int(np.searchsorted(positions, stop) - np.searchsorted(positions, start))
@@ -0,0 +1,75 @@
+"""Text reports as a stream of lines.
+
+Reports are built with ``report += text`` like a string, but are kept as
+a list of lines so a viewer can fetch just the rows it shows. Long tables
+can be added with add_rows(), whose rows are only formatted when read.
+"""
+from bisect import bisect_right
+
+
+class Report:
+    """Lines of a text report; ``str(report)`` is the full text"""
+
+    def __init__(self, text=""):
+        self._segments = []  # lists of lines, or (count, row function) for lazy rows
+        self._starts = []    # first line number of each segment
+        self._count = 0
+        self._tail = ""      # text after the last newline
+        self += text
+
+    def __iadd__(self, text):
+        lines = (self._tail + text).split('\n')
+        self._tail = lines.pop()
+        if lines:
+            if self._segments and isinstance(self._segments[-1], list):
+                self._segments[-1].extend(lines)
+            else:
+                self._starts.append(self._count)
+                self._segments.append(lines)
+            self._count += len(lines)
+        return self
+
+    def add_rows(self, count, row):
+        """Append ``count`` lines, line i being ``row(i)``, formatted only when read"""
+        if self._tail:
+            self += "\n"
+        if count:
+            self._starts.append(self._count)
+            self._segments.append((count, row))
+            self._count += count
+
+    def __len__(self):
+        """Number of lines, counting an unfinished last line"""
+        return self._count + (1 if self._tail else 0)
+
+    def line(self, index):
+        if index == self._count and self._tail:
+            return self._tail
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        segment = bisect_right(self._starts, index) - 1
+        lines = self._segments[segment]
+        offset = index - self._starts[segment]
+        if isinstance(lines, list):
+            return lines[offset]
+        return lines[1](offset)
+
+    def lines(self, start=0, stop=None):
+        """Lines ``start`` to ``stop``, without their newlines"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [self.line(index) for index in range(max(start, 0), stop)]
+
+    def __iter__(self):
+        for lines in self._segments:
+            if isinstance(lines, list):
+                yield from lines
+            else:
+                count, row = lines
+                for index in range(count):
+                    yield row(index)
+        if self._tail:
+            yield self._tail
+
+    def __str__(self):
+        text = ''.join(line + '\n' for line in self.lines(0, self._count))
+        return text + self._tail
@@ -0,0 +1,100 @@
+"""Scrollable pane that renders only the visible lines of a report."""
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+from report import Report
+
+
+class ReportView(ttk.Frame):
+    """Read-only text pane for a Report or a string.
+
+    Only the lines in view are put into the Text widget, and the vertical
+    scrollbar is driven from the report's line count, so showing and
+    scrolling a report cost the same however long it is.
+    """
+
+    def __init__(self, parent, height=15, width=70):
+        super().__init__(parent)
+        self.report = Report()
+        self.top = 0
+        self.rows = height
+
+        self.text = tk.Text(self, height=height, width=width, wrap='none', state='disabled')
+        self.vbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.hbar = ttk.Scrollbar(self, orient='horizontal', command=self.text.xview)
+        self.text.configure(xscrollcommand=self.hbar.set)
+        self.text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.vbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.hbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.menu = tk.Menu(self, tearoff=0)
+        self.menu.add_command(label="Copy Report", command=self.copy_report)
+
+        self.text.bind('<Configure>', self.on_resize)
+        self.text.bind('<Button-1>', lambda event: self.text.focus_set())
+        self.text.bind('<Button-3>', lambda event: self.menu.tk_popup(event.x_root, event.y_root))
+        self.text.bind('<MouseWheel>', lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self.text.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.text.bind('<Button-5>', lambda event: self.scroll(3))
+        for key, lines in (('<Up>', -1), ('<Down>', 1)):
+            self.text.bind(key, lambda event, lines=lines: self.scroll(lines))
+        for key, pages in (('<Prior>', -1), ('<Next>', 1)):
+            self.text.bind(key, lambda event, pages=pages: self.scroll(pages * self.rows))
+        self.text.bind('<Control-Home>', lambda event: self.scroll_to(0))
+        self.text.bind('<Control-End>', lambda event: self.scroll_to(len(self.report)))
+
+    def show(self, report):
+        """Show ``report`` (a Report or a string) from its first line"""
+        self.report = report if isinstance(report, Report) else Report(report)
+        self.top = 0
+        self.render()
+
+    def on_resize(self, event):
+        linespace = tkfont.Font(font=self.text.cget('font')).metrics('linespace')
+        rows = max(1, event.height // max(linespace, 1))
+        if rows != self.rows:
+            self.rows = rows
+            self.render()
+
+    def scroll(self, lines):
+        self.scroll_to(self.top + lines)
+        return 'break'
+
+    def scroll_to(self, top):
+        top = max(0, min(top, len(self.report) - self.rows))
+        if top != self.top:
+            self.top = top
+            self.render()
+        return 'break'
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' or 'pages')"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.report)))
+        elif args[0] == 'scroll':
+            step = self.rows if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def render(self):
+        # One extra line fills a partly visible row at the bottom
+        lines = self.report.lines(self.top, self.top + self.rows + 1)
+        x = self.text.xview()[0]
+        self.text.configure(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', '\n'.join(lines))
+        self.text.configure(state='disabled')
+        self.text.xview_moveto(x)
+
+        total = len(self.report)
+        if total > self.rows:
+            self.vbar.set(self.top / total, min(1.0, (self.top + self.rows) / total))
+        else:
+            self.vbar.set(0.0, 1.0)
+
+    def copy_report(self):
+        """Put the whole report, not just the lines in view, on the clipboard"""
+        self.clipboard_clear()
+        self.clipboard_append(str(self.report))
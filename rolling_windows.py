@@ -0,0 +1,136 @@
+import numpy as np
+
+MAIN_SIZE = 51
+STAR_SIZE = 13
+
+# Draws between stored per-number count checkpoints
+BLOCK = 64
+
+
+class RollingWindows:
+    """Per-number counts, ball sums and odd counts over any run of consecutive draws.
+
+    Totals are kept as prefixes: the cumulative ball sum and odd count after
+    every draw, and cumulative per-number counts every BLOCK draws. A window
+    of draws [start, stop) is the difference of two prefixes, whatever its
+    size, and appending a draw costs a constant amount of work. Counts
+    between checkpoints are made up from at most BLOCK - 1 draws.
+    """
+
+    def __init__(self, mains, stars):
+        self.draws = 0
+        self._balls = {'main': np.zeros((0, 5), dtype=np.uint8), 'star': np.zeros((0, 2), dtype=np.uint8)}
+        self._sizes = {'main': MAIN_SIZE, 'star': STAR_SIZE}
+        self._checkpoints = {kind: np.zeros((1, size), dtype=np.int64) for kind, size in self._sizes.items()}
+        self._running = {kind: np.zeros(size, dtype=np.int64) for kind, size in self._sizes.items()}
+        self._sum_prefix = np.zeros(1, dtype=np.int64)
+        self._odd_prefix = np.zeros(1, dtype=np.int64)
+        self.extend(mains, stars)
+
+    def __len__(self):
+        return self.draws
+
+    def _grow(self, capacity):
+        for kind, balls in self._balls.items():
+            grown = np.zeros((capacity, balls.shape[1]), dtype=np.uint8)
+            grown[:self.draws] = balls[:self.draws]
+            self._balls[kind] = grown
+            checkpoints = np.zeros((capacity // BLOCK + 1, self._sizes[kind]), dtype=np.int64)
+            checkpoints[:len(self._checkpoints[kind])] = self._checkpoints[kind]
+            self._checkpoints[kind] = checkpoints
+        for name in ('_sum_prefix', '_odd_prefix'):
+            grown = np.zeros(capacity + 1, dtype=np.int64)
+            grown[:self.draws + 1] = getattr(self, name)[:self.draws + 1]
+            setattr(self, name, grown)
+
+    def extend(self, mains, stars):
+        """Add newly appended draws"""
+        mains = np.asarray(mains, dtype=np.uint8).reshape(-1, 5)
+        stars = np.asarray(stars, dtype=np.uint8).reshape(-1, 2)
+        added = len(mains)
+        if not added:
+            return
+        first, last = self.draws, self.draws + added
+        if last > len(self._balls['main']):
+            self._grow(max(last, 2 * len(self._balls['main']), 1024))
+
+        sums = mains.sum(axis=1, dtype=np.int64)
+        odds = (mains & 1).sum(axis=1, dtype=np.int64)
+        self._sum_prefix[first + 1:last + 1] = self._sum_prefix[first] + np.cumsum(sums)
+        self._odd_prefix[first + 1:last + 1] = self._odd_prefix[first] + np.cumsum(odds)
+
+        # Checkpoints crossed by the new draws: counts of each block's new draws, accumulated
+        first_block = first // BLOCK
+        blocks = np.arange(first, last) // BLOCK - first_block
+        block_count = int(blocks[-1]) + 1
+        for kind, balls in (('main', mains), ('star', stars)):
+            size = self._sizes[kind]
+            self._balls[kind][first:last] = balls
+            codes = (blocks[:, None] * size + balls).ravel()
+            per_block = np.bincount(codes, minlength=block_count * size).reshape(block_count, size)
+            cumulative = self._running[kind] + np.cumsum(per_block, axis=0)
+            full_blocks = last // BLOCK - first_block
+            self._checkpoints[kind][first_block + 1:first_block + 1 + full_blocks] = cumulative[:full_blocks]
+            self._running[kind] = cumulative[-1]
+        self.draws = last
+
+    def prefix_counts(self, positions, kind='main'):
+        """Appearances of each ball in the first ``positions`` draws; one row per position for arrays"""
+        positions = np.asarray(positions, dtype=np.int64)
+        flat = positions.reshape(-1)
+        size = self._sizes[kind]
+        blocks = flat // BLOCK
+        counts = self._checkpoints[kind][blocks]
+
+        # Draws after each position's checkpoint, counted per position
+        lengths = flat - blocks * BLOCK
+        total = int(lengths.sum())
+        if total:
+            owners = np.repeat(np.arange(len(flat)), lengths)
+            rows = np.repeat(blocks * BLOCK - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+            codes = (owners[:, None] * size + self._balls[kind][rows]).ravel()
+            counts = counts + np.bincount(codes, minlength=len(flat) * size).reshape(len(flat), size)
+        return counts.reshape(positions.shape + (size,))
+
+    def counts(self, start, stop, kind='main'):
+        """Appearances of each ball, indexed by ball, in draws [start, stop); start and stop may be arrays"""
+        return self.prefix_counts(stop, kind) - self.prefix_counts(start, kind)
+
+    def sum_total(self, start, stop):
+        """Total of the main numbers drawn in draws [start, stop)"""
+        return self._sum_prefix[stop] - self._sum_prefix[start]
+
+    def odd_total(self, start, stop):
+        """Odd main numbers drawn in draws [start, stop)"""
+        return self._odd_prefix[stop] - self._odd_prefix[start]
+
+    def window(self, size, end=None):
+        """Statistics of the last ``size`` draws before draw ``end`` (default: all draws)"""
+        stop = self.draws if end is None else min(end, self.draws)
+        start = max(0, stop - size)
+        draws = stop - start
+        return {
+            'start': start,
+            'stop': stop,
+            'draws': draws,
+            'main_counts': self.counts(start, stop, 'main'),
+            'star_counts': self.counts(start, stop, 'star'),
+            'mean_sum': int(self.sum_total(start, stop)) / draws if draws else 0,
+            'odd_ratio': int(self.odd_total(start, stop)) / (draws * 5) if draws else 0
+        }
+
+    def windows(self, sizes, end=None):
+        """{size: window(size, end)} for several window sizes at once"""
+        return {size: self.window(size, end) for size in sizes}
+
+    def rolling(self, size, step=1):
+        """Statistics of every window of ``size`` draws, starting every ``step`` draws, as arrays"""
+        starts = np.arange(0, max(self.draws - size + 1, 0), step, dtype=np.int64)
+        stops = starts + size
+        return {
+            'starts': starts,
+            'main_counts': self.counts(starts, stops, 'main'),
+            'star_counts': self.counts(starts, stops, 'star'),
+            'mean_sum': self.sum_total(starts, stops) / size,
+            'odd_ratio': self.odd_total(starts, stops) / (size * 5)
+        }
@@ -0,0 +1,308 @@
+"""Ticket strategies of the smart number generator.
+
+Each strategy is a function of ``(stats, rng)``: the statistics it reads
+come from a StrategyStats and its random choices from ``rng``, the random
+module or a random.Random. StrategyStats is kept up to date one draw at a
+time, so the same strategies can be run over the whole history or, in a
+backtest, over only the draws before any point in it.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from constrained_sampler import ConstrainedSampler
+from weighted_sampler import WeightedSampler
+
+# Draws the hot-number window looks back over
+HOT_WINDOW = 20
+# Draws after which a draw counts half as much in the recency-weighted counts
+DECAY_HALF_LIFE = 52
+# Pseudo-count added to every number's weight, so numbers not drawn yet keep a chance
+PRIOR_WEIGHT = 1
+
+_DECAY = 0.5 ** (1 / DECAY_HALF_LIFE)
+
+
+class StrategyStats:
+    """Per-number counts, decayed counts, pair counts, recent counts and last-seen dates of a draw history.
+
+    Built from (dates, mains, stars) arrays and extended with add() or
+    extend() as draws arrive, at a constant cost per draw.
+    """
+
+    def __init__(self, dates=(), mains=(), stars=()):
+        self.draws = 0
+        self.latest_date = None
+        self.sum_total = 0
+        self.main_counts = np.zeros(51, dtype=np.int64)
+        self.star_counts = np.zeros(13, dtype=np.int64)
+        # Counts with every draw weighted by _DECAY ** (draws since it)
+        self.decayed_main_counts = np.zeros(51)
+        self.decayed_star_counts = np.zeros(13)
+        self.pair_counts = np.zeros((51, 51), dtype=np.int64)
+        self.recent_counts = np.zeros(51, dtype=np.int64)
+        self.last_seen = np.full(51, -1, dtype=np.int64)
+        self._recent = []
+        self.extend(dates, mains, stars)
+
+    def __len__(self):
+        return self.draws
+
+    def extend(self, dates, mains, stars):
+        """Add several draws at once"""
+        dates = np.asarray(dates, dtype=np.int64).reshape(-1)
+        mains = np.sort(np.asarray(mains, dtype=np.int64).reshape(-1, 5), axis=1)
+        stars = np.asarray(stars, dtype=np.int64).reshape(-1, 2)
+        if not len(dates):
+            return
+        self.draws += len(dates)
+        self.latest_date = int(dates[-1])
+        self.sum_total += int(mains.sum())
+        self.main_counts += np.bincount(mains.ravel(), minlength=51)
+        self.star_counts += np.bincount(stars.ravel(), minlength=13)
+        factors = _DECAY ** np.arange(len(dates) - 1, -1, -1)
+        self.decayed_main_counts *= _DECAY ** len(dates)
+        self.decayed_main_counts += np.bincount(mains.ravel(), np.repeat(factors, 5), minlength=51)
+        self.decayed_star_counts *= _DECAY ** len(dates)
+        self.decayed_star_counts += np.bincount(stars.ravel(), np.repeat(factors, 2), minlength=13)
+        first, second = np.triu_indices(5, 1)
+        self.pair_counts += np.bincount((mains[:, first] * 51 + mains[:, second]).ravel(),
+                                        minlength=51 * 51).reshape(51, 51)
+        # Later draws overwrite earlier ones, so each ball keeps its latest date
+        np.maximum.at(self.last_seen, mains.ravel(), np.repeat(dates, 5))
+
+        self._recent = (self._recent + mains.tolist())[-HOT_WINDOW:]
+        self.recent_counts = np.bincount(np.array(self._recent, dtype=np.int64).ravel(), minlength=51)
+
+    def add(self, date, mains, stars):
+        """Add the next draw"""
+        mains = sorted(int(ball) for ball in mains)
+        self.draws += 1
+        self.latest_date = int(date)
+        self.sum_total += sum(mains)
+        self.main_counts[mains] += 1
+        self.star_counts[list(stars)] += 1
+        self.decayed_main_counts *= _DECAY
+        self.decayed_main_counts[mains] += 1
+        self.decayed_star_counts *= _DECAY
+        self.decayed_star_counts[list(stars)] += 1
+        for i, low in enumerate(mains):
+            self.pair_counts[low, mains[i + 1:]] += 1
+        self.last_seen[mains] = self.latest_date
+
+        self._recent.append(mains)
+        self.recent_counts[mains] += 1
+        if len(self._recent) > HOT_WINDOW:
+            self.recent_counts[self._recent.pop(0)] -= 1
+
+    def sum_range(self):
+        """(low, high) main-number sums recommended by the balanced strategy: the mean ± 25"""
+        average = self.sum_total / self.draws
+        return int(average - 25), int(average + 25)
+
+    def hot_numbers(self):
+        """Up to 8 numbers drawn over 1.5 times as often as average in the last HOT_WINDOW draws"""
+        threshold = len(self._recent) * 5 / 50 * 1.5
+        return [int(num) for num in np.flatnonzero(self.recent_counts > threshold)[:8]]
+
+    def top_pair(self):
+        """The most frequent main-number pair, the lowest first on ties; None before any draw"""
+        best = int(np.argmax(self.pair_counts))
+        if not self.pair_counts.flat[best]:
+            return None
+        return divmod(best, 51)
+
+    def overdue_numbers(self, days):
+        """Numbers drawn before but not within ``days`` days of the latest draw"""
+        seen = self.last_seen >= 0
+        return [int(num) for num in np.flatnonzero(seen & (self.latest_date - self.last_seen > days))]
+
+    def star_ranking(self):
+        """Stars drawn so far, most frequent first, lower stars first on ties"""
+        order = np.argsort(-self.star_counts[1:], kind='stable') + 1
+        return [int(star) for star in order if self.star_counts[star]]
+
+    def frequency_weights(self):
+        """(main, star) weights of balls 1-50 and 1-12: how often each has been drawn"""
+        return self.main_counts[1:] + PRIOR_WEIGHT, self.star_counts[1:] + PRIOR_WEIGHT
+
+    def recency_weights(self):
+        """(main, star) weights of balls 1-50 and 1-12: counts decaying with a DECAY_HALF_LIFE half-life"""
+        return self.decayed_main_counts[1:] + PRIOR_WEIGHT, self.decayed_star_counts[1:] + PRIOR_WEIGHT
+
+    def overdue_weights(self):
+        """Weights of main numbers 1-50: days since each was last drawn, the longest gap if never"""
+        last_seen = self.last_seen[1:]
+        seen = last_seen >= 0
+        gaps = np.where(seen, self.latest_date - last_seen, 0)
+        gaps[~seen] = gaps.max()
+        return gaps + PRIOR_WEIGHT
+
+
+@lru_cache(maxsize=16)
+def balanced_sampler(low, high):
+    """Sampler of the balanced strategy's main numbers: one per decade, 2-3 odd, sum from low to high"""
+    sampler = ConstrainedSampler(sums=(low, high), odd_counts=(2, 3), group_counts=[1] * 5)
+    if not sampler.count:
+        # A sum window no one-per-decade ticket reaches; keep the other rules
+        sampler = ConstrainedSampler(odd_counts=(2, 3), group_counts=[1] * 5)
+    return sampler
+
+
+def balanced_ticket(stats, rng):
+    # Main numbers uniformly among the combinations in the optimal sum range,
+    # with a 2-3 odd/even balance and one number in each decade
+    main_numbers = balanced_sampler(*stats.sum_range()).draw(rng)
+
+    # Generate lucky stars
+    stars = set()
+    while len(stars) < 2:
+        stars.add(rng.randint(1, 12))
+
+    return main_numbers, list(stars)
+
+
+def hot_ticket(stats, rng):
+    # Use hot numbers from recent draws
+    hot_numbers = stats.hot_numbers()
+
+    main_numbers = set()
+
+    # Use 3-4 hot numbers
+    hot_to_use = min(4, len(hot_numbers))
+    main_numbers.update(rng.sample(hot_numbers, hot_to_use))
+
+    # Fill remaining with random numbers
+    while len(main_numbers) < 5:
+        num = rng.randint(1, 50)
+        main_numbers.add(num)
+
+    # Random lucky stars
+    stars = rng.sample(range(1, 13), 2)
+
+    return list(main_numbers), stars
+
+
+def pattern_ticket(stats, rng):
+    # Use most common number pair
+    pair = stats.top_pair()
+
+    main_numbers = set()
+
+    # Use top pair
+    if pair:
+        main_numbers.update(pair)
+
+    # Add more numbers ensuring good distribution
+    while len(main_numbers) < 5:
+        num = rng.randint(1, 50)
+        main_numbers.add(num)
+
+    # Lucky stars based on frequency
+    popular_stars = stats.star_ranking()[:6]
+    stars = rng.sample(popular_stars, 2)
+
+    return list(main_numbers), stars
+
+
+def overdue_ticket(stats, rng):
+    # Use numbers not seen in 30+ days
+    overdue_numbers = stats.overdue_numbers(30)
+
+    main_numbers = set()
+
+    # Use 2-3 overdue numbers
+    if overdue_numbers:
+        overdue_to_use = min(3, len(overdue_numbers))
+        main_numbers.update(rng.sample(overdue_numbers, overdue_to_use))
+
+    # Fill remaining
+    while len(main_numbers) < 5:
+        num = rng.randint(1, 50)
+        main_numbers.add(num)
+
+    # Random lucky stars
+    stars = rng.sample(range(1, 13), 2)
+
+    return list(main_numbers), stars
+
+
+def hybrid_ticket(stats, rng):
+    # Combine multiple strategies
+    main_numbers = set()
+
+    # Add one hot number
+    hot_numbers = stats.hot_numbers()
+    if hot_numbers:
+        main_numbers.add(rng.choice(hot_numbers))
+
+    # Add one from top pair
+    pair = stats.top_pair()
+    if pair:
+        main_numbers.add(rng.choice(pair))
+
+    # Add one overdue number (if available)
+    overdue_candidates = [num for num in stats.overdue_numbers(20) if num not in main_numbers]
+    if overdue_candidates:
+        main_numbers.add(rng.choice(overdue_candidates))
+
+    # Fill remaining with balanced selection
+    while len(main_numbers) < 5:
+        num = rng.randint(1, 50)
+        main_numbers.add(num)
+
+    # Lucky stars - one frequent, one less frequent
+    star_ranking = stats.star_ranking()
+    frequent_stars = star_ranking[:6]
+    less_frequent_stars = star_ranking[-6:]
+
+    stars = []
+    if frequent_stars:
+        stars.append(rng.choice(frequent_stars))
+    if less_frequent_stars and len(stars) < 2:
+        candidates = [s for s in less_frequent_stars if s not in stars]
+        if candidates:
+            stars.append(rng.choice(candidates))
+
+    while len(stars) < 2:
+        star = rng.randint(1, 12)
+        if star not in stars:
+            stars.append(star)
+
+    return list(main_numbers), stars
+
+
+def frequency_ticket(stats, rng):
+    """Numbers and stars drawn in proportion to how often each has come up"""
+    main_weights, star_weights = stats.frequency_weights()
+    return WeightedSampler(main_weights, 5).draw(rng), WeightedSampler(star_weights, 2).draw(rng)
+
+
+def recency_ticket(stats, rng):
+    """Numbers and stars drawn in proportion to their counts, recent draws counting most"""
+    main_weights, star_weights = stats.recency_weights()
+    return WeightedSampler(main_weights, 5).draw(rng), WeightedSampler(star_weights, 2).draw(rng)
+
+
+def due_ticket(stats, rng):
+    """Numbers drawn in proportion to the days since each last came up, random stars"""
+    return WeightedSampler(stats.overdue_weights(), 5).draw(rng), rng.sample(range(1, 13), 2)
+
+
+def random_ticket(stats, rng):
+    """Uniformly random ticket, the baseline the strategies are measured against"""
+    return rng.sample(range(1, 51), 5), rng.sample(range(1, 13), 2)
+
+
+# Strategy name -> (title, function), in the order the generator shows them
+STRATEGIES = {
+    'balanced': ("Balanced Strategy", balanced_ticket),
+    'hot': ("Hot Numbers Strategy", hot_ticket),
+    'pattern': ("Pattern-Based Strategy", pattern_ticket),
+    'overdue': ("Overdue Strategy", overdue_ticket),
+    'hybrid': ("Hybrid Strategy", hybrid_ticket),
+    'frequency': ("Frequency-Weighted Strategy", frequency_ticket),
+    'recency': ("Recency-Weighted Strategy", recency_ticket),
+    'due': ("Due-Weighted Strategy", due_ticket),
+}
+BASELINE = 'random'
@@ -0,0 +1,146 @@
+"""Run slow analyses off the Tk main thread.
+
+TaskRunner executes submitted functions on worker threads and hands their
+progress, results and errors back through a queue that the Tk event loop
+polls with ``after()``, so callbacks always run on the main thread. Code
+running inside a task reports progress and notices cancellation by calling
+checkpoint(); outside a task checkpoint() does nothing, so headless callers
+are unaffected.
+"""
+import queue
+import threading
+
+_current = threading.local()
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task by checkpoint() once the task has been cancelled"""
+
+
+def checkpoint(fraction, stage=None):
+    """Report that the running task is ``fraction`` (0-1) done, stopping it here if cancelled"""
+    task = getattr(_current, 'task', None)
+    if task is not None:
+        task.report(fraction, stage)
+
+
+class Task:
+    """One submitted function call and its callbacks"""
+
+    def __init__(self, name, func, args, on_done=None, on_error=None, on_cancelled=None):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.fraction = 0.0
+        self.stage = None
+        self._cancel = threading.Event()
+        self._events = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Ask the task to stop at its next checkpoint"""
+        self._cancel.set()
+
+    def report(self, fraction, stage=None):
+        if self.cancelled:
+            raise TaskCancelled(self.name)
+        self._events.put(('progress', self, (fraction, stage)))
+
+
+class TaskRunner:
+    """Worker threads for slow functions, with results delivered on the Tk thread.
+
+    ``root`` only needs ``after(ms, callback)``. ``on_progress(task)`` is
+    called on the Tk thread whenever a task reports progress, and with
+    None once nothing is left running or queued.
+    """
+
+    def __init__(self, root, workers=2, poll_ms=50, on_progress=None):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.on_progress = on_progress
+        self.pending = []
+        self._tasks = queue.Queue()
+        self._events = queue.Queue()
+        self._polling = False
+        for _ in range(workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def submit(self, name, func, *args, on_done=None, on_error=None, on_cancelled=None):
+        """Queue ``func(*args)``; ``on_done(result)``, ``on_error(exception)`` or ``on_cancelled()`` follows"""
+        task = Task(name, func, args, on_done, on_error, on_cancelled)
+        task._events = self._events
+        self.pending.append(task)
+        self._tasks.put(task)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return task
+
+    def cancel_all(self):
+        """Cancel every queued and running task; safe to call from any thread"""
+        for task in list(self.pending):
+            task.cancel()
+
+    @property
+    def busy(self):
+        return bool(self.pending)
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task.cancelled:
+                self._events.put(('cancelled', task, None))
+                continue
+            _current.task = task
+            try:
+                result = task.func(*task.args)
+                if task.cancelled:
+                    self._events.put(('cancelled', task, None))
+                else:
+                    self._events.put(('done', task, result))
+            except TaskCancelled:
+                self._events.put(('cancelled', task, None))
+            except Exception as e:
+                self._events.put(('error', task, e))
+            finally:
+                _current.task = None
+
+    def _poll(self):
+        progressed = None
+        while True:
+            try:
+                kind, task, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                task.fraction, task.stage = payload
+                progressed = task
+                continue
+
+            self.pending.remove(task)
+            if kind == 'done' and task.on_done:
+                task.on_done(payload)
+            elif kind == 'error' and task.on_error:
+                task.on_error(payload)
+            elif kind == 'cancelled' and task.on_cancelled:
+                task.on_cancelled()
+            progressed = progressed or True
+
+        if self.on_progress and progressed is not None:
+            # Show the latest report, or whatever is still running once a task ends
+            if progressed is True or progressed not in self.pending:
+                progressed = self.pending[0] if self.pending else None
+            self.on_progress(progressed)
+
+        if self.pending:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
@@ -0,0 +1,173 @@
+"""draw_api against the local stand-in server (mock_draws_server) on an ephemeral port"""
+import json
+import threading
+from datetime import date
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+import draw_api
+from draw_api import iter_json_array, merge_delta, parse_api_draw, request_draws, stream_draws, sync_draws
+from draw_store import DrawStore
+from mock_draws_server import DrawsHandler, iter_history
+
+UNTIL = date(2008, 12, 31)
+
+
+@pytest.fixture
+def serve():
+    """start(**settings) runs a stand-in server with those DrawsHandler settings and returns its URL"""
+    servers = []
+
+    def start(**settings):
+        handler = type('Handler', (DrawsHandler,), dict({'until': UNTIL}, **settings))
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return 'http://127.0.0.1:{}/v1/draws'.format(server.server_address[1])
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def served_history(seed=0):
+    """The history the stand-in serves, as a store"""
+    return DrawStore.from_draws(parse_api_draw(record) for record in iter_history(UNTIL, seed))
+
+
+def assert_same_draws(store, expected):
+    assert np.array_equal(store.dates, expected.dates)
+    assert np.array_equal(store.mains, expected.mains)
+    assert np.array_equal(store.stars, expected.stars)
+
+
+def test_empty_store_downloads_full_history(serve):
+    url = serve()
+    result = sync_draws(DrawStore(), url)
+
+    assert result['mode'] == 'full'
+    assert result['added'] == len(served_history())
+    assert_same_draws(result['store'], served_history())
+
+
+def test_incremental_sync_appends_only_newer_draws(serve):
+    url = serve()
+    store = served_history().slice(0, -5)
+    result = sync_draws(store, url)
+
+    assert result['mode'] == 'incremental'
+    assert result['added'] == 5
+    assert result['store'] is store
+    assert_same_draws(store, served_history())
+
+
+def test_up_to_date_store_is_current(serve):
+    url = serve()
+    store = served_history()
+    result = sync_draws(store, url)
+
+    assert result['mode'] == 'current'
+    assert result['added'] == 0
+    assert_same_draws(store, served_history())
+
+
+def test_unchanged_delta_is_answered_with_304(serve):
+    url = serve()
+    store = served_history()
+    validators = sync_draws(store, url)['validators']
+    assert validators['etag'] and validators['last_modified']
+
+    progress = []
+    result = sync_draws(store, url, progress=lambda *counts: progress.append(counts), validators=validators)
+
+    assert result['mode'] == 'current'
+    assert result['added'] == 0
+    assert result['validators'] == validators
+    # Nothing was streamed or parsed
+    assert progress == []
+
+
+def test_last_modified_alone_makes_the_request_conditional(serve):
+    url = serve()
+    store = served_history()
+    validators = dict(sync_draws(store, url)['validators'], etag=None)
+
+    response, returned = request_draws(url, since=date.fromordinal(int(store.dates[-1]) + 1),
+                                       validators=validators)
+    assert response is None
+    assert returned == validators
+
+
+def test_validators_of_another_url_are_not_sent(serve):
+    url = serve()
+    store = served_history()
+    validators = dict(sync_draws(store, url)['validators'], url=url + '?date_from=2004-01-01')
+
+    response, returned = request_draws(url, since=date.fromordinal(int(store.dates[-1]) + 1),
+                                       validators=validators)
+    assert response is not None
+    assert list(stream_draws(response)) == []
+    assert returned['url'] != validators['url']
+
+
+def test_server_ignoring_the_filter_still_syncs_incrementally(serve):
+    url = serve(ignore_filter=True)
+    store = served_history().slice(0, -5)
+    result = sync_draws(store, url)
+
+    assert result['mode'] == 'incremental'
+    assert result['added'] == 5
+    assert_same_draws(store, served_history())
+
+
+def test_mismatched_history_falls_back_to_full_refresh(serve, capsys):
+    # A server that sends everything back, with different results for the cached dates
+    url = serve(ignore_filter=True)
+    store = served_history(seed=1).slice(0, -5)
+    result = sync_draws(store, url)
+
+    assert result['mode'] == 'full'
+    assert result['store'] is not store
+    assert_same_draws(result['store'], served_history())
+    assert "refreshing full history" in capsys.readouterr().out
+
+
+def test_gap_after_the_cache_does_not_line_up():
+    history = served_history()
+    store = history.slice(0, -5)
+    # The delta skips the four draws after the store's last one
+    delta = history.dates[-1:], history.mains[-1:], history.stars[-1:]
+    assert delta[0][0] - store.dates[-1] > draw_api.MAX_DRAW_GAP_DAYS
+    assert merge_delta(store, delta) is None
+
+    delta = history.dates[-5:], history.mains[-5:], history.stars[-5:]
+    assert np.array_equal(merge_delta(store, delta)[0], history.dates[-5:])
+
+
+def test_gzip_chunked_response_is_decoded_while_streaming(serve, monkeypatch):
+    url = serve()
+    # Tiny reads split the gzip stream and the JSON elements at arbitrary points
+    monkeypatch.setattr(draw_api, 'CHUNK_SIZE', 7)
+    response, _ = request_draws(url)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Transfer-Encoding'] == 'chunked'
+
+    progress = []
+    draws = list(stream_draws(response, progress=lambda *counts: progress.append(counts)))
+
+    assert_same_draws(DrawStore.from_draws(draws), served_history())
+    assert progress[-1][1] == len(draws)
+    assert len(progress) > 100
+
+
+def test_json_array_split_at_every_byte():
+    records = list(iter_history(date(2004, 3, 31)))
+    body = json.dumps(records).encode('utf-8')
+    chunks = [body[i:i + 1] for i in range(len(body))]
+
+    assert list(iter_json_array(chunks)) == records
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunks[:-1]))
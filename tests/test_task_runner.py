@@ -0,0 +1,149 @@
+"""TaskRunner driven by a stand-in for the Tk root, polled from the test thread"""
+import threading
+import time
+
+import pytest
+
+from task_runner import TaskRunner, checkpoint
+
+TIMEOUT = 5
+
+
+class FakeRoot:
+    """Collects after() callbacks so the test can run them, like Tk's event loop would"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def run_once(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def run_until(self, condition):
+        deadline = time.monotonic() + TIMEOUT
+        while not condition():
+            assert time.monotonic() < deadline, "timed out waiting for the runner"
+            time.sleep(0.01)
+            self.run_once()
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def runner(root, events):
+    main_thread = threading.get_ident()
+
+    def on_progress(task):
+        assert threading.get_ident() == main_thread
+        events.append(('progress', task.stage if task else None))
+
+    return TaskRunner(root, workers=1, on_progress=on_progress)
+
+
+def submit(runner, events, func):
+    main_thread = threading.get_ident()
+
+    def record(kind):
+        def callback(*payload):
+            assert threading.get_ident() == main_thread
+            events.append((kind,) + payload)
+        return callback
+
+    return runner.submit('job', func, on_done=record('done'), on_error=record('error'),
+                         on_cancelled=record('cancelled'))
+
+
+def test_cancelled_task_stops_at_its_next_checkpoint(root, runner, events):
+    started = threading.Event()
+    resume = threading.Event()
+    reached = []
+
+    def job():
+        checkpoint(0.1, "first half")
+        started.set()
+        resume.wait(TIMEOUT)
+        checkpoint(0.5, "second half")
+        reached.append("second half")
+        return 42
+
+    task = submit(runner, events, job)
+    assert started.wait(TIMEOUT)
+    root.run_until(lambda: events)
+    assert events == [('progress', "first half")]
+
+    task.cancel()
+    resume.set()
+    root.run_until(lambda: not runner.busy)
+
+    assert events == [('progress', "first half"), ('cancelled',), ('progress', None)]
+    assert reached == []
+    # Polling stops with nothing left, and nothing arrives later
+    root.run_once()
+    time.sleep(0.05)
+    root.run_once()
+    assert not root.callbacks
+    assert len(events) == 3
+
+
+def test_result_of_a_task_cancelled_after_its_last_checkpoint_is_dropped(root, runner, events):
+    finishing = threading.Event()
+    resume = threading.Event()
+
+    def job():
+        checkpoint(0.9, "last step")
+        finishing.set()
+        resume.wait(TIMEOUT)
+        return 42
+
+    task = submit(runner, events, job)
+    assert finishing.wait(TIMEOUT)
+    task.cancel()
+    resume.set()
+    root.run_until(lambda: not runner.busy)
+
+    assert ('cancelled',) in events
+    assert not [event for event in events if event[0] == 'done']
+
+
+def test_queued_task_cancelled_before_it_starts_never_runs(root, runner, events):
+    resume = threading.Event()
+    ran = []
+
+    first = submit(runner, events, lambda: resume.wait(TIMEOUT) and 'first')
+    second = submit(runner, events, lambda: ran.append('second'))
+    second.cancel()
+    resume.set()
+    root.run_until(lambda: not runner.busy)
+
+    assert ran == []
+    assert ('done', 'first') in events
+    assert ('cancelled',) in events
+    assert not first.cancelled
+
+
+def test_errors_are_delivered_on_the_polling_thread(root, runner, events):
+    def job():
+        raise ValueError("bad input")
+
+    submit(runner, events, job)
+    root.run_until(lambda: not runner.busy)
+
+    kinds = [event[0] for event in events]
+    assert kinds == ['error', 'progress']
+    assert isinstance(events[0][1], ValueError)
+
+
+def test_checkpoint_outside_a_task_does_nothing():
+    checkpoint(0.5, "headless")
@@ -0,0 +1,240 @@
+"""Check large ticket files against the draw history without the GUI.
+
+Tickets are read from CSV (five main numbers then two lucky stars per row,
+optionally preceded by a ticket id) or NDJSON (one {"id", "main_numbers",
+"lucky_stars"} object per line). They are matched against every draw, or
+the draws in a date range, a batch at a time, and each ticket's prize tier
+counts and best win are written out as soon as its batch is checked.
+
+    python ticket_checker.py tickets.csv --output results.csv --from 2016-01-01
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import date
+from itertools import islice
+
+import numpy as np
+
+from analysis_core import load_store
+from draw_store import MAIN_COUNT, STAR_COUNT, MAIN_MAX, STAR_MAX
+from match_kernel import PRIZE_NAMES
+
+# Ticket-by-draw cells matched at once; bounds the memory of one batch
+BATCH_CELLS = 1 << 23
+# Invalid tickets listed individually; the rest are only counted
+REPORTED_ERRORS = 20
+
+
+def file_format(path, default='csv'):
+    """'ndjson' for .ndjson/.jsonl paths, 'csv' for .csv, ``default`` otherwise"""
+    if path.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if path.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def read_csv_tickets(f):
+    """Yield (line number, id, mains, stars) per CSV row; mains is None for unreadable rows"""
+    for line_number, row in enumerate(csv.reader(f), 1):
+        if len(row) == MAIN_COUNT + STAR_COUNT + 1:
+            ticket_id, row = row[0].strip(), row[1:]
+        else:
+            ticket_id = str(line_number)
+        try:
+            numbers = [int(field) for field in row]
+        except ValueError:
+            # Blank cells, or a header row
+            fields = [field for field in row if field.strip()]
+            if not fields or line_number == 1:
+                continue
+            try:
+                numbers = [int(field) for field in fields]
+            except ValueError:
+                yield line_number, ticket_id, None, None
+                continue
+        if not numbers:
+            continue
+        yield line_number, ticket_id, numbers[:MAIN_COUNT], numbers[MAIN_COUNT:]
+
+
+def read_ndjson_tickets(f):
+    """Yield (line number, id, mains, stars) per NDJSON line; mains is None for unreadable lines"""
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            yield (line_number, str(record.get('id', line_number)),
+                   [int(num) for num in record['main_numbers']], [int(star) for star in record['lucky_stars']])
+        except (ValueError, KeyError, TypeError, AttributeError, OverflowError):
+            yield line_number, str(line_number), None, None
+
+
+def ticket_error(mains, stars):
+    """Why a ticket can't be checked, or None if it is valid"""
+    if mains is None:
+        return "unreadable ticket"
+    if len(mains) != MAIN_COUNT or len(set(mains)) != MAIN_COUNT:
+        return "expected {} distinct main numbers".format(MAIN_COUNT)
+    if len(stars) != STAR_COUNT or len(set(stars)) != STAR_COUNT:
+        return "expected {} distinct lucky stars".format(STAR_COUNT)
+    if not all(1 <= num <= MAIN_MAX for num in mains):
+        return "main numbers must be between 1 and {}".format(MAIN_MAX)
+    if not all(1 <= star <= STAR_MAX for star in stars):
+        return "lucky stars must be between 1 and {}".format(STAR_MAX)
+    return None
+
+
+def valid_rows(mains, stars):
+    """Which rows of (n, 5) main and (n, 2) star arrays are valid tickets"""
+    sorted_mains = np.sort(mains, axis=1)
+    sorted_stars = np.sort(stars, axis=1)
+    return ((sorted_mains[:, 0] >= 1) & (sorted_mains[:, -1] <= MAIN_MAX) &
+            (sorted_stars[:, 0] >= 1) & (sorted_stars[:, -1] <= STAR_MAX) &
+            (np.diff(sorted_mains, axis=1) > 0).all(axis=1) & (np.diff(sorted_stars, axis=1) > 0).all(axis=1))
+
+
+def in_range(mains, stars):
+    """Whether every number of a ticket is within the main number and lucky star ranges"""
+    return all(1 <= num <= MAIN_MAX for num in mains) and all(1 <= star <= STAR_MAX for star in stars)
+
+
+def check_batches(kernel, tickets, batch_size, on_error=None):
+    """Yield (ids, mains, stars, tier counts) for each batch of valid tickets.
+
+    Invalid tickets are skipped, and ``on_error(line number, message)`` is
+    called for each one when given.
+    """
+    tickets = iter(tickets)
+    while True:
+        batch = list(islice(tickets, batch_size))
+        if not batch:
+            return
+
+        # Rows of the right shape are range- and duplicate-checked together
+        shaped = [ticket for ticket in batch if ticket[2] is not None and
+                  len(ticket[2]) == MAIN_COUNT and len(ticket[3]) == STAR_COUNT]
+        try:
+            mains = np.array([ticket[2] for ticket in shaped], dtype=np.int64).reshape(-1, MAIN_COUNT)
+            stars = np.array([ticket[3] for ticket in shaped], dtype=np.int64).reshape(-1, STAR_COUNT)
+        except OverflowError:
+            # Some number doesn't even fit in 64 bits; drop out-of-range rows one by one
+            shaped = [ticket for ticket in shaped if in_range(ticket[2], ticket[3])]
+            mains = np.array([ticket[2] for ticket in shaped], dtype=np.int64).reshape(-1, MAIN_COUNT)
+            stars = np.array([ticket[3] for ticket in shaped], dtype=np.int64).reshape(-1, STAR_COUNT)
+        valid = valid_rows(mains, stars)
+
+        if on_error is not None and (len(shaped) < len(batch) or not valid.all()):
+            valid_lines = {ticket[0] for ticket, ok in zip(shaped, valid.tolist()) if ok}
+            for line_number, ticket_id, ticket_mains, ticket_stars in batch:
+                if line_number not in valid_lines:
+                    on_error(line_number, ticket_error(ticket_mains, ticket_stars))
+
+        if valid.any():
+            ids = [ticket[1] for ticket, ok in zip(shaped, valid.tolist()) if ok]
+            mains, stars = mains[valid].astype(np.uint8), stars[valid].astype(np.uint8)
+            yield ids, mains, stars, kernel.tier_histograms(mains, stars)
+
+
+def best_prizes(tiers):
+    """Name of the best tier each ticket won, '' where nothing was won"""
+    won = tiers > 0
+    best = np.argmax(won, axis=1).tolist()
+    return [PRIZE_NAMES[tier] if any_won else '' for tier, any_won in zip(best, won.any(axis=1).tolist())]
+
+
+def write_csv_results(writer, ids, mains, stars, tiers):
+    rows = zip(ids, mains.tolist(), stars.tolist(), tiers.sum(axis=1).tolist(), best_prizes(tiers), tiers.tolist())
+    writer.writerows([ticket_id, ' '.join(map(str, ticket_mains)), ' '.join(map(str, ticket_stars)), wins, best]
+                     + tier_counts for ticket_id, ticket_mains, ticket_stars, wins, best, tier_counts in rows)
+
+
+def write_ndjson_results(f, ids, mains, stars, tiers):
+    rows = zip(ids, mains.tolist(), stars.tolist(), tiers.sum(axis=1).tolist(), best_prizes(tiers), tiers.tolist())
+    for ticket_id, ticket_mains, ticket_stars, wins, best, tier_counts in rows:
+        f.write(json.dumps({
+            'id': ticket_id,
+            'main_numbers': ticket_mains,
+            'lucky_stars': ticket_stars,
+            'wins': wins,
+            'best_prize': best or None,
+            'tier_counts': tier_counts
+        }) + '\n')
+
+
+def draws_between(store, start=None, end=None):
+    """Store viewing the draws from ``start`` to ``end`` (dates, both inclusive)"""
+    first = 0 if start is None else int(np.searchsorted(store.dates, start.toordinal()))
+    last = len(store) if end is None else int(np.searchsorted(store.dates, end.toordinal(), side='right'))
+    return store.slice(first, last)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('tickets', help="CSV or NDJSON ticket file, - for stdin")
+    parser.add_argument('--output', default='-', help="results file, - for stdout (the default)")
+    parser.add_argument('--format', choices=('csv', 'ndjson'), help="ticket file format (default: from extension)")
+    parser.add_argument('--output-format', choices=('csv', 'ndjson'),
+                        help="results format (default: from extension, else the ticket format)")
+    parser.add_argument('--cache', default="euromillions_data_cache.bin",
+                        help="binary draw cache, or a .sqlite3 database, written by the analyser")
+    parser.add_argument('--from', dest='start', type=date.fromisoformat, help="first draw date (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='end', type=date.fromisoformat, help="last draw date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    store = draws_between(load_store(args.cache), args.start, args.end)
+    if not len(store):
+        parser.error("no draws to check against in {}".format(args.cache))
+
+    input_format = args.format or file_format(args.tickets)
+    output_format = args.output_format or file_format(args.output, input_format)
+    source = sys.stdin if args.tickets == '-' else open(args.tickets, newline='')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+
+    started = time.perf_counter()
+    errors = []
+    invalid = 0
+    checked = 0
+
+    def skip(line_number, error):
+        nonlocal invalid
+        invalid += 1
+        if len(errors) < REPORTED_ERRORS:
+            errors.append((line_number, error))
+
+    try:
+        tickets = read_ndjson_tickets(source) if input_format == 'ndjson' else read_csv_tickets(source)
+        if output_format == 'csv':
+            writer = csv.writer(target)
+            writer.writerow(['id', 'main_numbers', 'lucky_stars', 'wins', 'best_prize'] + list(PRIZE_NAMES))
+
+        batch_size = max(1, BATCH_CELLS // len(store))
+        for ids, mains, stars, tiers in check_batches(store.match_kernel(), tickets, batch_size, skip):
+            if output_format == 'csv':
+                write_csv_results(writer, ids, mains, stars, tiers)
+            else:
+                write_ndjson_results(target, ids, mains, stars, tiers)
+            target.flush()
+            checked += len(ids)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    elapsed = time.perf_counter() - started
+    for line_number, error in errors:
+        print("Skipped line {}: {}".format(line_number, error), file=sys.stderr)
+    if invalid > len(errors):
+        print("... and {} more invalid tickets".format(invalid - len(errors)), file=sys.stderr)
+    print("Checked {:,} tickets against {} draws ({} to {}) in {:.1f} s, {:.2f} million tickets per minute".format(
+        checked, len(store), store.first_date().strftime('%Y-%m-%d'), store.last_date().strftime('%Y-%m-%d'),
+        elapsed, checked / elapsed * 60 / 1e6 if elapsed else 0), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
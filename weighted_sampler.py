@@ -0,0 +1,48 @@
+"""Weighted sampling of tickets without replacement.
+
+Numbers are drawn as if one at a time, each with probability proportional
+to its weight among those not drawn yet. Instead of renormalising after
+every pick, each ball gets the key E / weight, with E a standard
+exponential draw, and the ``picked`` smallest keys win: taken in order,
+they follow exactly that one-at-a-time distribution (the Gumbel-top-k
+trick on the exponential scale). A batch of tickets is then one array of
+random keys and one partial sort per row.
+"""
+import heapq
+
+import numpy as np
+
+
+class WeightedSampler:
+    """Draws ``picked`` distinct numbers from 1 to len(weights) by weight, without replacement.
+
+    ``weights`` holds one non-negative weight per ball, ball 1 first: counts,
+    decayed counts, scores or anything else. Balls of weight 0 are never
+    drawn.
+    """
+
+    def __init__(self, weights, picked):
+        weights = np.asarray(weights, dtype=np.float64).ravel()
+        if not np.isfinite(weights).all() or (weights < 0).any():
+            raise ValueError("weights must be finite and non-negative")
+        self.picked = picked
+        self.balls = np.flatnonzero(weights) + 1
+        if len(self.balls) < picked:
+            raise ValueError("{} numbers needed, but only {} have a positive weight".format(picked, len(self.balls)))
+        self._scales = 1 / weights[self.balls - 1]
+        self._ball_list = self.balls.tolist()
+        self._scale_list = self._scales.tolist()
+
+    def draw(self, rng):
+        """One ticket as a sorted list, using ``rng`` (the random module or a random.Random)"""
+        keys = [rng.expovariate(1.0) * scale for scale in self._scale_list]
+        return sorted(ball for key, ball in heapq.nsmallest(self.picked, zip(keys, self._ball_list)))
+
+    def sample(self, rng, rows):
+        """(rows, picked) sorted tickets, using numpy Generator ``rng``"""
+        keys = rng.standard_exponential((rows, len(self.balls))) * self._scales
+        if self.picked < len(self.balls):
+            chosen = np.argpartition(keys, self.picked - 1, axis=1)[:, :self.picked]
+        else:
+            chosen = np.broadcast_to(np.arange(len(self.balls)), (rows, self.picked))
+        return np.sort(self.balls[chosen], axis=1)